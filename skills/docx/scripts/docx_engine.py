@@ -4,21 +4,133 @@ DOCX Engine - Core utilities for Word document manipulation
 Provides safe loading, saving, reading, editing, and creating Word documents
 """
 
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+import copy
+import gc
+import glob
+import io
 import json
+import os
+import posixpath
+import re
+import struct
 import sys
 import argparse
+import tempfile
+import weakref
+import zipfile
+import zlib
+from collections import OrderedDict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_document_safe(path):
+
+# python-docx and lxml are imported where they are used, so that --help and
+# argument errors don't pay for them
+
+# Clark-notation tag names (what docx.oxml.ns.qn returns), spelled out once
+# for direct lxml iteration. Descendant lookups use elem.iter(tag) with these
+# rather than './/' path strings, which go through ElementPath on every call
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W_NS + 'body'
+_W_P = _W_NS + 'p'
+_W_R = _W_NS + 'r'
+_W_T = _W_NS + 't'
+_W_BR = _W_NS + 'br'
+_W_TYPE = _W_NS + 'type'
+_W_HYPERLINK = _W_NS + 'hyperlink'
+_W_TBL = _W_NS + 'tbl'
+_W_TR = _W_NS + 'tr'
+_W_TC = _W_NS + 'tc'
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+_W_PPR = _W_NS + 'pPr'
+_W_RPR = _W_NS + 'rPr'
+_W_VAL = _W_NS + 'val'
+_W_PSTYLE = _W_NS + 'pStyle'
+_W_STYLE = _W_NS + 'style'
+_W_STYLE_ID = _W_NS + 'styleId'
+_W_NAME = _W_NS + 'name'
+_W_DEFAULT = _W_NS + 'default'
+_W_TBLGRID = _W_NS + 'tblGrid'
+_W_GRIDCOL = _W_NS + 'gridCol'
+_W_TRPR = _W_NS + 'trPr'
+_W_GRIDBEFORE = _W_NS + 'gridBefore'
+_W_TCPR = _W_NS + 'tcPr'
+_W_GRIDSPAN = _W_NS + 'gridSpan'
+_W_VMERGE = _W_NS + 'vMerge'
+
+# ST_OnOff spellings of "true"
+_ON_VALUES = frozenset(["1", "true", "on"])
+
+# Characters a <w:t> can't hold; text containing them goes through CT_R.text
+_CONTROL_CHARS = frozenset("\t\n\r")
+
+# Text equivalents of non-<w:t> run content, as in python-docx's CT_R.text
+_RUN_SPECIAL_TEXT = {
+    _W_NS + 'tab': "\t",
+    _W_NS + 'ptab': "\t",
+    _W_NS + 'cr': "\n",
+    _W_NS + 'noBreakHyphen': "-",
+}
+
+
+def _dumps(obj, indent=True):
+    """
+    Serialize a result as a newline-terminated line of JSON bytes
+    
+    Uses orjson when it is installed, letting it append the newline so a
+    large result isn't copied again. The stdlib fallback writes the same
+    bytes: raw UTF-8 and, unindented, orjson's compact separators.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # Type orjson can't handle, use the stdlib encoder
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    return (text + '\n').encode('utf-8')
+
+
+def _emit(obj, indent=True):
+    """Write a result to stdout as JSON; indent=False writes a single NDJSON line"""
+    sys.stdout.buffer.write(_dumps(obj, indent))
+
+
+# Parsed documents for read-only callers, keyed by (resolved path, mtime_ns, size)
+_DOCUMENT_CACHE = OrderedDict()
+_DOCUMENT_CACHE_SIZE = 8
+
+
+# Where each loaded package came from: package -> (path, mtime_ns, size).
+# Keyed by the OpcPackage because Document proxies aren't hashable.
+_DOCUMENT_SOURCES = weakref.WeakKeyDictionary()
+
+
+def _invalidate_document_cache(path):
+    """Drop every cached Document for the given path"""
+    resolved = str(Path(path).resolve())
+    for key in [k for k in _DOCUMENT_CACHE if k[0] == resolved]:
+        del _DOCUMENT_CACHE[key]
+
+
+def load_document_safe(path, use_cache=False):
     """
     Safely load a Word document with error handling
     
     Args:
         path: Path to the .docx file
+        use_cache: Reuse a previously parsed Document if the file is unchanged.
+            Only read-only callers should set this, since the cached object is shared.
         
     Returns:
         docx Document object
@@ -32,17 +144,147 @@ def load_document_safe(path):
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
+    cache_key = None
+    if use_cache:
+        stat = path.stat()
+        cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        doc = _DOCUMENT_CACHE.get(cache_key)
+        if doc is not None:
+            _DOCUMENT_CACHE.move_to_end(cache_key)
+            return doc
+    
+    from docx import Document
+    
     try:
         doc = Document(str(path))
-        return doc
     except Exception as e:
         raise Exception(f"Error loading document: {e}") from e
+    
+    stat = path.stat()
+    _DOCUMENT_SOURCES[doc.part.package] = (str(path), stat.st_mtime_ns, stat.st_size)
+    
+    if cache_key is not None:
+        _invalidate_document_cache(path)
+        _DOCUMENT_CACHE[cache_key] = doc
+        if len(_DOCUMENT_CACHE) > _DOCUMENT_CACHE_SIZE:
+            _DOCUMENT_CACHE.popitem(last=False)
+    
+    return doc
+
+
+class _PatchingZipWriter:
+    """
+    PhysPkgWriter stand-in that reuses unchanged members of a source .docx
+    
+    A member whose new bytes have the same size and CRC as the entry of
+    that name in the source zip has its already-compressed data copied
+    across as-is; everything else is deflated as python-docx would.
+    """
+    
+    def __init__(self, source, dest):
+        self._source = zipfile.ZipFile(source)
+        self._raw = open(source, 'rb')
+        self._zipf = zipfile.ZipFile(dest, 'w', compression=zipfile.ZIP_DEFLATED)
+    
+    def write(self, pack_uri, blob):
+        name = pack_uri.membername
+        try:
+            info = self._source.getinfo(name)
+        except KeyError:
+            info = None
+        if (info is not None and not info.flag_bits & 0x1
+                and info.file_size == len(blob) and info.CRC == zlib.crc32(blob)):
+            self._copy_raw(info)
+        else:
+            self._zipf.writestr(name, blob)
+    
+    def _copy_raw(self, info):
+        """Append a source entry's compressed data without recompressing it"""
+        # Local header: 30 fixed bytes, then file name and extra field
+        self._raw.seek(info.header_offset)
+        header = self._raw.read(30)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        self._raw.seek(info.header_offset + 30 + name_length + extra_length)
+        data = self._raw.read(info.compress_size)
+        
+        zipf = self._zipf
+        new_info = zipfile.ZipInfo(info.filename, info.date_time)
+        new_info.compress_type = info.compress_type
+        new_info.flag_bits = info.flag_bits & 0x800  # Keep only the UTF-8 name flag
+        new_info.external_attr = info.external_attr
+        new_info.CRC = info.CRC
+        new_info.compress_size = info.compress_size
+        new_info.file_size = info.file_size
+        new_info.header_offset = zipf.fp.tell()
+        zipf.fp.write(new_info.FileHeader())
+        zipf.fp.write(data)
+        zipf.filelist.append(new_info)
+        zipf.NameToInfo[new_info.filename] = new_info
+        zipf.start_dir = zipf.fp.tell()
+    
+    def close(self):
+        self._zipf.close()
+        self._raw.close()
+        self._source.close()
+
+
+# The process umask, read once at import: os.umask can only be read by
+# setting it, which isn't safe once _map_files saves from worker threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _save_patched(doc, source, path):
+    """
+    Save a document, copying members that are unchanged since it was loaded
+    
+    Mirrors PackageWriter.write, but through _PatchingZipWriter, and writes
+    to a temporary file that then replaces path, since path may be the
+    source being read.
+    
+    Args:
+        doc: docx Document object
+        source: Path of the .docx the document was loaded from
+        path: Destination path
+    """
+    from docx.opc.pkgwriter import PackageWriter
+    
+    package = doc.part.package
+    for part in package.parts:
+        part.before_marshal()
+    parts = package.parts
+    
+    path = path.resolve()  # Replace a symlink's target, not the link
+    if path.exists():
+        mode = path.stat().st_mode & 0o7777
+    else:
+        mode = 0o666 & ~_UMASK
+    
+    fd, tmp_path = tempfile.mkstemp(suffix='.docx', dir=str(path.parent))
+    os.close(fd)
+    try:
+        os.chmod(tmp_path, mode)
+        writer = _PatchingZipWriter(source, tmp_path)
+        try:
+            PackageWriter._write_content_types_stream(writer, parts)
+            PackageWriter._write_pkg_rels(writer, package.rels)
+            PackageWriter._write_parts(writer, parts)
+        finally:
+            writer.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def save_document_safe(doc, path):
     """
     Safely save a Word document with error handling
     
+    When the file the document was loaded from is unchanged on disk, members
+    that weren't modified (typically images and other media) are copied
+    from it without being recompressed.
+    
     Args:
         doc: docx Document object
         path: Path to save the .docx file
@@ -53,15 +295,395 @@ def save_document_safe(doc, path):
     try:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(str(path))
+        _invalidate_document_cache(path)
+        
+        package = doc.part.package
+        source = _DOCUMENT_SOURCES.get(package)
+        saved = False
+        if source is not None:
+            source_path, mtime_ns, size = source
+            try:
+                stat = os.stat(source_path)
+                if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                    _save_patched(doc, source_path, path)
+                    saved = True
+            except Exception:
+                pass  # Fall back to python-docx's own writer
+        if not saved:
+            doc.save(str(path))
+        
+        stat = path.stat()
+        _DOCUMENT_SOURCES[package] = (str(path), stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         raise Exception(f"Error saving document: {e}") from e
 
 
+def _apply_and_save(path, operation, *args, dry_run=False):
+    """
+    Load a document, apply an in-memory operation and save it if anything changed
+    
+    Args:
+        path: Path to the .docx file
+        operation: Callable taking (doc, *args) and returning a result dict.
+            A result with "changed": False means the document was left untouched.
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: The operation's result
+    """
+    doc = load_document_safe(path)
+    result = operation(doc, *args)
+    
+    if dry_run:
+        result["dry_run"] = True
+    elif result.get("changed", True):
+        save_document_safe(doc, path)
+    
+    return result
+
+
+def _cell_text(cell):
+    """
+    Get a table cell's text straight from its <w:tc> element
+    
+    Equivalent to cell.text, but reads each <w:p> through the oxml layer
+    instead of building Paragraph wrappers for every cell.
+    """
+    return "\n".join(p.text for p in cell._tc.iterchildren(_W_P))
+
+
+def _paragraph_segments(p):
+    """
+    Split a <w:p> element's text into segments, in document order
+    
+    Covers the same content as CT_P.text: runs directly in the paragraph
+    and runs inside hyperlinks. Each <w:t> becomes a (node, text) segment;
+    tabs, line breaks and similar run content become (None, text) segments
+    with their CT_R.text equivalent. Works on plain lxml elements too.
+    
+    Args:
+        p: <w:p> lxml element
+        
+    Returns:
+        list: (w:t element or None, text) tuples
+    """
+    segments = []
+    for child in p:
+        if child.tag == _W_R:
+            runs = (child,)
+        elif child.tag == _W_HYPERLINK:
+            runs = child.iterchildren(_W_R)
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                tag = item.tag
+                if tag == _W_T:
+                    segments.append((item, item.text or ""))
+                elif tag == _W_BR:
+                    # Page and column breaks have no text equivalent
+                    if item.get(_W_TYPE, "textWrapping") == "textWrapping":
+                        segments.append((None, "\n"))
+                elif tag in _RUN_SPECIAL_TEXT:
+                    segments.append((None, _RUN_SPECIAL_TEXT[tag]))
+    return segments
+
+
+def _paragraph_text(p):
+    """
+    Text of a <w:p> element, equal to CT_P.text but usable on plain lxml elements
+    
+    The same walk as _paragraph_segments, collecting strings only; skipping
+    the (node, text) tuples makes it about a third faster, which matters for
+    read and word counting over every paragraph.
+    """
+    parts = []
+    for child in p:
+        if child.tag == _W_R:
+            runs = (child,)
+        elif child.tag == _W_HYPERLINK:
+            runs = child.iterchildren(_W_R)
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                tag = item.tag
+                if tag == _W_T:
+                    parts.append(item.text or "")
+                elif tag == _W_BR:
+                    if item.get(_W_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif tag in _RUN_SPECIAL_TEXT:
+                    parts.append(_RUN_SPECIAL_TEXT[tag])
+    return "".join(parts)
+
+
+def _set_t_text(t, text):
+    """Set a <w:t> element's text, preserving leading/trailing spaces"""
+    t.text = text
+    if text != text.strip():
+        t.set(_XML_SPACE, "preserve")
+
+
+def _set_tc_text(tc, text):
+    """
+    Set a <w:tc> element's text by editing or adding a single <w:t>
+    
+    Handles a cell holding one paragraph whose text comes from a single
+    <w:t> (only the text node changes, keeping run and paragraph
+    formatting) and a cell holding one paragraph with no content yet, such
+    as a freshly created table cell (one run is appended).
+    
+    Args:
+        tc: <w:tc> lxml element
+        text: New cell text
+        
+    Returns:
+        bool: False if the cell or text needs the python-docx cell.text setter
+    """
+    from lxml import etree
+    
+    if not _CONTROL_CHARS.isdisjoint(text):
+        return False
+    paragraphs = tc.findall(_W_P)
+    if len(paragraphs) != 1:
+        return False
+    p = paragraphs[0]
+    text_nodes = list(tc.iter(_W_T))
+    
+    if len(text_nodes) == 1 and _paragraph_text(p) == (text_nodes[0].text or ""):
+        _set_t_text(text_nodes[0], text)
+        return True
+    
+    if (not text_nodes and all(child.tag == _W_PPR for child in p)
+            and all(child.tag in (_W_TCPR, _W_P) for child in tc)):
+        if text:
+            _set_t_text(etree.SubElement(etree.SubElement(p, _W_R), _W_T), text)
+        return True
+    
+    return False
+
+
+def _set_cell_text(cell, text):
+    """
+    Set a table cell's text, editing the cell's XML directly when possible
+    
+    Simple cells go through _set_tc_text, keeping their paragraph and run
+    formatting. Anything more complex goes through the cell.text setter.
+    """
+    if not _set_tc_text(cell._tc, text):
+        cell.text = text
+
+
+def _package_targets(package):
+    """Map package-level relationship types to part names in an open .docx zip"""
+    from lxml import etree
+    
+    package_rels = etree.fromstring(package.read('_rels/.rels'))
+    return {rel.get('Type'): rel.get('Target').lstrip('/') for rel in package_rels}
+
+
+def _part_targets(package, part_name):
+    """Map a part's relationship types to the part names they point at"""
+    from lxml import etree
+    
+    base, name = posixpath.split(part_name)
+    rels = etree.fromstring(package.read(posixpath.join(base, '_rels', name + '.rels')))
+    targets = {}
+    for rel in rels:
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target')
+        if target.startswith('/'):
+            targets[rel.get('Type')] = target.lstrip('/')
+        else:
+            targets[rel.get('Type')] = posixpath.normpath(posixpath.join(base, target))
+    return targets
+
+
+def _paragraph_style_names(package, document_part):
+    """
+    Resolve paragraph style ids to UI names the way python-docx does
+    
+    Args:
+        package: Open zipfile.ZipFile of the .docx
+        document_part: Part name of the main document
+        
+    Returns:
+        tuple: (dict of styleId -> name for paragraph styles, default paragraph style name)
+        
+    Raises:
+        KeyError: If the document has no styles part
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from docx.styles import BabelFish
+    from lxml import etree
+    
+    styles = etree.fromstring(package.read(_part_targets(package, document_part)[RT.STYLES]))
+    names = {}
+    default_name = None
+    for style in styles.iterchildren(_W_STYLE):
+        if style.get(_W_TYPE, 'paragraph') != 'paragraph':
+            continue
+        name_el = style.find(_W_NAME)
+        name = None
+        if name_el is not None and name_el.get(_W_VAL) is not None:
+            name = BabelFish.internal2ui(name_el.get(_W_VAL))
+        names[style.get(_W_STYLE_ID)] = name
+        # The spec calls for the last default in document order
+        if style.get(_W_DEFAULT) in _ON_VALUES:
+            default_name = name
+    return names, default_name
+
+
+def _iter_body_elements(package, document_part):
+    """
+    Stream the top-level paragraphs and tables of the main document part
+    
+    Each element is complete when yielded and is cleared, along with the
+    body children before it, once the caller moves on, so memory stays
+    flat however long the document is.
+    
+    Args:
+        package: Open zipfile.ZipFile of the .docx
+        document_part: Part name of the main document
+        
+    Yields:
+        lxml element: <w:p> or <w:tbl> children of <w:body>, in order
+    """
+    from lxml import etree
+    
+    with package.open(document_part) as document_xml:
+        for _, element in etree.iterparse(document_xml, tag=(_W_P, _W_TBL)):
+            body = element.getparent()
+            if body.tag != _W_BODY:
+                continue  # Paragraph inside a table or other container
+            yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del body[0]
+
+
+def _paragraph_element_info(p, style_names, default_style):
+    """Text and style name of a <w:p> element, matching Paragraph.text and .style.name"""
+    style_id = None
+    ppr = p.find(_W_PPR)
+    if ppr is not None:
+        pstyle = ppr.find(_W_PSTYLE)
+        if pstyle is not None:
+            style_id = pstyle.get(_W_VAL)
+    return (
+        _paragraph_text(p),
+        style_names.get(style_id, default_style) if style_id is not None else default_style
+    )
+
+
+def _table_element_rows(tbl):
+    """
+    Extract a <w:tbl> element's cell text the way _Row.cells lays it out
+    
+    A cell spanning several grid columns is repeated once per column, and a
+    vertically merged continuation cell repeats the text of the cell above.
+    
+    Args:
+        tbl: <w:tbl> lxml element
+        
+    Returns:
+        list: Rows of cell strings
+    """
+    rows = []
+    above = {}
+    for tr in tbl.iterchildren(_W_TR):
+        offset = 0
+        trpr = tr.find(_W_TRPR)
+        if trpr is not None:
+            grid_before = trpr.find(_W_GRIDBEFORE)
+            if grid_before is not None:
+                offset = int(grid_before.get(_W_VAL, 0))
+        
+        row = []
+        current = {}
+        for tc in tr.iterchildren(_W_TC):
+            span = 1
+            merge = None
+            tcpr = tc.find(_W_TCPR)
+            if tcpr is not None:
+                grid_span = tcpr.find(_W_GRIDSPAN)
+                if grid_span is not None:
+                    span = int(grid_span.get(_W_VAL, 1))
+                v_merge = tcpr.find(_W_VMERGE)
+                if v_merge is not None:
+                    merge = v_merge.get(_W_VAL, 'continue')
+            
+            if merge == 'continue':
+                text = above.get(offset, "")
+            else:
+                text = "\n".join(_paragraph_text(p) for p in tc.iterchildren(_W_P))
+            current[offset] = text
+            row.extend([text] * span)
+            offset += span
+        rows.append(row)
+        above = current
+    return rows
+
+
+def _table_element_info(tbl, index):
+    """Describe a <w:tbl> element and its contents for read and read_tables"""
+    grid = tbl.find(_W_TBLGRID)
+    return {
+        "index": index,
+        "rows": len(tbl.findall(_W_TR)),
+        "cols": len(grid.findall(_W_GRIDCOL)) if grid is not None else 0,
+        "data": _table_element_rows(tbl)
+    }
+
+
+def _read_document_from_package(path, include_tables=False):
+    """
+    Compute read_document's result by streaming the .docx zip directly
+    
+    Args:
+        path: Path to the .docx file
+        include_tables: Whether to include table data
+        
+    Returns:
+        dict: Contains paragraphs and optional tables
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    
+    paragraphs = []
+    tables = []
+    table_count = 0
+    with zipfile.ZipFile(path) as package:
+        document_part = _package_targets(package)[RT.OFFICE_DOCUMENT]
+        style_names, default_style = _paragraph_style_names(package, document_part)
+        for element in _iter_body_elements(package, document_part):
+            if element.tag == _W_P:
+                text, style = _paragraph_element_info(element, style_names, default_style)
+                paragraphs.append({"index": len(paragraphs), "text": text, "style": style})
+            else:
+                if include_tables:
+                    tables.append(_table_element_info(element, table_count))
+                table_count += 1
+    
+    result = {
+        "paragraph_count": len(paragraphs),
+        "table_count": table_count,
+        "paragraphs": paragraphs
+    }
+    if include_tables:
+        result["tables"] = tables
+    return result
+
+
 def read_document(path, include_tables=False):
     """
     Extract text and structure from a document
     
+    Streams word/document.xml out of the zip with iterparse instead of
+    building the python-docx object tree, falling back to a full load for
+    packages the direct reader can't handle.
+    
     Args:
         path: Path to the .docx file
         include_tables: Whether to include table data
@@ -69,82 +691,253 @@ def read_document(path, include_tables=False):
     Returns:
         dict: Contains paragraphs and optional tables
     """
-    doc = load_document_safe(path)
+    path = Path(path)
+    
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    try:
+        return _read_document_from_package(path, include_tables)
+    except Exception:
+        pass  # Missing parts or a damaged package; python-docx reports it properly
+    
+    doc = load_document_safe(path, use_cache=True)
+    return _read_document(doc, include_tables)
+
+
+def read_documents(paths, include_tables=False, workers=None):
+    """
+    Extract text and structure from several documents, in parallel
+    
+    Args:
+        paths: Paths to .docx files; "@list.txt" entries expand to the paths
+            listed in that file, one per line
+        include_tables: Whether to include table data
+        workers: Number of workers (default: CPU count)
+        
+    Returns:
+        dict: One read_document result (or error) per file
+    """
+    return _summarize_files(_map_files(read_document, _expand_paths(paths), (include_tables,), workers))
+
+
+def _read_document(doc, include_tables=False):
+    """
+    Extract text and structure from an already-loaded document
+    
+    Args:
+        doc: docx Document object
+        include_tables: Whether to include table data
+        
+    Returns:
+        dict: Contains paragraphs and optional tables
+    """
+    doc_paragraphs = doc.paragraphs
     
     result = {
-        "paragraph_count": len(doc.paragraphs),
-        "table_count": len(doc.tables)
+        "paragraph_count": len(doc_paragraphs),
+        "table_count": len(doc.element.body.findall(_W_TBL))
     }
     
     # Extract paragraphs
-    paragraphs = []
-    for idx, para in enumerate(doc.paragraphs):
-        para_data = {
+    result["paragraphs"] = [
+        {
             "index": idx,
             "text": para.text,
             "style": para.style.name if para.style else None
         }
-        paragraphs.append(para_data)
-    
-    result["paragraphs"] = paragraphs
+        for idx, para in enumerate(doc_paragraphs)
+    ]
     
     # Extract tables if requested
     if include_tables:
-        tables = []
-        for table_idx, table in enumerate(doc.tables):
-            table_data = {
-                "index": table_idx,
-                "rows": len(table.rows),
-                "cols": len(table.columns),
-                "data": []
-            }
-            for row in table.rows:
-                row_data = [cell.text for cell in row.cells]
-                table_data["data"].append(row_data)
-            tables.append(table_data)
-        result["tables"] = tables
+        result["tables"] = [
+            _table_element_info(tbl, table_idx)
+            for table_idx, tbl in enumerate(doc.element.body.iterchildren(_W_TBL))
+        ]
     
     return result
 
 
-def edit_paragraph_text(path, paragraph_index, new_text):
+def read_document_stream(path, include_tables=False):
     """
-    Update text in a specific paragraph
+    Extract text and structure from a document one record at a time
+    
+    Yields a header record, then one record per paragraph and, if requested,
+    one record per table followed by one per table row, so callers can write
+    NDJSON without holding the whole result in memory. The zip is streamed
+    with iterparse, one pass for the header counts and one per record kind.
     
     Args:
         path: Path to the .docx file
+        include_tables: Whether to include table data
+        
+    Yields:
+        dict: Records tagged with a "type" of header, paragraph, table or table_row
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    
+    path = Path(path)
+    
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    package = None
+    try:
+        package = zipfile.ZipFile(path)
+        document_part = _package_targets(package)[RT.OFFICE_DOCUMENT]
+        style_names, default_style = _paragraph_style_names(package, document_part)
+        paragraph_count = 0
+        table_count = 0
+        for element in _iter_body_elements(package, document_part):
+            if element.tag == _W_P:
+                paragraph_count += 1
+            else:
+                table_count += 1
+    except Exception:
+        # Missing parts or a damaged package; python-docx reports it properly
+        if package is not None:
+            package.close()
+        yield from _read_document_stream(load_document_safe(path, use_cache=True), include_tables)
+        return
+    
+    with package:
+        yield {
+            "type": "header",
+            "paragraph_count": paragraph_count,
+            "table_count": table_count
+        }
+        
+        idx = 0
+        for element in _iter_body_elements(package, document_part):
+            if element.tag != _W_P:
+                continue
+            text, style = _paragraph_element_info(element, style_names, default_style)
+            yield {"type": "paragraph", "index": idx, "text": text, "style": style}
+            idx += 1
+        
+        if include_tables:
+            table_idx = 0
+            for element in _iter_body_elements(package, document_part):
+                if element.tag != _W_TBL:
+                    continue
+                info = _table_element_info(element, table_idx)
+                yield {
+                    "type": "table",
+                    "index": table_idx,
+                    "rows": info["rows"],
+                    "cols": info["cols"]
+                }
+                for row_idx, row in enumerate(info["data"]):
+                    yield {
+                        "type": "table_row",
+                        "table_index": table_idx,
+                        "row_index": row_idx,
+                        "data": row
+                    }
+                table_idx += 1
+
+
+def _read_document_stream(doc, include_tables=False):
+    """
+    Record-at-a-time read of an already-loaded document
+    
+    Args:
+        doc: docx Document object
+        include_tables: Whether to include table data
+        
+    Yields:
+        dict: Records tagged with a "type" of header, paragraph, table or table_row
+    """
+    body = doc.element.body
+    
+    yield {
+        "type": "header",
+        "paragraph_count": len(body.findall(_W_P)),
+        "table_count": len(body.findall(_W_TBL))
+    }
+    
+    for idx, para in enumerate(doc.paragraphs):
+        yield {
+            "type": "paragraph",
+            "index": idx,
+            "text": para.text,
+            "style": para.style.name if para.style else None
+        }
+    
+    if include_tables:
+        for table_idx, tbl in enumerate(body.iterchildren(_W_TBL)):
+            info = _table_element_info(tbl, table_idx)
+            yield {
+                "type": "table",
+                "index": table_idx,
+                "rows": info["rows"],
+                "cols": info["cols"]
+            }
+            for row_idx, row in enumerate(info["data"]):
+                yield {
+                    "type": "table_row",
+                    "table_index": table_idx,
+                    "row_index": row_idx,
+                    "data": row
+                }
+
+
+def _edit_paragraph_text(doc, paragraph_index, new_text):
+    """
+    Update text in a specific paragraph of an already-loaded document
+    
+    Args:
+        doc: docx Document object
         paragraph_index: Zero-based index of paragraph to edit
         new_text: New text content
         
     Returns:
         dict: Status message
     """
-    doc = load_document_safe(path)
+    paragraphs = doc.paragraphs
     
-    if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
-        raise ValueError(f"Paragraph index {paragraph_index} out of range. Document has {len(doc.paragraphs)} paragraphs.")
+    if paragraph_index < 0 or paragraph_index >= len(paragraphs):
+        raise ValueError(f"Paragraph index {paragraph_index} out of range. Document has {len(paragraphs)} paragraphs.")
     
-    para = doc.paragraphs[paragraph_index]
+    para = paragraphs[paragraph_index]
+    changed = para.text != new_text
     
-    # Clear existing runs and add new text
-    para.clear()
-    run = para.add_run(new_text)
-    
-    save_document_safe(doc, path)
+    if changed:
+        # Clear existing runs and add new text
+        para.clear()
+        run = para.add_run(new_text)
     
     return {
         "status": "success",
         "paragraph_index": paragraph_index,
-        "new_text": new_text
+        "new_text": new_text,
+        "changed": changed
     }
 
 
-def insert_paragraph(path, position, text, style=None):
+def edit_paragraph_text(path, paragraph_index, new_text, dry_run=False):
     """
-    Insert a new paragraph at a specific position
+    Update text in a specific paragraph
     
     Args:
         path: Path to the .docx file
+        paragraph_index: Zero-based index of paragraph to edit
+        new_text: New text content
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: Status message
+    """
+    return _apply_and_save(path, _edit_paragraph_text, paragraph_index, new_text, dry_run=dry_run)
+
+
+def _insert_paragraph(doc, position, text, style=None):
+    """
+    Insert a new paragraph into an already-loaded document
+    
+    Args:
+        doc: docx Document object
         position: Position to insert (0 = beginning, 'end' = append)
         text: Paragraph text content
         style: Optional style name
@@ -152,27 +945,27 @@ def insert_paragraph(path, position, text, style=None):
     Returns:
         dict: Status message
     """
-    doc = load_document_safe(path)
-    
     if position == "end":
         new_para = doc.add_paragraph(text)
-        insert_idx = len(doc.paragraphs) - 1
+        # Count <w:p> elements directly; no Paragraph wrappers needed for the index
+        insert_idx = len(doc.element.body.findall(_W_P)) - 1
     else:
+        paragraphs = doc.paragraphs
         try:
             insert_idx = int(position)
             if insert_idx < 0:
                 insert_idx = 0
-            if insert_idx > len(doc.paragraphs):
-                insert_idx = len(doc.paragraphs)
+            if insert_idx > len(paragraphs):
+                insert_idx = len(paragraphs)
         except ValueError:
             raise ValueError(f"Position must be an integer or 'end', got: {position}")
         
         # Insert at specific position
         if insert_idx == 0:
-            new_para = doc.paragraphs[0].insert_paragraph_before(text)
+            new_para = paragraphs[0].insert_paragraph_before(text)
         else:
             # Insert after the specified paragraph
-            new_para = doc.paragraphs[insert_idx - 1].insert_paragraph_before(text)
+            new_para = paragraphs[insert_idx - 1].insert_paragraph_before(text)
     
     if style:
         try:
@@ -180,8 +973,6 @@ def insert_paragraph(path, position, text, style=None):
         except Exception:
             pass  # Style not found, ignore
     
-    save_document_safe(doc, path)
-    
     return {
         "status": "success",
         "position": insert_idx,
@@ -190,135 +981,688 @@ def insert_paragraph(path, position, text, style=None):
     }
 
 
-def find_replace(path, find_text, replace_text):
+def insert_paragraph(path, position, text, style=None, dry_run=False):
+    """
+    Insert a new paragraph at a specific position
+    
+    Args:
+        path: Path to the .docx file
+        position: Position to insert (0 = beginning, 'end' = append)
+        text: Paragraph text content
+        style: Optional style name
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: Status message
+    """
+    return _apply_and_save(path, _insert_paragraph, position, text, style, dry_run=dry_run)
+
+
+def _iter_story_paragraphs(doc):
+    """
+    Yield every <w:p> element of the body, its tables, headers and footers
+    
+    Walks the lxml trees directly, so no Paragraph, Table or _Cell proxies
+    are created and each (possibly merged) cell is visited once.
+    """
+    yield from doc.element.body.iter(_W_P)
+    
+    for part in doc.part.package.iter_parts():
+        if part.content_type.endswith(('.header+xml', '.footer+xml')):
+            yield from part.element.iter(_W_P)
+
+
+def _collapse_paragraph(p, text):
+    """
+    Replace a paragraph's content with one run holding text
+    
+    The new run copies the first run's properties. Paragraph properties are
+    kept; everything else in the paragraph is removed.
+    """
+    from docx.oxml import OxmlElement
+    
+    first_run = next(p.iter(_W_R), None)
+    run_properties = first_run.find(_W_RPR) if first_run is not None else None
+    
+    for child in list(p):
+        if child.tag != _W_PPR:
+            p.remove(child)
+    
+    new_run = OxmlElement('w:r')
+    if run_properties is not None:
+        new_run.append(copy.deepcopy(run_properties))
+    new_run.text = text  # CT_R maps \t and \n to <w:tab/> and <w:br/>
+    p.append(new_run)
+
+
+def _splice_segments(segments, matches):
+    """
+    Compute new text for each <w:t> of a paragraph given match spans
+    
+    A match inside one text node is replaced there. A match spanning several
+    runs puts its replacement in the node where it starts; the matched text
+    is removed from the following nodes, which otherwise keep their text
+    and formatting.
+    
+    Args:
+        segments: (w:t element or None, text) tuples from _paragraph_segments
+        matches: Sorted, non-overlapping (start, end, replacement) offsets
+            into the joined paragraph text
+        
+    Returns:
+        list: (w:t element, new text) for every changed node, or None if a
+            match covers a tab, break or similar non-<w:t> segment
+    """
+    changes = []
+    match_idx = 0
+    offset = 0
+    for node, text in segments:
+        seg_start = offset
+        seg_end = offset + len(text)
+        offset = seg_end
+        
+        # Skip matches that ended before this segment
+        while match_idx < len(matches) and matches[match_idx][1] <= seg_start:
+            match_idx += 1
+        
+        pieces = []
+        pos = seg_start
+        idx = match_idx
+        while idx < len(matches) and matches[idx][0] < seg_end:
+            start, end, replacement = matches[idx]
+            if node is None:
+                return None
+            if start >= seg_start:
+                pieces.append(text[pos - seg_start:start - seg_start])
+                pieces.append(replacement)
+            pos = min(end, seg_end)
+            if end > seg_end:
+                break  # Continues into the next segment
+            idx += 1
+        
+        if pos != seg_start or pieces:
+            pieces.append(text[pos - seg_start:])
+            changes.append((node, "".join(pieces)))
+    
+    return changes
+
+
+def _replace_in_paragraphs(doc, replacer):
+    """
+    Run a text replacer over every paragraph of an already-loaded document
+    
+    Matches are spliced into the existing <w:t> nodes, so every run keeps its
+    formatting, including when a match spans several runs (the replacement
+    takes the formatting of the run where the match starts). Paragraphs
+    where a match covers a tab or break, or the replacement contains one,
+    are rebuilt as one run using the formatting of the first run.
+    
+    Args:
+        doc: docx Document object
+        replacer: (replace, find_spans) pair, where replace maps text to
+            (new_text, match_count) and find_spans yields the same matches as
+            (start, end, replacement)
+        
+    Returns:
+        int: Total number of replacements made
+    """
+    replace, find_spans = replacer
+    replacements = 0
+    
+    for p in _iter_story_paragraphs(doc):
+        segments = _paragraph_segments(p)
+        full_text = "".join(text for _, text in segments)
+        new_full_text, count = replace(full_text)
+        if not count:
+            continue
+        replacements += count
+        
+        if len(segments) == 1 and segments[0][0] is not None:
+            # Single text node: the paragraph-level scan already did the work
+            changes = [(segments[0][0], new_full_text)]
+        else:
+            changes = _splice_segments(segments, list(find_spans(full_text)))
+        if changes is not None and not any(
+                _CONTROL_CHARS.intersection(new_text) for _, new_text in changes):
+            for node, new_text in changes:
+                _set_t_text(node, new_text)
+            continue
+        
+        # Replacement adds a tab or break, or a match covers one - collapse
+        # into one run with the first run's formatting
+        _collapse_paragraph(p, new_full_text)
+    
+    return replacements
+
+
+def _build_replacer(find_text, replace_text):
+    """
+    Build a replacer for a single find string
+    
+    One str.replace scan per text: the match count follows from the length
+    change unless find and replace are the same length, where it is counted.
+    
+    Returns:
+        tuple: (replace, find_spans) callables, see _replace_in_paragraphs
+    """
+    find_length = len(find_text)
+    length_delta = len(replace_text) - find_length
+    
+    def replace(text):
+        new_text = text.replace(find_text, replace_text)
+        if length_delta:
+            return new_text, (len(new_text) - len(text)) // length_delta
+        # Also when find == replace, where str.replace returns text itself
+        return new_text, text.count(find_text)
+    
+    def find_spans(text):
+        start = text.find(find_text)
+        while start != -1:
+            yield start, start + find_length, replace_text
+            start = text.find(find_text, start + find_length)
+    
+    return replace, find_spans
+
+
+def _find_replace(doc, find_text, replace_text):
+    """
+    Find and replace text throughout an already-loaded document
+    
+    Args:
+        doc: docx Document object
+        find_text: Text to find
+        replace_text: Replacement text
+        
+    Returns:
+        dict: Number of replacements made
+    """
+    if not find_text:
+        raise ValueError("Find text must not be empty")
+    
+    replacements = _replace_in_paragraphs(doc, _build_replacer(find_text, replace_text))
+    
+    return {
+        "status": "success",
+        "replacements": replacements,
+        "find": find_text,
+        "replace": replace_text,
+        "changed": replacements > 0
+    }
+
+
+def _package_may_contain(path, find_texts):
+    """
+    Check whether any paragraph of a .docx could contain one of the find strings
+    
+    Covers the same paragraphs as _iter_story_paragraphs: the main document
+    plus header and footer parts. Each part's raw XML is first searched for
+    the escaped strings with bytes.find; a hit means a likely match. A miss
+    is only conclusive once the part's paragraph texts have been checked, as
+    a match can span runs, so those parts are then streamed with iterparse.
+    Either way no python-docx Document is built.
+    
+    Args:
+        path: Path to .docx file
+        find_texts: Strings to look for
+        
+    Returns:
+        bool: False only if no paragraph contains any of the strings
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from lxml import etree
+    from xml.sax.saxutils import escape
+    
+    try:
+        with zipfile.ZipFile(path) as package:
+            content_types = etree.fromstring(package.read('[Content_Types].xml'))
+            part_names = [_package_targets(package)[RT.OFFICE_DOCUMENT]]
+            for override in content_types:
+                if override.get('ContentType', '').endswith(('.header+xml', '.footer+xml')):
+                    part_names.append(override.get('PartName').lstrip('/'))
+            
+            needles = [escape(find_text).encode('utf-8') for find_text in find_texts]
+            unsure = []
+            for part_name in part_names:
+                raw = package.read(part_name)
+                if any(needle in raw for needle in needles):
+                    return True
+                unsure.append(raw)
+            
+            for raw in unsure:
+                for _, p in etree.iterparse(io.BytesIO(raw), tag=_W_P):
+                    text = _paragraph_text(p)
+                    if any(find_text in text for find_text in find_texts):
+                        return True
+                    p.clear()
+    except Exception:
+        return True  # Let the full load report (or handle) an unusual package
+    
+    return False
+
+
+def find_replace(path, find_text, replace_text, dry_run=False):
     """
     Find and replace text throughout the document
     
-    Handles text split across multiple runs by reconstructing paragraph text.
+    Args:
+        path: Path to .docx file
+        find_text: Text to find
+        replace_text: Replacement text
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: Number of replacements made
+    """
+    if find_text and not _package_may_contain(path, [find_text]):
+        result = {
+            "status": "success",
+            "replacements": 0,
+            "find": find_text,
+            "replace": replace_text,
+            "changed": False
+        }
+        if dry_run:
+            result["dry_run"] = True
+        return result
+    
+    return _apply_and_save(path, _find_replace, find_text, replace_text, dry_run=dry_run)
+
+
+def _run_on_file(task):
+    """
+    Run a per-file function on one file, reporting failures instead of raising
+    
+    Module-level so it can be pickled into worker processes.
+    
+    Args:
+        task: (function, path, extra positional args) tuple
+    """
+    function, path, args = task
+    try:
+        result = function(path, *args)
+    except Exception as e:
+        result = {
+            "status": "error",
+            "message": str(e),
+            "type": type(e).__name__
+        }
+    result["path"] = path
+    return result
+
+
+def _expand_paths(paths):
+    """
+    Expand a list of paths where an "@file" entry names a file listing paths
+    
+    Args:
+        paths: Path strings; "@list.txt" is replaced by the non-empty lines of
+            list.txt. A single string is treated as a one-item list.
+        
+    Returns:
+        list: Path strings
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    
+    expanded = []
+    for path in paths:
+        if path.startswith('@'):
+            lines = Path(path[1:]).read_text(encoding='utf-8').splitlines()
+            expanded.extend(line.strip() for line in lines if line.strip())
+        else:
+            expanded.append(path)
+    
+    if not expanded:
+        raise ValueError("No files given")
+    return expanded
+
+
+def _map_files(function, paths, args, workers=None):
+    """
+    Run function(path, *args) for every path, in parallel
+    
+    Uses worker processes, or threads on a free-threaded (no-GIL) build where
+    threads already run the lxml work in parallel without the pickling and
+    start-up cost.
+    
+    Args:
+        function: Module-level callable taking a path first
+        paths: Path strings
+        args: Extra positional arguments for function
+        workers: Number of workers (default: CPU count)
+        
+    Returns:
+        list: One result dict per path, in order, each with a "path" key
+    """
+    import concurrent.futures
+    
+    tasks = [(function, path, args) for path in paths]
+    
+    if workers == 1 or len(tasks) == 1:
+        return [_run_on_file(task) for task in tasks]
+    
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    if gil_enabled:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    with executor:
+        return list(executor.map(_run_on_file, tasks))
+
+
+def _summarize_files(results, **totals):
+    """Wrap per-file results with file and error counts, plus any extra totals"""
+    summary = {
+        "status": "success",
+        "file_count": len(results),
+        "error_count": sum(1 for result in results if result.get("status") == "error")
+    }
+    summary.update(totals)
+    summary["files"] = results
+    return summary
+
+
+def find_replace_files(paths, find_text, replace_text, workers=None, dry_run=False):
+    """
+    Find and replace text in each of several documents, in parallel
+    
+    Args:
+        paths: Paths to .docx files; "@list.txt" entries expand to the paths
+            listed in that file, one per line
+        find_text: Text to find
+        replace_text: Replacement text
+        workers: Number of workers (default: CPU count)
+        dry_run: Report the result without writing the files
+        
+    Returns:
+        dict: Per-file results and total number of replacements
+    """
+    if not find_text:
+        raise ValueError("Find text must not be empty")
+    
+    results = _map_files(find_replace, _expand_paths(paths), (find_text, replace_text, dry_run), workers)
+    return _summarize_files(results, replacements=sum(result.get("replacements", 0) for result in results))
+
+
+def find_replace_glob(pattern, find_text, replace_text, workers=None, dry_run=False):
+    """
+    Find and replace text in every document matching a glob pattern
+    
+    Files are processed in parallel worker processes, so many documents
+    share one interpreter start-up and spread across CPU cores.
+    
+    Args:
+        pattern: Glob pattern for .docx files (supports ** for recursion)
+        find_text: Text to find
+        replace_text: Replacement text
+        workers: Number of worker processes (default: CPU count)
+        dry_run: Report the result without writing the files
+        
+    Returns:
+        dict: Per-file results and total number of replacements
+    """
+    paths = sorted(glob.glob(pattern, recursive=True))
+    if not paths:
+        raise FileNotFoundError(f"No files match: {pattern}")
+    
+    return find_replace_files(paths, find_text, replace_text, workers, dry_run)
+
+
+def _parse_replacement_pairs(pairs):
+    """
+    Normalize find/replace pairs into a dict
+    
+    Args:
+        pairs: Dict of find -> replace, list of [find, replace] pairs,
+            or a JSON string holding either
+        
+    Returns:
+        dict: Mapping of find text to replacement text
+    """
+    if isinstance(pairs, str):
+        pairs = json.loads(pairs)
+    
+    mapping = dict(pairs.items() if isinstance(pairs, dict) else pairs)
+    
+    if not mapping:
+        raise ValueError("At least one find/replace pair is required")
+    if "" in mapping:
+        raise ValueError("Find text must not be empty")
+    
+    return mapping
+
+
+def _build_multi_replacer(mapping):
+    """
+    Build a replacer that substitutes every find string in one scan of the text
+    
+    Uses a pyahocorasick automaton when the package is installed, otherwise a
+    single compiled regex alternation. Both pick the leftmost, then longest,
+    non-overlapping match. A single pair uses the plain str.replace replacer,
+    which beats either for one pattern.
+    
+    Args:
+        mapping: Dict of find text -> replacement text
+        
+    Returns:
+        tuple: (replace, find_spans) callables, see _replace_in_paragraphs
+    """
+    if len(mapping) == 1:
+        (find_text, replace_text), = mapping.items()
+        return _build_replacer(find_text, replace_text)
+    
+    try:
+        import ahocorasick
+    except ImportError:
+        ahocorasick = None
+    
+    if ahocorasick is None:
+        pattern = re.compile("|".join(re.escape(find_text) for find_text in sorted(mapping, key=len, reverse=True)))
+        
+        lookup = mapping.__getitem__
+        
+        def replace(text):
+            return pattern.subn(lambda match: lookup(match.group()), text)
+        
+        def find_spans(text):
+            for match in pattern.finditer(text):
+                yield match.start(), match.end(), lookup(match.group())
+        
+        return replace, find_spans
+    
+    automaton = ahocorasick.Automaton()
+    for find_text, replace_text in mapping.items():
+        automaton.add_word(find_text, (len(find_text), replace_text))
+    automaton.make_automaton()
+    
+    def matches(text):
+        # iter() reports every key found, overlapping ones included; keep the
+        # longest key starting at each position, then take the leftmost
+        # non-overlapping ones, as the regex alternation does. iter_long()
+        # can't be used: it drops a shorter key while a longer key sharing
+        # its start is still a possible match.
+        longest = {}
+        for end, (length, replace_text) in automaton.iter(text):
+            start = end - length + 1
+            if length > longest.get(start, (0, None))[0]:
+                longest[start] = (length, replace_text)
+        last = 0
+        for start in sorted(longest):
+            if start >= last:
+                length, replace_text = longest[start]
+                last = start + length
+                yield start, last, replace_text
+    
+    def replace(text):
+        parts = []
+        last = 0
+        for start, end, replace_text in matches(text):
+            parts.append(text[last:start])
+            parts.append(replace_text)
+            last = end
+        if not parts:
+            return text, 0
+        parts.append(text[last:])
+        return "".join(parts), len(parts) // 2
+    
+    return replace, matches
+
+
+def _find_replace_many(doc, pairs):
+    """
+    Replace several find strings throughout an already-loaded document in one pass
+    
+    Args:
+        doc: docx Document object
+        pairs: Find/replace pairs (see _parse_replacement_pairs)
+        
+    Returns:
+        dict: Number of replacements made
+    """
+    mapping = _parse_replacement_pairs(pairs)
+    replacements = _replace_in_paragraphs(doc, _build_multi_replacer(mapping))
+    
+    return {
+        "status": "success",
+        "replacements": replacements,
+        "pair_count": len(mapping),
+        "changed": replacements > 0
+    }
+
+
+def find_replace_many(path, pairs, dry_run=False):
+    """
+    Find and replace several strings throughout the document in a single pass
+    
+    Args:
+        path: Path to .docx file
+        pairs: Dict of find -> replace, list of [find, replace] pairs,
+            or a JSON string holding either
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: Number of replacements made
+    """
+    mapping = _parse_replacement_pairs(pairs)
+    
+    if not _package_may_contain(path, list(mapping)):
+        result = {
+            "status": "success",
+            "replacements": 0,
+            "pair_count": len(mapping),
+            "changed": False
+        }
+        if dry_run:
+            result["dry_run"] = True
+        return result
+    
+    return _apply_and_save(path, _find_replace_many, mapping, dry_run=dry_run)
+
+
+def read_tables(path, table_index=None):
+    """
+    Extract table data from the document
+    
+    Streams the zip like read_document, only extracting the cells of the
+    requested table(s).
     
     Args:
         path: Path to .docx file
-        find_text: Text to find
-        replace_text: Replacement text
+        table_index: Optional specific table index (0-based)
         
     Returns:
-        dict: Number of replacements made
+        dict: Table data
     """
-    doc = load_document_safe(path)
+    path = Path(path)
     
-    replacements = 0
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
     
-    def replace_in_paragraph(para):
-        nonlocal replacements
-        if find_text not in para.text:
-            return
-        
-        # Collect all text and formatting info from runs
-        runs_info = []
-        full_text = ""
-        for run in para.runs:
-            runs_info.append({
-                'text': run.text,
-                'bold': run.bold,
-                'italic': run.italic,
-                'underline': run.underline,
-                'font_name': run.font.name,
-                'font_size': run.font.size
-            })
-            full_text += run.text
-        
-        # Perform replacement on full text
-        if find_text not in full_text:
-            return
-        
-        new_text = full_text.replace(find_text, replace_text)
-        replacements += full_text.count(find_text)
-        
-        # Clear all runs and add new text with formatting from first run
-        para.clear()
-        if runs_info:
-            # Use formatting from first run for the new text
-            new_run = para.add_run(new_text)
-            new_run.bold = runs_info[0]['bold']
-            new_run.italic = runs_info[0]['italic']
-            new_run.underline = runs_info[0]['underline']
-            if runs_info[0]['font_name']:
-                new_run.font.name = runs_info[0]['font_name']
-            if runs_info[0]['font_size']:
-                new_run.font.size = runs_info[0]['font_size']
-    
-    # Search in paragraphs
-    for para in doc.paragraphs:
-        replace_in_paragraph(para)
-    
-    # Search in tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    replace_in_paragraph(para)
+    try:
+        table_count, tables_data = _read_tables_from_package(path, table_index)
+    except Exception:
+        # Missing parts or a damaged package; python-docx reports it properly
+        doc = load_document_safe(path, use_cache=True)
+        return _read_tables(doc, table_index)
     
-    save_document_safe(doc, path)
+    if table_index is not None and table_count and (table_index < 0 or table_index >= table_count):
+        raise ValueError(f"Table index {table_index} out of range. Document has {table_count} tables.")
     
     return {
-        "status": "success",
-        "replacements": replacements,
-        "find": find_text,
-        "replace": replace_text
+        "table_count": table_count,
+        "tables": tables_data
     }
 
 
-def read_tables(path, table_index=None):
+def _read_tables_from_package(path, table_index=None):
     """
-    Extract table data from the document
+    Read tables by streaming the .docx zip directly
     
     Args:
         path: Path to .docx file
         table_index: Optional specific table index (0-based)
         
+    Returns:
+        tuple: (total table count, list of table info dicts)
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    
+    tables_data = []
+    table_count = 0
+    with zipfile.ZipFile(path) as package:
+        document_part = _package_targets(package)[RT.OFFICE_DOCUMENT]
+        for element in _iter_body_elements(package, document_part):
+            if element.tag != _W_TBL:
+                continue
+            if table_index is None or table_index == table_count:
+                tables_data.append(_table_element_info(element, table_count))
+            table_count += 1
+    return table_count, tables_data
+
+
+def _read_tables(doc, table_index=None):
+    """
+    Extract table data from an already-loaded document
+    
+    Args:
+        doc: docx Document object
+        table_index: Optional specific table index (0-based)
+        
     Returns:
         dict: Table data
     """
-    doc = load_document_safe(path)
+    tables = doc.tables
     
-    if len(doc.tables) == 0:
+    if len(tables) == 0:
         return {
             "table_count": 0,
             "tables": []
         }
     
     if table_index is not None:
-        if table_index < 0 or table_index >= len(doc.tables):
-            raise ValueError(f"Table index {table_index} out of range. Document has {len(doc.tables)} tables.")
-        tables_to_read = [doc.tables[table_index]]
+        if table_index < 0 or table_index >= len(tables):
+            raise ValueError(f"Table index {table_index} out of range. Document has {len(tables)} tables.")
+        tables_to_read = [tables[table_index]]
     else:
-        tables_to_read = doc.tables
+        tables_to_read = tables
     
-    tables_data = []
-    for idx, table in enumerate(tables_to_read):
-        table_info = {
-            "index": idx if table_index is None else table_index,
-            "rows": len(table.rows),
-            "cols": len(table.columns),
-            "data": []
-        }
-        for row in table.rows:
-            row_data = [cell.text for cell in row.cells]
-            table_info["data"].append(row_data)
-        tables_data.append(table_info)
+    tables_data = [
+        _table_element_info(table._tbl, idx if table_index is None else table_index)
+        for idx, table in enumerate(tables_to_read)
+    ]
     
     return {
-        "table_count": len(doc.tables),
+        "table_count": len(tables),
         "tables": tables_data
     }
 
 
-def edit_table_cell(path, table_index, row, col, text):
+def _edit_table_cell(doc, table_index, row, col, text):
     """
-    Edit a specific cell in a table
+    Edit a specific cell in a table of an already-loaded document
     
     Args:
-        path: Path to .docx file
+        doc: docx Document object
         table_index: Table index (0-based)
         row: Row index (0-based)
         col: Column index (0-based)
@@ -327,12 +1671,12 @@ def edit_table_cell(path, table_index, row, col, text):
     Returns:
         dict: Status message
     """
-    doc = load_document_safe(path)
+    tables = doc.tables
     
-    if table_index < 0 or table_index >= len(doc.tables):
-        raise ValueError(f"Table index {table_index} out of range. Document has {len(doc.tables)} tables.")
+    if table_index < 0 or table_index >= len(tables):
+        raise ValueError(f"Table index {table_index} out of range. Document has {len(tables)} tables.")
     
-    table = doc.tables[table_index]
+    table = tables[table_index]
     
     if row < 0 or row >= len(table.rows):
         raise ValueError(f"Row index {row} out of range. Table has {len(table.rows)} rows.")
@@ -341,19 +1685,39 @@ def edit_table_cell(path, table_index, row, col, text):
         raise ValueError(f"Column index {col} out of range. Table has {len(table.columns)} columns.")
     
     cell = table.rows[row].cells[col]
-    cell.text = text
+    changed = _cell_text(cell) != text
     
-    save_document_safe(doc, path)
+    if changed:
+        _set_cell_text(cell, text)
     
     return {
         "status": "success",
         "table_index": table_index,
         "row": row,
         "col": col,
-        "text": text
+        "text": text,
+        "changed": changed
     }
 
 
+def edit_table_cell(path, table_index, row, col, text, dry_run=False):
+    """
+    Edit a specific cell in a table
+    
+    Args:
+        path: Path to .docx file
+        table_index: Table index (0-based)
+        row: Row index (0-based)
+        col: Column index (0-based)
+        text: New cell text content
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: Status message
+    """
+    return _apply_and_save(path, _edit_table_cell, table_index, row, col, text, dry_run=dry_run)
+
+
 def create_document(path):
     """
     Create a new blank document
@@ -364,6 +1728,8 @@ def create_document(path):
     Returns:
         dict: Creation status
     """
+    from docx import Document
+    
     doc = Document()
     save_document_safe(doc, path)
     
@@ -374,12 +1740,12 @@ def create_document(path):
     }
 
 
-def add_table(path, rows, cols, position=None, data=None):
+def _add_table(doc, rows, cols, position=None, data=None):
     """
-    Add a new table to the document at a specific position
+    Add a new table to an already-loaded document
     
     Args:
-        path: Path to .docx file
+        doc: docx Document object
         rows: Number of rows
         cols: Number of columns
         position: Optional position to insert (0 = beginning, 'end' = append, or paragraph index)
@@ -387,215 +1753,720 @@ def add_table(path, rows, cols, position=None, data=None):
         
     Returns:
         dict: Table insertion status
+        
+    Raises:
+        ValueError: If the dimensions are invalid or data is malformed or does not fit
     """
-    doc = load_document_safe(path)
-    
     if rows < 1 or cols < 1:
         raise ValueError("Rows and columns must be at least 1")
     
-    # Parse position
+    # Parse and validate data before touching the document
+    table_data = None
+    if data:
+        table_data = json.loads(data) if isinstance(data, str) else data
+        if not isinstance(table_data, list) or not all(isinstance(row_data, list) for row_data in table_data):
+            raise ValueError("Table data must be a JSON array of row arrays")
+        if len(table_data) > rows:
+            raise ValueError(f"Table data has {len(table_data)} rows but the table has {rows}")
+        if any(len(row_data) > cols for row_data in table_data):
+            raise ValueError(f"Table data has a row with more than {cols} columns")
+    
+    # Parse position; doc.paragraphs rebuilds its list on every access, so read it once
+    paragraphs = doc.paragraphs
     insert_after_para = None
     if position is None or position == "end":
         # Append to end - add paragraph then table
-        insert_after_para = len(doc.paragraphs) - 1 if doc.paragraphs else None
-        if insert_after_para is None or insert_after_para < 0:
+        insert_after_para = len(paragraphs) - 1
+        if insert_after_para < 0:
             # No paragraphs, add one first
-            doc.add_paragraph()
+            paragraphs = [doc.add_paragraph()]
             insert_after_para = 0
     else:
         try:
             pos_idx = int(position)
             if pos_idx < 0:
                 pos_idx = 0
-            if pos_idx > len(doc.paragraphs):
-                pos_idx = len(doc.paragraphs)
+            if pos_idx > len(paragraphs):
+                pos_idx = len(paragraphs)
             insert_after_para = pos_idx - 1
             
             # If inserting at beginning, we need a reference point
             if insert_after_para < 0:
                 # Insert at very beginning - add a paragraph first
-                if doc.paragraphs:
+                if paragraphs:
                     insert_after_para = -1  # Special marker for beginning
                 else:
-                    doc.add_paragraph()
+                    paragraphs = [doc.add_paragraph()]
                     insert_after_para = 0
         except ValueError:
             raise ValueError(f"Position must be an integer or 'end', got: {position}")
     
-    # Create table at the specified position
+    # Create the table (appended before sectPr) and move it with O(1) sibling
+    # insertion rather than scanning the body for the reference index
+    table = doc.add_table(rows=rows, cols=cols)
     if insert_after_para == -1:
-        # Insert at beginning - add table after first paragraph, then move it
-        table = doc.add_table(rows=rows, cols=cols)
-        # Move table to beginning by inserting before first paragraph's element
-        if doc.paragraphs:
-            first_para = doc.paragraphs[0]._element
-            table._element.getparent().insert(first_para.getparent().index(first_para), table._element)
-    elif insert_after_para >= 0 and insert_after_para < len(doc.paragraphs):
+        # Insert at beginning - before the first paragraph
+        paragraphs[0]._element.addprevious(table._element)
+    elif insert_after_para >= 0 and insert_after_para < len(paragraphs):
         # Insert after specified paragraph
-        table = doc.add_table(rows=rows, cols=cols)
-        ref_para = doc.paragraphs[insert_after_para]._element
-        # Move table after the reference paragraph
-        table._element.getparent().insert(ref_para.getparent().index(ref_para) + 1, table._element)
-    else:
-        # Append to end
-        table = doc.add_table(rows=rows, cols=cols)
-    
-    # Fill with data if provided
-    if data:
-        try:
-            table_data = json.loads(data) if isinstance(data, str) else data
-            for row_idx, row_data in enumerate(table_data):
-                if row_idx < rows:
-                    for col_idx, cell_text in enumerate(row_data):
-                        if col_idx < cols:
-                            table.rows[row_idx].cells[col_idx].text = str(cell_text)
-        except Exception as e:
-            pass  # Ignore data parsing errors
+        paragraphs[insert_after_para]._element.addnext(table._element)
     
-    save_document_safe(doc, path)
+    # Fill with data if provided, writing straight into the new cells' XML
+    if table_data:
+        for row_idx, (tr, row_data) in enumerate(zip(table._tbl.iterchildren(_W_TR), table_data)):
+            tcs = tr.findall(_W_TC)
+            for col_idx, cell_text in enumerate(row_data):
+                cell_text = str(cell_text)
+                if not _set_tc_text(tcs[col_idx], cell_text):
+                    table.cell(row_idx, col_idx).text = cell_text
     
     return {
         "status": "success",
         "rows": rows,
         "cols": cols,
-        "table_index": len(doc.tables) - 1
+        "table_index": sum(1 for _ in table._element.itersiblings(_W_TBL, preceding=True))
+    }
+
+
+def add_table(path, rows, cols, position=None, data=None, dry_run=False):
+    """
+    Add a new table to the document at a specific position
+    
+    Args:
+        path: Path to .docx file
+        rows: Number of rows
+        cols: Number of columns
+        position: Optional position to insert (0 = beginning, 'end' = append, or paragraph index)
+        data: Optional JSON array of row data
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: Table insertion status
+    """
+    return _apply_and_save(path, _add_table, rows, cols, position, data, dry_run=dry_run)
+
+
+def _core_properties_info(core_props):
+    """Convert docx core properties into the JSON-friendly dict used by document_info"""
+    return {
+        "title": core_props.title,
+        "author": core_props.author,
+        "subject": core_props.subject,
+        "keywords": core_props.keywords,
+        "created": str(core_props.created) if core_props.created else None,
+        "modified": str(core_props.modified) if core_props.modified else None,
+        "last_modified_by": core_props.last_modified_by
+    }
+
+
+def _count_words(text):
+    """
+    Count whitespace-separated words in text
+    
+    str.split() with no separator runs as one C loop and understands
+    Unicode whitespace, so this stays a plain split rather than a byte-level
+    scanner that would only see ASCII spaces; it is also about five times
+    faster than counting re.findall(r'\S+') matches.
+    """
+    return len(text.split())
+
+
+def _document_info_from_package(path, properties_only=False):
+    """
+    Compute document_info by reading the .docx zip directly
+    
+    Core properties are parsed from their own small part and the main
+    document part is streamed with iterparse, so no Document object is built.
+    
+    Args:
+        path: Path to .docx file
+        properties_only: Skip the main document part and return only properties
+        
+    Returns:
+        dict: Document information
+        
+    Raises:
+        KeyError: If the package has no main document or core properties part
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from docx.opc.coreprops import CoreProperties
+    from docx.oxml.parser import parse_xml
+    
+    with zipfile.ZipFile(path) as package:
+        targets = _package_targets(package)
+        core_props = CoreProperties(parse_xml(package.read(targets[RT.CORE_PROPERTIES])))
+        if properties_only:
+            return {"properties": _core_properties_info(core_props)}
+        
+        paragraph_count = 0
+        table_count = 0
+        word_count = 0
+        for element in _iter_body_elements(package, targets[RT.OFFICE_DOCUMENT]):
+            if element.tag == _W_P:
+                paragraph_count += 1
+                word_count += _count_words(_paragraph_text(element))
+            else:
+                table_count += 1
+    
+    return {
+        "paragraph_count": paragraph_count,
+        "table_count": table_count,
+        "word_count": word_count,
+        "properties": _core_properties_info(core_props)
     }
 
 
-def document_info(path):
+def document_info(path, properties_only=False):
     """
     Get document metadata and statistics
     
+    Reads the package directly when possible and falls back to a full
+    python-docx load for unusual packages.
+    
     Args:
         path: Path to .docx file
+        properties_only: Return only core properties, without reading the
+            document body for counts
         
     Returns:
         dict: Document information
     """
-    doc = load_document_safe(path)
+    path = Path(path)
+    
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    try:
+        return _document_info_from_package(path, properties_only)
+    except Exception:
+        pass  # Missing parts or a damaged package; python-docx reports it properly
+    
+    doc = load_document_safe(path, use_cache=True)
+    return _document_info(doc, properties_only)
+
+
+def _document_info(doc, properties_only=False):
+    """
+    Get metadata and statistics for an already-loaded document
+    
+    Args:
+        doc: docx Document object
+        properties_only: Return only core properties
+        
+    Returns:
+        dict: Document information
+    """
+    if properties_only:
+        return {"properties": _core_properties_info(doc.core_properties)}
     
-    # Count words
-    word_count = 0
-    for para in doc.paragraphs:
-        word_count += len(para.text.split())
+    body = doc.element.body
+    paragraphs = body.findall(_W_P)
     
-    # Get core properties
-    core_props = doc.core_properties
+    # Count words from the <w:p> elements, without Paragraph proxies, with one
+    # split over the joined text rather than one per paragraph
+    word_count = _count_words("\n".join(_paragraph_text(p) for p in paragraphs))
     
     info = {
-        "paragraph_count": len(doc.paragraphs),
-        "table_count": len(doc.tables),
+        "paragraph_count": len(paragraphs),
+        "table_count": len(body.findall(_W_TBL)),
         "word_count": word_count,
-        "properties": {
-            "title": core_props.title,
-            "author": core_props.author,
-            "subject": core_props.subject,
-            "keywords": core_props.keywords,
-            "created": str(core_props.created) if core_props.created else None,
-            "modified": str(core_props.modified) if core_props.modified else None,
-            "last_modified_by": core_props.last_modified_by
-        }
+        "properties": _core_properties_info(doc.core_properties)
     }
     
     return info
 
 
-def main():
-    """CLI interface for docx_engine"""
+def _dispatch(doc, op):
+    """
+    Apply a single batch operation to an already-loaded document
+    
+    Args:
+        doc: docx Document object
+        op: dict with a "command" key plus the command's arguments
+        
+    Returns:
+        dict: Result of the operation
+    """
+    command = op.get("command")
+    
+    if command == 'edit_text':
+        return _edit_paragraph_text(doc, op["paragraph_index"], op["new_text"])
+    elif command == 'insert_paragraph':
+        return _insert_paragraph(doc, op["position"], op["text"], op.get("style"))
+    elif command == 'find_replace':
+        return _find_replace(doc, op["find"], op["replace"])
+    elif command == 'find_replace_many':
+        return _find_replace_many(doc, op["pairs"])
+    elif command == 'edit_table_cell':
+        return _edit_table_cell(doc, op["table_index"], op["row"], op["col"], op["text"])
+    elif command == 'add_table':
+        return _add_table(doc, op["rows"], op["cols"], op.get("position"), op.get("data"))
+    else:
+        raise ValueError(f"Unsupported batch command: {command}")
+
+
+def batch(path, operations, dry_run=False):
+    """
+    Apply several edit operations to a document with a single load and save
+    
+    Args:
+        path: Path to .docx file
+        operations: List of operation dicts, or a JSON string / path to a JSON file
+            ("-" for stdin) containing that list. Each operation has a "command" key
+            (edit_text, insert_paragraph, find_replace, find_replace_many,
+            edit_table_cell, add_table) and the same arguments as the
+            matching CLI command, in snake_case.
+        dry_run: Report the result without writing the file
+        
+    Returns:
+        dict: Per-operation results
+    """
+    if isinstance(operations, str):
+        if operations.lstrip().startswith('['):
+            operations = json.loads(operations)
+        elif operations == '-':
+            operations = json.load(sys.stdin)
+        else:
+            operations = json.loads(Path(operations).read_text(encoding='utf-8'))
+    
+    if not isinstance(operations, list):
+        raise ValueError("Batch operations must be a JSON array")
+    
+    doc = load_document_safe(path)
+    
+    try:
+        results = []
+        for op_idx, op in enumerate(operations):
+            try:
+                results.append(_dispatch(doc, op))
+            except KeyError as e:
+                raise ValueError(f"Operation {op_idx} is missing argument: {e.args[0]}") from e
+        
+        changed = any(result.get("changed", True) for result in results)
+        if changed and not dry_run:
+            save_document_safe(doc, path)
+    finally:
+        # python-docx parts and their package reference each other cyclically,
+        # so a dropped Document is only freed by the cycle collector. Run it now
+        # so processes that handle many documents don't keep growing.
+        del doc
+        gc.collect()
+    
+    result = {
+        "status": "success",
+        "operation_count": len(results),
+        "results": results,
+        "changed": changed
+    }
+    if dry_run:
+        result["dry_run"] = True
+    
+    return result
+
+
+# serve commands: name -> callable taking the request dict (snake_case argument names)
+_SERVE_COMMANDS = {
+    'read': lambda cmd: read_document(cmd["path"], cmd.get("include_tables", False)),
+    'edit_text': lambda cmd: edit_paragraph_text(cmd["path"], cmd["paragraph_index"], cmd["new_text"], cmd.get("dry_run", False)),
+    'insert_paragraph': lambda cmd: insert_paragraph(cmd["path"], cmd["position"], cmd["text"], cmd.get("style"), cmd.get("dry_run", False)),
+    'find_replace': lambda cmd: find_replace(cmd["path"], cmd["find"], cmd["replace"], cmd.get("dry_run", False)),
+    'read_files': lambda cmd: read_documents(cmd["paths"], cmd.get("include_tables", False), cmd.get("workers")),
+    'find_replace_files': lambda cmd: find_replace_files(cmd["paths"], cmd["find"], cmd["replace"], cmd.get("workers"), cmd.get("dry_run", False)),
+    'find_replace_glob': lambda cmd: find_replace_glob(cmd["glob"], cmd["find"], cmd["replace"], cmd.get("workers"), cmd.get("dry_run", False)),
+    'find_replace_many': lambda cmd: find_replace_many(cmd["path"], cmd["pairs"], cmd.get("dry_run", False)),
+    'read_tables': lambda cmd: read_tables(cmd["path"], cmd.get("table_index")),
+    'edit_table_cell': lambda cmd: edit_table_cell(cmd["path"], cmd["table_index"], cmd["row"], cmd["col"], cmd["text"], cmd.get("dry_run", False)),
+    'create': lambda cmd: create_document(cmd["path"]),
+    'add_table': lambda cmd: add_table(cmd["path"], cmd["rows"], cmd["cols"], cmd.get("position"), cmd.get("data"), cmd.get("dry_run", False)),
+    'document_info': lambda cmd: document_info(cmd["path"], cmd.get("properties_only", False)),
+    'batch': lambda cmd: batch(cmd["path"], cmd["ops"], cmd.get("dry_run", False)),
+}
+
+
+def _dispatch_json(cmd):
+    """
+    Run one serve request
+    
+    Args:
+        cmd: dict with a "command" key plus that command's arguments
+        
+    Returns:
+        dict: The command's result
+    """
+    if not isinstance(cmd, dict):
+        raise ValueError("Request must be a JSON object")
+    
+    command = cmd.get("command")
+    handler = _SERVE_COMMANDS.get(command)
+    if handler is None:
+        raise ValueError(f"Unsupported command: {command}")
+    
+    try:
+        return handler(cmd)
+    except KeyError as e:
+        raise ValueError(f"Missing argument: {e.args[0]}") from e
+
+
+# Commands that _dispatch applies to a loaded document
+_EDIT_COMMANDS = frozenset(['edit_text', 'insert_paragraph', 'find_replace', 'find_replace_many', 'edit_table_cell', 'add_table'])
+
+# Read commands that can answer from a loaded document with unsaved edits
+_PENDING_READERS = {
+    'read': lambda doc, cmd: _read_document(doc, cmd.get("include_tables", False)),
+    'read_tables': lambda doc, cmd: _read_tables(doc, cmd.get("table_index")),
+    'document_info': lambda doc, cmd: _document_info(doc, cmd.get("properties_only", False)),
+}
+
+
+def _flush_pending(pending, path=None):
+    """
+    Save documents holding unsaved serve edits
+    
+    Args:
+        pending: dict of resolved path -> {"doc", "path", "dirty"} entries
+        path: Only flush this document (default: all of them)
+        
+    Returns:
+        dict: Paths that were saved
+    """
+    if path is not None:
+        keys = [str(Path(path).resolve())]
+    else:
+        keys = list(pending)
+    
+    saved = []
+    for key in keys:
+        entry = pending.pop(key, None)
+        if entry is None:
+            continue
+        if entry["dirty"]:
+            save_document_safe(entry["doc"], entry["path"])
+            saved.append(str(entry["path"]))
+    
+    if keys:
+        gc.collect()
+    
+    return {
+        "status": "success",
+        "saved": saved
+    }
+
+
+def _dispatch_deferred(cmd, pending):
+    """
+    Run one serve request, keeping edited documents in memory until flushed
+    
+    Edits are applied to a document loaded once per path and held in
+    pending; reads of such a document see the unsaved edits. Any other
+    command (including dry runs) flushes first so it sees the files as edited.
+    
+    Args:
+        cmd: dict with a "command" key plus that command's arguments
+        pending: dict of resolved path -> {"doc", "path", "dirty"} entries
+        
+    Returns:
+        dict: The command's result
+    """
+    if not isinstance(cmd, dict):
+        raise ValueError("Request must be a JSON object")
+    
+    command = cmd.get("command")
+    
+    if command == 'flush':
+        return _flush_pending(pending, cmd.get("path"))
+    
+    deferred_edit = command in _EDIT_COMMANDS and not cmd.get("dry_run")
+    
+    if deferred_edit or command in _PENDING_READERS:
+        try:
+            path = cmd["path"]
+        except KeyError as e:
+            raise ValueError(f"Missing argument: {e.args[0]}") from e
+        key = str(Path(path).resolve())
+        entry = pending.get(key)
+        
+        if deferred_edit:
+            if entry is None:
+                entry = {"doc": load_document_safe(path), "path": path, "dirty": False}
+                pending[key] = entry
+            try:
+                result = _dispatch(entry["doc"], cmd)
+            except KeyError as e:
+                raise ValueError(f"Missing argument: {e.args[0]}") from e
+            entry["dirty"] = entry["dirty"] or result.get("changed", True)
+            result["pending"] = True
+            return result
+        
+        if entry is not None:
+            return _PENDING_READERS[command](entry["doc"], cmd)
+        return _dispatch_json(cmd)
+    
+    _flush_pending(pending)
+    return _dispatch_json(cmd)
+
+
+def serve(stdin=None, stdout=None, defer_save=False):
+    """
+    Answer JSON requests from stdin, one per line, until end of input
+    
+    Keeps one interpreter (and the read cache) alive across many commands,
+    so callers pay the start-up and import cost once. Each response is a
+    single JSON line; a request's optional "id" is copied into its response.
+    
+    With defer_save, edits to a document are applied to one in-memory copy
+    and written by a "flush" request (or at end of input) instead of after
+    every command, so K edits cost one parse and one save.
+    
+    Args:
+        stdin: Text stream to read requests from (default: sys.stdin)
+        stdout: Binary stream to write responses to (default: sys.stdout.buffer)
+        defer_save: Hold edits in memory until flushed
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout.buffer
+    pending = {}
+    
+    def respond(result):
+        stdout.write(_dumps(result, indent=False))
+        stdout.flush()
+    
+    for line in stdin:
+        if not line.strip():
+            continue
+        
+        request_id = None
+        try:
+            cmd = json.loads(line)
+            if isinstance(cmd, dict):
+                request_id = cmd.get("id")
+            if defer_save:
+                result = _dispatch_deferred(cmd, pending)
+            else:
+                result = _dispatch_json(cmd)
+        except Exception as e:
+            result = {
+                "status": "error",
+                "message": str(e),
+                "type": type(e).__name__
+            }
+        
+        if request_id is not None:
+            result["id"] = request_id
+        
+        respond(result)
+    
+    if pending:
+        # Don't lose edits the client never flushed
+        try:
+            respond(_flush_pending(pending))
+        except Exception as e:
+            respond({
+                "status": "error",
+                "message": str(e),
+                "type": type(e).__name__
+            })
+
+
+# Subcommand names, so main() can build just the one it was asked for
+_CLI_COMMANDS = frozenset([
+    'read', 'edit_text', 'insert_paragraph', 'find_replace', 'find_replace_glob',
+    'find_replace_many', 'read_tables', 'edit_table_cell', 'create', 'add_table',
+    'document_info', 'serve', 'batch'
+])
+
+
+def _build_parser(command=None):
+    """
+    Build the argparse parser for the CLI
+    
+    Args:
+        command: Only add this subcommand's parser, for a known command on
+            the command line; None builds them all (for help and errors)
+    """
     parser = argparse.ArgumentParser(description='Word document manipulation engine')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
     # Read command
-    read_parser = subparsers.add_parser('read', help='Read document content')
-    read_parser.add_argument('--path', required=True, help='Path to Word document')
-    read_parser.add_argument('--include-tables', action='store_true', help='Include table data')
+    if command in (None, 'read'):
+        read_parser = subparsers.add_parser('read', help='Read document content')
+        read_target = read_parser.add_mutually_exclusive_group(required=True)
+        read_target.add_argument('--path', help='Path to Word document')
+        read_target.add_argument('--paths', nargs='+', help='Several documents, read in parallel; @FILE reads paths from FILE')
+        read_parser.add_argument('--workers', type=int, default=None, help='Number of workers for --paths (default: CPU count)')
+        read_parser.add_argument('--include-tables', action='store_true', help='Include table data')
+        read_parser.add_argument('--stream', action='store_true', help='Emit NDJSON, one record per line')
     
     # Edit text command
-    edit_parser = subparsers.add_parser('edit_text', help='Edit paragraph text')
-    edit_parser.add_argument('--path', required=True, help='Path to Word document')
-    edit_parser.add_argument('--paragraph-index', type=int, required=True, help='Paragraph index (0-based)')
-    edit_parser.add_argument('--new-text', required=True, help='New text content')
+    if command in (None, 'edit_text'):
+        edit_parser = subparsers.add_parser('edit_text', help='Edit paragraph text')
+        edit_parser.add_argument('--path', required=True, help='Path to Word document')
+        edit_parser.add_argument('--paragraph-index', type=int, required=True, help='Paragraph index (0-based)')
+        edit_parser.add_argument('--new-text', required=True, help='New text content')
+        edit_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
     
     # Insert paragraph command
-    insert_parser = subparsers.add_parser('insert_paragraph', help='Insert new paragraph')
-    insert_parser.add_argument('--path', required=True, help='Path to Word document')
-    insert_parser.add_argument('--position', required=True, help='Position (0 = beginning, end = append)')
-    insert_parser.add_argument('--text', required=True, help='Paragraph text')
-    insert_parser.add_argument('--style', default=None, help='Optional style name')
+    if command in (None, 'insert_paragraph'):
+        insert_parser = subparsers.add_parser('insert_paragraph', help='Insert new paragraph')
+        insert_parser.add_argument('--path', required=True, help='Path to Word document')
+        insert_parser.add_argument('--position', required=True, help='Position (0 = beginning, end = append)')
+        insert_parser.add_argument('--text', required=True, help='Paragraph text')
+        insert_parser.add_argument('--style', default=None, help='Optional style name')
+        insert_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
     
     # Find and replace command
-    replace_parser = subparsers.add_parser('find_replace', help='Find and replace text')
-    replace_parser.add_argument('--path', required=True, help='Path to Word document')
-    replace_parser.add_argument('--find', required=True, help='Text to find')
-    replace_parser.add_argument('--replace', required=True, help='Replacement text')
+    if command in (None, 'find_replace'):
+        replace_parser = subparsers.add_parser('find_replace', help='Find and replace text')
+        replace_target = replace_parser.add_mutually_exclusive_group(required=True)
+        replace_target.add_argument('--path', help='Path to Word document')
+        replace_target.add_argument('--paths', nargs='+', help='Several documents, processed in parallel; @FILE reads paths from FILE')
+        replace_parser.add_argument('--workers', type=int, default=None, help='Number of workers for --paths (default: CPU count)')
+        replace_parser.add_argument('--find', required=True, help='Text to find')
+        replace_parser.add_argument('--replace', required=True, help='Replacement text')
+        replace_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
+    
+    # Find and replace across files command
+    if command in (None, 'find_replace_glob'):
+        replace_glob_parser = subparsers.add_parser('find_replace_glob', help='Find and replace text in every matching file')
+        replace_glob_parser.add_argument('--glob', required=True, help='Glob pattern for Word documents (supports **)')
+        replace_glob_parser.add_argument('--find', required=True, help='Text to find')
+        replace_glob_parser.add_argument('--replace', required=True, help='Replacement text')
+        replace_glob_parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+        replace_glob_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
+    
+    # Find and replace many command
+    if command in (None, 'find_replace_many'):
+        replace_many_parser = subparsers.add_parser('find_replace_many', help='Find and replace several strings in one pass')
+        replace_many_parser.add_argument('--path', required=True, help='Path to Word document')
+        replace_many_parser.add_argument('--pairs', required=True, help='JSON object of find -> replace, or array of [find, replace] pairs')
+        replace_many_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
     
     # Read tables command
-    tables_parser = subparsers.add_parser('read_tables', help='Read table data')
-    tables_parser.add_argument('--path', required=True, help='Path to Word document')
-    tables_parser.add_argument('--table-index', type=int, default=None, help='Specific table index')
+    if command in (None, 'read_tables'):
+        tables_parser = subparsers.add_parser('read_tables', help='Read table data')
+        tables_parser.add_argument('--path', required=True, help='Path to Word document')
+        tables_parser.add_argument('--table-index', type=int, default=None, help='Specific table index')
     
     # Edit table cell command
-    edit_cell_parser = subparsers.add_parser('edit_table_cell', help='Edit table cell')
-    edit_cell_parser.add_argument('--path', required=True, help='Path to Word document')
-    edit_cell_parser.add_argument('--table-index', type=int, required=True, help='Table index')
-    edit_cell_parser.add_argument('--row', type=int, required=True, help='Row index')
-    edit_cell_parser.add_argument('--col', type=int, required=True, help='Column index')
-    edit_cell_parser.add_argument('--text', required=True, help='New cell text')
+    if command in (None, 'edit_table_cell'):
+        edit_cell_parser = subparsers.add_parser('edit_table_cell', help='Edit table cell')
+        edit_cell_parser.add_argument('--path', required=True, help='Path to Word document')
+        edit_cell_parser.add_argument('--table-index', type=int, required=True, help='Table index')
+        edit_cell_parser.add_argument('--row', type=int, required=True, help='Row index')
+        edit_cell_parser.add_argument('--col', type=int, required=True, help='Column index')
+        edit_cell_parser.add_argument('--text', required=True, help='New cell text')
+        edit_cell_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
     
     # Create command
-    create_parser = subparsers.add_parser('create', help='Create new document')
-    create_parser.add_argument('--path', required=True, help='Path for new document')
+    if command in (None, 'create'):
+        create_parser = subparsers.add_parser('create', help='Create new document')
+        create_parser.add_argument('--path', required=True, help='Path for new document')
     
     # Add table command
-    add_table_parser = subparsers.add_parser('add_table', help='Add table to document')
-    add_table_parser.add_argument('--path', required=True, help='Path to Word document')
-    add_table_parser.add_argument('--rows', type=int, required=True, help='Number of rows')
-    add_table_parser.add_argument('--cols', type=int, required=True, help='Number of columns')
-    add_table_parser.add_argument('--position', default=None, help='Insert position')
-    add_table_parser.add_argument('--data', default=None, help='JSON array of row data')
+    if command in (None, 'add_table'):
+        add_table_parser = subparsers.add_parser('add_table', help='Add table to document')
+        add_table_parser.add_argument('--path', required=True, help='Path to Word document')
+        add_table_parser.add_argument('--rows', type=int, required=True, help='Number of rows')
+        add_table_parser.add_argument('--cols', type=int, required=True, help='Number of columns')
+        add_table_parser.add_argument('--position', default=None, help='Insert position')
+        add_table_parser.add_argument('--data', default=None, help='JSON array of row data')
+        add_table_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
     
     # Document info command
-    info_parser = subparsers.add_parser('document_info', help='Get document info')
-    info_parser.add_argument('--path', required=True, help='Path to Word document')
+    if command in (None, 'document_info'):
+        info_parser = subparsers.add_parser('document_info', help='Get document info')
+        info_parser.add_argument('--path', required=True, help='Path to Word document')
+        info_parser.add_argument('--properties-only', action='store_true',
+                                 help='Only return core properties, skipping the document body')
+    
+    # Serve command
+    if command in (None, 'serve'):
+        serve_parser = subparsers.add_parser('serve', help='Answer JSON requests from stdin, one per line')
+        serve_parser.add_argument('--defer-save', action='store_true', help='Hold edits in memory until a flush request or end of input')
+    
+    # Batch command
+    if command in (None, 'batch'):
+        batch_parser = subparsers.add_parser('batch', help='Apply several edits with one load/save')
+        batch_parser.add_argument('--path', required=True, help='Path to Word document')
+        batch_parser.add_argument('--ops', '--ops-json', dest='ops', required=True,
+                                  help='JSON array of operations, path to a JSON file, or - for stdin')
+        batch_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
+    
+    return parser
+
+
+def main():
+    """CLI interface for docx_engine"""
+    # Only build the requested subcommand's parser when argv names one
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = _build_parser(command if command in _CLI_COMMANDS else None)
     
     args = parser.parse_args()
     
     try:
-        if args.command == 'read':
+        if args.command == 'read' and args.paths:
+            if args.stream:
+                raise ValueError("--stream reads a single --path")
+            result = read_documents(args.paths, args.include_tables, args.workers)
+            _emit(result)
+            
+        elif args.command == 'read' and args.stream:
+            for record in read_document_stream(args.path, args.include_tables):
+                _emit(record, indent=False)
+            
+        elif args.command == 'read':
             result = read_document(args.path, args.include_tables)
-            print(json.dumps(result, indent=2))
+            _emit(result)
             
         elif args.command == 'edit_text':
-            result = edit_paragraph_text(args.path, args.paragraph_index, args.new_text)
-            print(json.dumps(result, indent=2))
+            result = edit_paragraph_text(args.path, args.paragraph_index, args.new_text, args.dry_run)
+            _emit(result)
             
         elif args.command == 'insert_paragraph':
-            result = insert_paragraph(args.path, args.position, args.text, args.style)
-            print(json.dumps(result, indent=2))
+            result = insert_paragraph(args.path, args.position, args.text, args.style, args.dry_run)
+            _emit(result)
+            
+        elif args.command == 'find_replace' and args.paths:
+            result = find_replace_files(args.paths, args.find, args.replace, args.workers, args.dry_run)
+            _emit(result)
             
         elif args.command == 'find_replace':
-            result = find_replace(args.path, args.find, args.replace)
-            print(json.dumps(result, indent=2))
+            result = find_replace(args.path, args.find, args.replace, args.dry_run)
+            _emit(result)
+            
+        elif args.command == 'find_replace_glob':
+            result = find_replace_glob(args.glob, args.find, args.replace, args.workers, args.dry_run)
+            _emit(result)
+            
+        elif args.command == 'find_replace_many':
+            result = find_replace_many(args.path, args.pairs, args.dry_run)
+            _emit(result)
             
         elif args.command == 'read_tables':
             result = read_tables(args.path, args.table_index)
-            print(json.dumps(result, indent=2))
+            _emit(result)
             
         elif args.command == 'edit_table_cell':
-            result = edit_table_cell(args.path, args.table_index, args.row, args.col, args.text)
-            print(json.dumps(result, indent=2))
+            result = edit_table_cell(args.path, args.table_index, args.row, args.col, args.text, args.dry_run)
+            _emit(result)
             
         elif args.command == 'create':
             result = create_document(args.path)
-            print(json.dumps(result, indent=2))
+            _emit(result)
             
         elif args.command == 'add_table':
-            result = add_table(args.path, args.rows, args.cols, args.position, args.data)
-            print(json.dumps(result, indent=2))
+            result = add_table(args.path, args.rows, args.cols, args.position, args.data, args.dry_run)
+            _emit(result)
             
         elif args.command == 'document_info':
-            result = document_info(args.path)
-            print(json.dumps(result, indent=2))
+            result = document_info(args.path, args.properties_only)
+            _emit(result)
+            
+        elif args.command == 'serve':
+            serve(defer_save=args.defer_save)
+            
+        elif args.command == 'batch':
+            result = batch(args.path, args.ops, args.dry_run)
+            _emit(result)
             
         else:
             parser.print_help()
@@ -607,7 +2478,8 @@ def main():
             "message": str(e),
             "type": type(e).__name__
         }
-        print(json.dumps(error_result, indent=2))
+        # Keep NDJSON output parseable line by line
+        _emit(error_result, indent=not getattr(args, 'stream', False))
         sys.exit(1)
 
 
@@ -0,0 +1,97 @@
+"""
+find_replace_many must give the same results whichever matching backend is
+installed: the pyahocorasick automaton or the regex alternation fallback.
+Single pairs go through _build_replacer, which must count every match.
+
+Run with: python -m unittest discover skills/docx/tests
+"""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import docx_engine  # noqa: E402
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Overlapping keys and keys that are prefixes or infixes of longer ones
+CASES = [
+    ({"Mr. Smith Jr": "Junior", "Smith": "Jones"}, "Signed: Mr. Smith"),
+    ({"baa": "Q", "a": "RR"}, "ccba"),
+    ({"abc": "X", "b": "Y"}, "ab"),
+    ({"abc": "X", "b": "Y"}, "abcab"),
+    ({"he": "1", "she": "2", "hers": "3", "his": "4"}, "ushers and his shes"),
+    ({"aa": "1", "a": "2", "aaa": "3"}, "aaaaaaa"),
+]
+
+
+def _random_cases(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        mapping = {}
+        while len(mapping) < 2:
+            key = "".join(rng.choice("ab") for _ in range(rng.randint(1, 4)))
+            mapping[key] = str(len(mapping))
+        yield mapping, "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+
+
+def _regex_replacer(mapping):
+    """Build the replacer as if pyahocorasick weren't installed"""
+    with mock.patch.dict(sys.modules, {"ahocorasick": None}):
+        return docx_engine._build_multi_replacer(mapping)
+
+
+@unittest.skipIf(ahocorasick is None, "pyahocorasick is not installed")
+class MultiReplacerBackendTest(unittest.TestCase):
+    
+    def test_replace_matches_regex_backend(self):
+        for mapping, text in CASES + list(_random_cases(2000)):
+            with self.subTest(mapping=mapping, text=text):
+                replace, _ = docx_engine._build_multi_replacer(mapping)
+                regex_replace, _ = _regex_replacer(mapping)
+                self.assertEqual(replace(text), regex_replace(text))
+    
+    def test_find_spans_matches_regex_backend(self):
+        # The spans edits that cross runs are spliced from
+        for mapping, text in CASES + list(_random_cases(2000)):
+            with self.subTest(mapping=mapping, text=text):
+                _, find_spans = docx_engine._build_multi_replacer(mapping)
+                _, regex_find_spans = _regex_replacer(mapping)
+                self.assertEqual(list(find_spans(text)), list(regex_find_spans(text)))
+    
+    def test_shorter_key_inside_pending_longer_key(self):
+        replace, find_spans = docx_engine._build_multi_replacer({"Mr. Smith Jr": "Junior", "Smith": "Jones"})
+        self.assertEqual(replace("Signed: Mr. Smith"), ("Signed: Mr. Jones", 1))
+        self.assertEqual(list(find_spans("Signed: Mr. Smith")), [(12, 17, "Jones")])
+
+
+class SinglePairReplacerTest(unittest.TestCase):
+    
+    def test_find_equals_replace_counts_matches(self):
+        # str.replace hands back the same string object here, as with no match
+        replace, _ = docx_engine._build_replacer("foo", "foo")
+        self.assertEqual(replace("foo bar foo"), ("foo bar foo", 2))
+        self.assertEqual(replace("bar"), ("bar", 0))
+    
+    def test_find_equals_replace_in_document(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "doc.docx")
+            docx_engine.create_document(path)
+            docx_engine.insert_paragraph(path, "end", "foo bar foo")
+            result = docx_engine.find_replace(path, "foo", "foo", dry_run=True)
+            self.assertEqual(result["replacements"], 2)
+            result = docx_engine.find_replace_many(path, {"foo": "foo"}, dry_run=True)
+            self.assertEqual(result["replacements"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
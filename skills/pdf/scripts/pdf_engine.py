@@ -8,19 +8,107 @@ import json
 import sys
 import argparse
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from io import BytesIO
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def get_pdf_info(path):
-    """Get PDF metadata and page count"""
+
+@lru_cache(maxsize=None)
+def _import_pymupdf():
+    """
+    Return the PyMuPDF module (imported as pymupdf or, on older releases, fitz), or None
+    
+    Cached: when PyMuPDF is missing, each failed import would search sys.path again.
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf
+        except ImportError:
+            return None
+    return pymupdf
+
+
+@lru_cache(maxsize=None)
+def _import_pypdfium2():
+    """Return the pypdfium2 module (PDFium bindings), or None when it isn't installed"""
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    return pypdfium2
+
+
+# Output files are written through a 1 MiB buffer; pypdf writes object by object
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _read_pdf(path):
+    """
+    Parse a PDF with pypdf from a single sequential read of the file
+    
+    pypdf copies a path argument into memory anyway; reading it here lets
+    the kernel know the access is sequential so readahead is sized for it.
+    """
     from pypdf import PdfReader
     
+    with open(path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return PdfReader(BytesIO(f.read()))
+
+
+@lru_cache(maxsize=32)
+def _open_reader(path_str, mtime_ns, size):
+    """Parse a PDF with pypdf; mtime_ns and size key the cache so a changed file is re-read"""
+    return _read_pdf(path_str)
+
+
+def _cached_reader(path):
+    """
+    Return a shared pypdf reader for a PDF, parsing it only once per process
+    
+    Only for read-only use: commands that modify reader pages in place
+    (rotate, add_watermark) or decrypt the reader open their own.
+    """
+    stat = os.stat(path)
+    return _open_reader(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def get_pdf_info(path):
+    """Get PDF metadata and page count"""
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    reader = PdfReader(str(path))
+    pymupdf = _import_pymupdf()
+    if pymupdf is not None:
+        # MuPDF reads the trailer and info dict in C, without pypdf's Python parse
+        with pymupdf.open(str(path)) as doc:
+            metadata = doc.metadata or {}
+            return {
+                "path": str(path),
+                "page_count": doc.page_count,
+                "file_size_bytes": path.stat().st_size,
+                "metadata": {
+                    "title": metadata.get("title") or None,
+                    "author": metadata.get("author") or None,
+                    "subject": metadata.get("subject") or None,
+                    "creator": metadata.get("creator") or None,
+                    "producer": metadata.get("producer") or None,
+                    "creation_date": str(metadata.get("creationDate") or None),
+                },
+                "is_encrypted": bool(metadata.get("encryption"))
+            }
+    
+    reader = _cached_reader(path)
     metadata = reader.metadata or {}
     
     return {
@@ -39,123 +127,434 @@ def get_pdf_info(path):
     }
 
 
+# One comma-separated part of a page range: "3" or "2-7"
+_PAGE_RANGE_PART = re.compile(r"(\d+)(?:-(\d+))?$")
+
+
 def parse_page_range(page_range_str, total_pages):
     """Parse page range string to list of page indices (0-based)"""
+    return list(_parse_page_range(page_range_str, total_pages))
+
+
+@lru_cache(maxsize=128)
+def _parse_page_range(page_range_str, total_pages):
+    """Cached parse_page_range, as a tuple so callers can't alter the cached value"""
     if not page_range_str:
-        return list(range(total_pages))
+        return tuple(range(total_pages))
+    
+    # Clamp each part to the document, then merge the spans in order; the
+    # pages themselves are only ever produced by C-level range() extends
+    spans = []
+    for part in page_range_str.replace(" ", "").split(","):
+        match = _PAGE_RANGE_PART.match(part)
+        if not match:
+            raise ValueError(f"Invalid page range: {part!r}")
+        
+        start = int(match.group(1)) - 1  # Convert to 0-based
+        end = int(match.group(2)) - 1 if match.group(2) else start
+        start = max(start, 0)
+        end = min(end, total_pages - 1)
+        if start <= end:
+            spans.append((start, end))
+    
+    spans.sort()
+    valid_pages = []
+    next_page = 0
+    for start, end in spans:
+        if end >= next_page:
+            valid_pages.extend(range(max(start, next_page), end + 1))
+            next_page = end + 1
+    return tuple(valid_pages)
+
+
+# Per-page commands use worker processes only from this many pages up
+_MIN_PARALLEL_PAGES = 4
+
+
+def _default_workers():
+    """Default worker count for per-page parallelism"""
+    return min(os.cpu_count() or 1, 4)
+
+
+def _split_pages(page_indices, num_workers):
+    """Split page indices into at most num_workers contiguous chunks"""
+    chunk_count = min(num_workers, len(page_indices))
+    chunk_size = -(-len(page_indices) // chunk_count)
+    return [page_indices[i:i + chunk_size] for i in range(0, len(page_indices), chunk_size)]
+
+
+# Process pool shared by every parallel page job in this process, created on first use
+_POOL = None
+_POOL_SIZE = 0
+
+
+def _worker_init():
+    """Import the PDF libraries once per worker process instead of in each job"""
+    import importlib
     
-    pages = set()
-    parts = page_range_str.replace(" ", "").split(",")
+    importlib.import_module("pypdf")
+    _import_pymupdf()
+    _import_pypdfium2()
+
+
+def _shutdown_pool():
+    """Stop the shared pool's workers"""
+    global _POOL, _POOL_SIZE
+    
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+        _POOL_SIZE = 0
+
+
+def _get_pool(num_workers):
+    """
+    Return the shared process pool with at least num_workers workers
+    
+    Worker start-up (interpreter plus PDF library imports) is paid once per
+    process rather than once per call, which matters when a long-lived
+    caller runs many commands through this module.
+    """
+    global _POOL, _POOL_SIZE
+    import atexit
+    import concurrent.futures
+    
+    if _POOL is not None and _POOL_SIZE >= num_workers:
+        return _POOL
+    
+    if _POOL is None:
+        atexit.register(_shutdown_pool)
+    else:
+        _POOL.shutdown(wait=True)
+    _POOL = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers, initializer=_worker_init)
+    _POOL_SIZE = num_workers
+    return _POOL
+
+
+def _iter_page_chunks(worker, path, chunks, chunk_args):
+    """
+    Run worker(path, chunk, *args) for each chunk of pages in worker processes
+    
+    Each worker reopens the PDF (parsed PDF objects can't be pickled) once
+    for its whole chunk. Results are yielded in page order, a chunk at a
+    time as each one finishes.
+    """
+    executor = _get_pool(len(chunks))
+    futures = [executor.submit(worker, str(path), chunk, *args) for chunk, args in zip(chunks, chunk_args)]
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        # A consumer that stops early shouldn't leave chunks queued in the shared pool
+        for future in futures:
+            future.cancel()
+
+
+def _map_page_chunks(worker, path, chunks, chunk_args):
+    """List the results of _iter_page_chunks"""
+    return list(_iter_page_chunks(worker, path, chunks, chunk_args))
+
+
+def _use_workers(page_indices, num_workers):
+    """Whether a per-page job is big enough to be worth worker processes"""
+    return num_workers > 1 and len(page_indices) >= _MIN_PARALLEL_PAGES
+
+
+def _open_for_text(path, method):
+    """Open a PDF with the library behind a read method, as a context manager"""
+    if method == "pymupdf":
+        return _import_pymupdf().open(str(path))
+    if method == "pdfplumber":
+        import pdfplumber
+        return pdfplumber.open(str(path))
+    if method == "pypdfium2":
+        import pypdfium2
+        from contextlib import closing
+        return closing(pypdfium2.PdfDocument(str(path)))
+    
+    from contextlib import nullcontext
+    return nullcontext(_cached_reader(path))
+
+
+def _page_cache_dir(path):
+    """
+    Directory of the persistent per-page cache for a PDF
+    
+    Keyed by the MD5 of the file's bytes, so an edited file gets a fresh
+    entry no matter its name or timestamps. Lives under $XDG_CACHE_HOME
+    (default ~/.cache)/pdf_engine.
+    """
+    import hashlib
+    
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "pdf_engine" / digest.hexdigest()
+
+
+def _cache_read(cache_dir, name):
+    """Read a cache entry, or None when it is missing or unreadable"""
+    try:
+        return (cache_dir / name).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _cache_write(cache_dir, name, data):
+    """Write a cache entry atomically; a cache that can't be written is skipped"""
+    import tempfile
     
-    for part in parts:
-        if "-" in part:
-            start, end = part.split("-", 1)
-            start = int(start) - 1  # Convert to 0-based
-            end = int(end) - 1
-            pages.update(range(start, end + 1))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_path, cache_dir / name)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass
+
+
+# Per-page fields read can return, in output order
+_TEXT_FIELDS = ("text", "char_count", "word_count", "line_count")
+_DEFAULT_TEXT_FIELDS = ("text", "char_count")
+
+
+def _iter_page_texts(pdf, page_indices, method):
+    """Yield the text of pages of a PDF opened by _open_for_text"""
+    for idx in page_indices:
+        if method == "pymupdf":
+            yield pdf[idx].get_text("text") or ""
+        elif method == "pypdfium2":
+            page = pdf[idx]
+            text_page = page.get_textpage()
+            try:
+                yield text_page.get_text_range() or ""
+            finally:
+                text_page.close()
+                page.close()
         else:
-            pages.add(int(part) - 1)
-    
-    # Filter valid pages and sort
-    valid_pages = sorted([p for p in pages if 0 <= p < total_pages])
-    return valid_pages
+            # pypdf and pdfplumber pages share extract_text()
+            yield pdf.pages[idx].extract_text() or ""
+
+
+def _page_texts_worker(path, page_indices, method):
+    """Worker-process entry point for read_pdf_text"""
+    with _open_for_text(path, method) as pdf:
+        return list(_iter_page_texts(pdf, page_indices, method))
+
 
+def _text_record(idx, text, fields):
+    """Build the read record for a page with the requested fields"""
+    record = {"page": idx + 1}
+    if "text" in fields:
+        record["text"] = text
+    if "char_count" in fields:
+        record["char_count"] = len(text)
+    if "word_count" in fields:
+        record["word_count"] = len(text.split())
+    if "line_count" in fields:
+        # Counting newlines in C avoids building the list splitlines() would
+        record["line_count"] = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+    return record
 
-def read_pdf_text(path, pages=None, method="pypdf"):
-    """Extract text from PDF pages"""
+
+def iter_pdf_text(path, pages=None, method="pymupdf", num_workers=None, fields=_DEFAULT_TEXT_FIELDS,
+                  force_refresh=False):
+    """Yield text records page by page, as read_pdf_text returns them"""
+    unknown = set(fields) - set(_TEXT_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))} (choose from {', '.join(_TEXT_FIELDS)})")
+    
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    if method == "pdfplumber":
-        import pdfplumber
-        
-        result = {"pages": []}
-        with pdfplumber.open(str(path)) as pdf:
-            page_indices = parse_page_range(pages, len(pdf.pages))
-            
-            for idx in page_indices:
-                page = pdf.pages[idx]
-                text = page.extract_text() or ""
-                result["pages"].append({
-                    "page": idx + 1,
-                    "text": text,
-                    "char_count": len(text)
-                })
+    if method == "pymupdf" and _import_pymupdf() is None:
+        method = "pypdf"
+    if num_workers is None:
+        num_workers = _default_workers()
+    
+    cache_dir = _page_cache_dir(path)
+    
+    with _open_for_text(path, method) as pdf:
+        if method == "pymupdf":
+            page_count = pdf.page_count
+        elif method == "pypdfium2":
+            page_count = len(pdf)
+        else:
+            page_count = len(pdf.pages)
+        page_indices = parse_page_range(pages, page_count)
         
-        return result
-    else:
-        # Default: pypdf
-        from pypdf import PdfReader
+        # Pages already in the cache are read back; only the rest are extracted
+        if force_refresh:
+            to_extract = list(page_indices)
+        else:
+            to_extract = [idx for idx in page_indices if not (cache_dir / f"{method}_p{idx}.txt").is_file()]
         
-        reader = PdfReader(str(path))
-        page_indices = parse_page_range(pages, len(reader.pages))
+        if _use_workers(to_extract, num_workers):
+            chunks = _split_pages(to_extract, num_workers)
+            extracted = _iter_page_chunks(_page_texts_worker, path, chunks, [(method,)] * len(chunks))
+        else:
+            extracted = _iter_page_texts(pdf, to_extract, method)
         
-        result = {"pages": []}
+        missing = set(to_extract)
         for idx in page_indices:
-            page = reader.pages[idx]
-            text = page.extract_text() or ""
-            result["pages"].append({
-                "page": idx + 1,
-                "text": text,
-                "char_count": len(text)
-            })
-        
-        return result
+            text = None if idx in missing else _cache_read(cache_dir, f"{method}_p{idx}.txt")
+            if text is None:
+                text = next(extracted) if idx in missing else next(_iter_page_texts(pdf, [idx], method))
+                _cache_write(cache_dir, f"{method}_p{idx}.txt", text)
+            yield _text_record(idx, text, fields)
 
 
-def extract_tables(path, pages=None):
-    """Extract tables from PDF pages using pdfplumber"""
+def read_pdf_text(path, pages=None, method="pymupdf", num_workers=None, fields=_DEFAULT_TEXT_FIELDS,
+                  force_refresh=False):
+    """Extract text from PDF pages (pymupdf falls back to pypdf when not installed)"""
+    return {"pages": list(iter_pdf_text(path, pages, method, num_workers, fields, force_refresh))}
+
+
+def _iter_page_tables(pdf, page_indices):
+    """Yield each page's tables from an open pdfplumber PDF, one list per page"""
+    for idx in page_indices:
+        yield pdf.pages[idx].extract_tables()
+
+
+def _page_tables_worker(path, page_indices):
+    """Worker-process entry point for extract_tables"""
+    import pdfplumber
+    
+    with pdfplumber.open(path) as pdf:
+        return list(_iter_page_tables(pdf, page_indices))
+
+
+def iter_pdf_tables(path, pages=None, num_workers=None, force_refresh=False):
+    """Yield table records page by page, as extract_tables returns them"""
     import pdfplumber
     
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    result = {"tables": []}
+    if num_workers is None:
+        num_workers = _default_workers()
+    
+    cache_dir = _page_cache_dir(path)
     
     with pdfplumber.open(str(path)) as pdf:
         page_indices = parse_page_range(pages, len(pdf.pages))
         
+        # Pages already in the cache are read back; only the rest are extracted
+        if force_refresh:
+            to_extract = list(page_indices)
+        else:
+            to_extract = [idx for idx in page_indices if not (cache_dir / f"tables_p{idx}.json").is_file()]
+        
+        if _use_workers(to_extract, num_workers):
+            chunks = _split_pages(to_extract, num_workers)
+            extracted = _iter_page_chunks(_page_tables_worker, path, chunks, [()] * len(chunks))
+        else:
+            extracted = _iter_page_tables(pdf, to_extract)
+        
+        missing = set(to_extract)
         for idx in page_indices:
-            page = pdf.pages[idx]
-            tables = page.extract_tables()
+            cached = None if idx in missing else _cache_read(cache_dir, f"tables_p{idx}.json")
+            if cached is not None:
+                tables = json.loads(cached)
+            else:
+                tables = next(extracted) if idx in missing else next(_iter_page_tables(pdf, [idx]))
+                _cache_write(cache_dir, f"tables_p{idx}.json", json.dumps(tables, ensure_ascii=False))
             
             for table_idx, table in enumerate(tables):
-                result["tables"].append({
+                yield {
                     "page": idx + 1,
                     "table_index": table_idx,
                     "rows": table
-                })
+                }
+
+
+def extract_tables(path, pages=None, num_workers=None, force_refresh=False):
+    """Extract tables from PDF pages using pdfplumber"""
+    return {"tables": list(iter_pdf_tables(path, pages, num_workers, force_refresh))}
+
+
+def _run_qpdf(args):
+    """Run qpdf with args and return its stdout, or None if qpdf isn't installed or fails"""
+    import subprocess
+    import shutil
+    
+    qpdf = shutil.which("qpdf")
+    if not qpdf:
+        return None
     
-    return result
+    result = subprocess.run([qpdf] + args, capture_output=True, text=True)
+    # Exit status 3 means success with warnings
+    if result.returncode not in (0, 3):
+        return None
+    return result.stdout
+
+
+def _qpdf_page_count(path):
+    """Page count read by qpdf, or None"""
+    output = _run_qpdf(["--show-npages", str(path)])
+    return int(output) if output and output.strip().isdigit() else None
+
+
+def _qpdf_page_spec(page_indices):
+    """Format sorted 0-based page indices as a qpdf page range (e.g. 1,3,5-7)"""
+    spans = []
+    for idx in page_indices:
+        if spans and spans[-1][1] == idx - 1:
+            spans[-1][1] = idx
+        else:
+            spans.append([idx, idx])
+    return ",".join(f"{start + 1}" if start == end else f"{start + 1}-{end + 1}" for start, end in spans)
 
 
 def merge_pdfs(output_path, input_paths):
-    """Merge multiple PDFs into one"""
+    """Merge multiple PDFs into one (with qpdf when installed, else pypdf)"""
     from pypdf import PdfWriter
     
     if len(input_paths) < 2:
         raise ValueError("At least 2 input files required for merge")
     
-    writer = PdfWriter()
-    total_pages = 0
-    
     for input_path in input_paths:
         path = Path(input_path)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
-        
-        writer.append(str(path))
-        # Count pages from this file
-        from pypdf import PdfReader
-        reader = PdfReader(str(path))
-        total_pages += len(reader.pages)
     
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "wb") as f:
+    # qpdf copies the page objects natively, without reserializing them in Python
+    if _run_qpdf(["--empty", "--pages"] + [str(p) for p in input_paths] + ["--", str(output_path)]) is not None:
+        total_pages = _qpdf_page_count(output_path)
+        if total_pages is None:
+            total_pages = len(_cached_reader(output_path).pages)
+        
+        return {
+            "status": "success",
+            "output_path": str(output_path),
+            "total_pages": total_pages,
+            "files_merged": len(input_paths)
+        }
+    
+    writer = PdfWriter()
+    total_pages = 0
+    
+    for input_path in input_paths:
+        path = Path(input_path)
+        # Append from the parsed reader so each input is only parsed once
+        reader = _cached_reader(path)
+        writer.append(reader)
+        total_pages += len(reader.pages)
+    
+    with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         writer.write(f)
     
     return {
@@ -166,9 +565,43 @@ def merge_pdfs(output_path, input_paths):
     }
 
 
-def split_pdf(path, output_dir, pages=None):
-    """Split PDF into individual pages or ranges"""
-    from pypdf import PdfReader, PdfWriter
+def _qpdf_split(path, output_dir, page_indices):
+    """
+    Split pages into one file each with qpdf --split-pages, or return None
+    
+    qpdf numbers its outputs by position with zero padding, so they are
+    written to a scratch directory and renamed to the split_pdf names.
+    """
+    import tempfile
+    import shutil
+    
+    if not page_indices:
+        return []
+    
+    scratch = Path(tempfile.mkdtemp(dir=output_dir))
+    try:
+        if _run_qpdf(["--split-pages=1", str(path), "--pages", str(path), _qpdf_page_spec(page_indices), "--",
+                      str(scratch / "page.pdf")]) is None:
+            return None
+        
+        # Zero padding makes name order page order
+        parts = sorted(scratch.iterdir())
+        if len(parts) != len(page_indices):
+            return None
+        
+        created_files = []
+        for idx, part in zip(page_indices, parts):
+            output_file = output_dir / f"{path.stem}_page_{idx + 1}.pdf"
+            os.replace(part, output_file)
+            created_files.append(str(output_file))
+        return created_files
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def iter_split_pdf(path, output_dir, pages=None):
+    """Split pages into one file each (PyMuPDF, then qpdf, then pypdf), yielding a record per file"""
+    from pypdf import PdfWriter
     
     path = Path(path)
     if not path.exists():
@@ -177,21 +610,49 @@ def split_pdf(path, output_dir, pages=None):
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    reader = PdfReader(str(path))
-    page_indices = parse_page_range(pages, len(reader.pages))
-    
-    created_files = []
     base_name = path.stem
     
+    pymupdf = _import_pymupdf()
+    if pymupdf is not None:
+        # insert_pdf copies each page's objects in native code from the one open source
+        with pymupdf.open(str(path)) as doc:
+            page_indices = parse_page_range(pages, doc.page_count)
+            
+            for idx in page_indices:
+                output_file = output_dir / f"{base_name}_page_{idx + 1}.pdf"
+                with pymupdf.open() as sub:
+                    sub.insert_pdf(doc, from_page=idx, to_page=idx)
+                    sub.save(str(output_file), garbage=4, deflate=True)
+                
+                yield {"page": idx + 1, "file": str(output_file)}
+        return
+    
+    page_count = _qpdf_page_count(path)
+    if page_count is not None:
+        page_indices = parse_page_range(pages, page_count)
+        qpdf_files = _qpdf_split(path, output_dir, page_indices)
+        if qpdf_files is not None:
+            for idx, output_file in zip(page_indices, qpdf_files):
+                yield {"page": idx + 1, "file": output_file}
+            return
+    
+    reader = _cached_reader(path)
+    page_indices = parse_page_range(pages, len(reader.pages))
+    
     for idx in page_indices:
         writer = PdfWriter()
         writer.add_page(reader.pages[idx])
         
         output_file = output_dir / f"{base_name}_page_{idx + 1}.pdf"
-        with open(output_file, "wb") as f:
+        with open(output_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
             writer.write(f)
         
-        created_files.append(str(output_file))
+        yield {"page": idx + 1, "file": str(output_file)}
+
+
+def split_pdf(path, output_dir, pages=None):
+    """Split PDF into individual pages or ranges"""
+    created_files = [record["file"] for record in iter_split_pdf(path, output_dir, pages)]
     
     return {
         "status": "success",
@@ -201,14 +662,36 @@ def split_pdf(path, output_dir, pages=None):
 
 
 def extract_pages(path, output_path, pages):
-    """Extract specific pages to a new PDF"""
-    from pypdf import PdfReader, PdfWriter
+    """Extract specific pages to a new PDF (with qpdf when installed, else pypdf)"""
+    from pypdf import PdfWriter
     
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    reader = PdfReader(str(path))
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # qpdf won't overwrite its own input, so extracting in place stays on pypdf
+    page_count = None
+    if not (output_path.exists() and output_path.samefile(path)):
+        page_count = _qpdf_page_count(path)
+    
+    if page_count is not None:
+        page_indices = parse_page_range(pages, page_count)
+        if not page_indices:
+            raise ValueError("No valid pages specified")
+        
+        if _run_qpdf([str(path), "--pages", str(path), _qpdf_page_spec(page_indices), "--",
+                      str(output_path)]) is not None:
+            return {
+                "status": "success",
+                "output_path": str(output_path),
+                "pages_extracted": len(page_indices),
+                "page_numbers": [i + 1 for i in page_indices]
+            }
+    
+    reader = _cached_reader(path)
     page_indices = parse_page_range(pages, len(reader.pages))
     
     if not page_indices:
@@ -218,10 +701,7 @@ def extract_pages(path, output_path, pages):
     for idx in page_indices:
         writer.add_page(reader.pages[idx])
     
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_path, "wb") as f:
+    with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         writer.write(f)
     
     return {
@@ -234,7 +714,7 @@ def extract_pages(path, output_path, pages):
 
 def rotate_pdf(path, degrees, pages=None, output_path=None):
     """Rotate pages in a PDF"""
-    from pypdf import PdfReader, PdfWriter
+    from pypdf import PdfWriter
     
     if degrees not in [90, 180, 270]:
         raise ValueError("Degrees must be 90, 180, or 270")
@@ -243,22 +723,21 @@ def rotate_pdf(path, degrees, pages=None, output_path=None):
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    reader = PdfReader(str(path))
+    reader = _read_pdf(path)
     page_indices = parse_page_range(pages, len(reader.pages))
     
-    writer = PdfWriter()
+    # Clone the whole document and only touch /Rotate on the selected pages
+    writer = PdfWriter(clone_from=reader)
     rotated_pages = []
     
-    for idx, page in enumerate(reader.pages):
-        if idx in page_indices:
-            page.rotate(degrees)
-            rotated_pages.append(idx + 1)
-        writer.add_page(page)
+    for idx in page_indices:
+        writer.pages[idx].rotate(degrees)
+        rotated_pages.append(idx + 1)
     
     output = Path(output_path) if output_path else path
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output, "wb") as f:
+    with open(output, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         writer.write(f)
     
     return {
@@ -269,58 +748,122 @@ def rotate_pdf(path, degrees, pages=None, output_path=None):
     }
 
 
-def add_watermark(path, text, output_path=None, opacity=0.3, position="diagonal"):
-    """Add text watermark to PDF pages"""
-    from pypdf import PdfReader, PdfWriter
+def _watermark_page(text, page_width, page_height, opacity, position):
+    """Render a one-page watermark PDF of the given size and return its parsed page"""
+    from pypdf import PdfReader
     from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
     from reportlab.lib.colors import Color
     
+    watermark_buffer = BytesIO()
+    c = canvas.Canvas(watermark_buffer, pagesize=(page_width, page_height))
+    
+    # Set watermark style
+    c.setFillColor(Color(0.5, 0.5, 0.5, alpha=opacity))
+    c.setFont("Helvetica", 40)
+    
+    if position == "diagonal":
+        c.saveState()
+        c.translate(page_width / 2, page_height / 2)
+        c.rotate(45)
+        c.drawCentredString(0, 0, text)
+        c.restoreState()
+    elif position == "center":
+        c.drawCentredString(page_width / 2, page_height / 2, text)
+    elif position == "bottom":
+        c.setFont("Helvetica", 20)
+        c.drawCentredString(page_width / 2, 30, text)
+    
+    c.save()
+    watermark_buffer.seek(0)
+    
+    return PdfReader(watermark_buffer).pages[0]
+
+
+def _watermark_form(writer, watermark_page, page_width, page_height):
+    """Register a watermark page in the writer as a Form XObject and return its reference"""
+    from pypdf.generic import ArrayObject, DecodedStreamObject, FloatObject, NameObject
+    
+    contents = watermark_page["/Contents"].get_object()
+    if isinstance(contents, ArrayObject):
+        data = b"\n".join(part.get_object().get_data() for part in contents)
+    else:
+        data = contents.get_data()
+    
+    form = DecodedStreamObject()
+    form.set_data(data)
+    form.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Form"),
+        NameObject("/BBox"): ArrayObject([FloatObject(0), FloatObject(0),
+                                          FloatObject(page_width), FloatObject(page_height)]),
+        NameObject("/Resources"): watermark_page["/Resources"].get_object().clone(writer),
+    })
+    return writer._add_object(form)
+
+
+def _content_stream_ref(writer, data):
+    """Register a small content stream in the writer and return its reference"""
+    from pypdf.generic import DecodedStreamObject
+    
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    return writer._add_object(stream)
+
+
+def add_watermark(path, text, output_path=None, opacity=0.3, position="diagonal"):
+    """Add text watermark to PDF pages"""
+    from pypdf import PdfWriter
+    from pypdf.generic import ArrayObject, DictionaryObject, NameObject
+    
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    reader = PdfReader(str(path))
-    writer = PdfWriter()
+    reader = _read_pdf(path)
+    writer = PdfWriter(clone_from=reader)
+    
+    # Each distinct page size gets one watermark Form XObject. Pages keep their
+    # own content streams untouched, wrapped in q/Q, and reference the form with
+    # a shared "Do" stream, so nothing is parsed or copied per page.
+    forms = {}
+    open_ref = _content_stream_ref(writer, b"q\n")
     
-    for page in reader.pages:
+    for page in writer.pages:
         # Get page dimensions
         page_width = float(page.mediabox.width)
         page_height = float(page.mediabox.height)
         
-        # Create watermark
-        watermark_buffer = BytesIO()
-        c = canvas.Canvas(watermark_buffer, pagesize=(page_width, page_height))
+        size_key = (round(page_width, 1), round(page_height, 1))
+        if size_key not in forms:
+            name = NameObject(f"/PdfEngineWatermark{len(forms)}")
+            watermark_page = _watermark_page(text, page_width, page_height, opacity, position)
+            form_ref = _watermark_form(writer, watermark_page, page_width, page_height)
+            # Undo any matrix the page set up, then draw the form in default user space
+            draw_ref = _content_stream_ref(writer, f"\nQ\nq {name} Do Q\n".encode("ascii"))
+            forms[size_key] = (name, form_ref, draw_ref)
+        name, form_ref, draw_ref = forms[size_key]
         
-        # Set watermark style
-        c.setFillColor(Color(0.5, 0.5, 0.5, alpha=opacity))
-        c.setFont("Helvetica", 40)
+        if "/Resources" not in page:
+            page[NameObject("/Resources")] = DictionaryObject()
+        resources = page["/Resources"].get_object()
+        if "/XObject" not in resources:
+            resources[NameObject("/XObject")] = DictionaryObject()
+        resources["/XObject"].get_object()[name] = form_ref
         
-        if position == "diagonal":
-            c.saveState()
-            c.translate(page_width / 2, page_height / 2)
-            c.rotate(45)
-            c.drawCentredString(0, 0, text)
-            c.restoreState()
-        elif position == "center":
-            c.drawCentredString(page_width / 2, page_height / 2, text)
-        elif position == "bottom":
-            c.setFont("Helvetica", 20)
-            c.drawCentredString(page_width / 2, 30, text)
-        
-        c.save()
-        watermark_buffer.seek(0)
-        
-        # Merge watermark with page
-        from pypdf import PdfReader as WatermarkReader
-        watermark_pdf = WatermarkReader(watermark_buffer)
-        page.merge_page(watermark_pdf.pages[0])
-        writer.add_page(page)
+        contents = ArrayObject([open_ref])
+        if "/Contents" in page:
+            original = page["/Contents"]
+            if isinstance(original.get_object(), ArrayObject):
+                contents.extend(original.get_object())
+            else:
+                contents.append(original)
+        contents.append(draw_ref)
+        page[NameObject("/Contents")] = contents
     
     output = Path(output_path) if output_path else path
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output, "wb") as f:
+    with open(output, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         writer.write(f)
     
     return {
@@ -331,95 +874,169 @@ def add_watermark(path, text, output_path=None, opacity=0.3, position="diagonal"
     }
 
 
-def extract_images(path, output_dir, pages=None):
-    """Extract images from PDF pages"""
-    from pypdf import PdfReader
-    from PIL import Image
-    
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-    
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+def _page_image_objects(page):
+    """Image XObjects of a pypdf page, in resource order"""
+    if "/XObject" not in page["/Resources"]:
+        return []
     
-    reader = PdfReader(str(path))
-    page_indices = parse_page_range(pages, len(reader.pages))
+    x_objects = page["/Resources"]["/XObject"].get_object()
+    return [x_objects[obj_name] for obj_name in x_objects if x_objects[obj_name]["/Subtype"] == "/Image"]
+
+
+def _iter_image_pages(reader, output_dir, page_indices, image_count=0):
+    """
+    Save the images of pages of a pypdf reader into output_dir, yielding a record per file
     
-    extracted_files = []
-    image_count = 0
+    image_count is the number of images on earlier pages, so file names
+    keep one numbering across the document when pages are split up.
+    """
+    from PIL import Image
     
     for idx in page_indices:
         page = reader.pages[idx]
         
-        if "/XObject" not in page["/Resources"]:
-            continue
-        
-        x_objects = page["/Resources"]["/XObject"].get_object()
-        
-        for obj_name in x_objects:
-            obj = x_objects[obj_name]
+        for obj in _page_image_objects(page):
+            image_count += 1
             
-            if obj["/Subtype"] == "/Image":
-                image_count += 1
-                
-                # Get image data
-                width = obj["/Width"]
-                height = obj["/Height"]
+            # Get image data
+            width = obj["/Width"]
+            height = obj["/Height"]
+            
+            try:
+                data = obj.get_data()
                 
-                try:
-                    data = obj.get_data()
+                # Determine format and save
+                if "/Filter" in obj:
+                    filter_type = obj["/Filter"]
                     
-                    # Determine format and save
-                    if "/Filter" in obj:
-                        filter_type = obj["/Filter"]
+                    if filter_type == "/DCTDecode":
+                        # JPEG
+                        ext = "jpg"
+                        output_file = output_dir / f"page{idx + 1}_img{image_count}.{ext}"
+                        with open(output_file, "wb") as f:
+                            f.write(data)
+                        yield {"page": idx + 1, "file": str(output_file)}
+                    elif filter_type == "/FlateDecode":
+                        # PNG/raw
+                        ext = "png"
+                        output_file = output_dir / f"page{idx + 1}_img{image_count}.{ext}"
                         
-                        if filter_type == "/DCTDecode":
-                            # JPEG
-                            ext = "jpg"
-                            output_file = output_dir / f"page{idx + 1}_img{image_count}.{ext}"
-                            with open(output_file, "wb") as f:
-                                f.write(data)
-                            extracted_files.append(str(output_file))
-                        elif filter_type == "/FlateDecode":
-                            # PNG/raw
-                            ext = "png"
-                            output_file = output_dir / f"page{idx + 1}_img{image_count}.{ext}"
-                            
-                            # Try to create image from raw data
-                            color_space = obj.get("/ColorSpace", "/DeviceRGB")
-                            if color_space == "/DeviceRGB":
-                                mode = "RGB"
-                            elif color_space == "/DeviceGray":
-                                mode = "L"
-                            else:
-                                mode = "RGB"
-                            
-                            try:
-                                img = Image.frombytes(mode, (width, height), data)
-                                img.save(output_file)
-                                extracted_files.append(str(output_file))
-                            except Exception:
-                                # Save raw data as fallback
-                                with open(output_file.with_suffix(".bin"), "wb") as f:
-                                    f.write(data)
-                                extracted_files.append(str(output_file.with_suffix(".bin")))
+                        # Try to create image from raw data
+                        color_space = obj.get("/ColorSpace", "/DeviceRGB")
+                        if color_space == "/DeviceRGB":
+                            mode = "RGB"
+                        elif color_space == "/DeviceGray":
+                            mode = "L"
                         else:
-                            # Other format - save raw
-                            output_file = output_dir / f"page{idx + 1}_img{image_count}.bin"
-                            with open(output_file, "wb") as f:
+                            mode = "RGB"
+                        
+                        try:
+                            img = Image.frombytes(mode, (width, height), data)
+                            img.save(output_file)
+                            yield {"page": idx + 1, "file": str(output_file)}
+                        except Exception:
+                            # Save raw data as fallback
+                            with open(output_file.with_suffix(".bin"), "wb") as f:
                                 f.write(data)
-                            extracted_files.append(str(output_file))
+                            yield {"page": idx + 1, "file": str(output_file.with_suffix(".bin"))}
                     else:
-                        # No filter - save raw
+                        # Other format - save raw
                         output_file = output_dir / f"page{idx + 1}_img{image_count}.bin"
                         with open(output_file, "wb") as f:
                             f.write(data)
-                        extracted_files.append(str(output_file))
-                        
-                except Exception as e:
-                    # Skip problematic images
-                    pass
+                        yield {"page": idx + 1, "file": str(output_file)}
+                else:
+                    # No filter - save raw
+                    output_file = output_dir / f"page{idx + 1}_img{image_count}.bin"
+                    with open(output_file, "wb") as f:
+                        f.write(data)
+                    yield {"page": idx + 1, "file": str(output_file)}
+                    
+            except Exception as e:
+                # Skip problematic images
+                pass
+
+
+def _image_pages_worker(path, page_indices, output_dir, image_count):
+    """Worker-process entry point for extract_images"""
+    return list(_iter_image_pages(_cached_reader(path), Path(output_dir), page_indices, image_count))
+
+
+def _iter_mupdf_image_pages(doc, output_dir, page_indices, image_count=0):
+    """Save the images of pages of a PyMuPDF document, numbered like _iter_image_pages"""
+    for idx in page_indices:
+        for image in doc.get_page_images(idx, full=True):
+            image_count += 1
+            
+            # extract_image returns the stored image already encoded, with its format
+            info = doc.extract_image(image[0])
+            if not info:
+                continue
+            
+            output_file = output_dir / f"page{idx + 1}_img{image_count}.{info['ext']}"
+            output_file.write_bytes(info["image"])
+            yield {"page": idx + 1, "file": str(output_file)}
+
+
+def _mupdf_image_pages_worker(path, page_indices, output_dir, image_count):
+    """Worker-process entry point for extract_images with PyMuPDF"""
+    with _import_pymupdf().open(path) as doc:
+        return list(_iter_mupdf_image_pages(doc, Path(output_dir), page_indices, image_count))
+
+
+def iter_extract_images(path, output_dir, pages=None, num_workers=None):
+    """Extract images from PDF pages (with PyMuPDF when installed, else pypdf), yielding a record per file"""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    if num_workers is None:
+        num_workers = _default_workers()
+    
+    pymupdf = _import_pymupdf()
+    if pymupdf is not None:
+        with pymupdf.open(str(path)) as doc:
+            page_indices = parse_page_range(pages, doc.page_count)
+            
+            if _use_workers(page_indices, num_workers):
+                chunks = _split_pages(page_indices, num_workers)
+                
+                # Each chunk starts numbering after the images of the chunks before it
+                chunk_args = []
+                image_count = 0
+                for chunk in chunks:
+                    chunk_args.append((str(output_dir), image_count))
+                    image_count += sum(len(doc.get_page_images(idx)) for idx in chunk)
+                
+                yield from _iter_page_chunks(_mupdf_image_pages_worker, path, chunks, chunk_args)
+            else:
+                yield from _iter_mupdf_image_pages(doc, output_dir, page_indices)
+    else:
+        reader = _cached_reader(path)
+        page_indices = parse_page_range(pages, len(reader.pages))
+        
+        if _use_workers(page_indices, num_workers):
+            chunks = _split_pages(page_indices, num_workers)
+            
+            # Each chunk starts numbering after the images of the chunks before it
+            chunk_args = []
+            image_count = 0
+            for chunk in chunks:
+                chunk_args.append((str(output_dir), image_count))
+                image_count += sum(len(_page_image_objects(reader.pages[idx])) for idx in chunk)
+            
+            yield from _iter_page_chunks(_image_pages_worker, path, chunks, chunk_args)
+        else:
+            yield from _iter_image_pages(reader, output_dir, page_indices)
+
+
+def extract_images(path, output_dir, pages=None, num_workers=None):
+    """Extract images from PDF pages"""
+    output_dir = Path(output_dir)
+    extracted_files = [record["file"] for record in iter_extract_images(path, output_dir, pages, num_workers)]
     
     return {
         "status": "success",
@@ -429,12 +1046,20 @@ def extract_images(path, output_dir, pages=None):
     }
 
 
+def _new_text_page(c, x, y):
+    """Start a text object at (x, y) in 12pt Helvetica with 14pt line spacing"""
+    text_object = c.beginText(x, y)
+    text_object.setFont("Helvetica", 12)
+    text_object.setLeading(14)
+    return text_object
+
+
 def create_pdf(output_path, text=None, images=None):
     """Create a new PDF from text or images"""
     from reportlab.pdfgen import canvas
     from reportlab.lib.pagesizes import letter
     from reportlab.lib.units import inch
-    from PIL import Image
+    from reportlab.lib.utils import ImageReader
     
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -446,21 +1071,19 @@ def create_pdf(output_path, text=None, images=None):
     
     # Add text if provided
     if text:
-        c.setFont("Helvetica", 12)
+        # One text object per page: lines become T* operators in a single
+        # BT/ET block instead of a positioned drawString call each
+        text_object = _new_text_page(c, inch, page_height - inch)
         
-        # Split text into lines
-        lines = text.split("\n")
-        y = page_height - inch
-        
-        for line in lines:
-            if y < inch:
+        for line in text.split("\n"):
+            if text_object.getY() < inch:
+                c.drawText(text_object)
                 c.showPage()
-                c.setFont("Helvetica", 12)
-                y = page_height - inch
+                text_object = _new_text_page(c, inch, page_height - inch)
             
-            c.drawString(inch, y, line)
-            y -= 14  # Line spacing
+            text_object.textLine(line)
         
+        c.drawText(text_object)
         content_added = True
     
     # Add images if provided
@@ -473,9 +1096,9 @@ def create_pdf(output_path, text=None, images=None):
             if content_added:
                 c.showPage()
             
-            # Get image dimensions
-            with Image.open(img_path) as img:
-                img_width, img_height = img.size
+            # One reader serves both the size lookup and drawImage, so the image is decoded once
+            image = ImageReader(str(img_path))
+            img_width, img_height = image.getSize()
             
             # Scale to fit page
             max_width = page_width - 2 * inch
@@ -489,7 +1112,7 @@ def create_pdf(output_path, text=None, images=None):
             x = (page_width - draw_width) / 2
             y = (page_height - draw_height) / 2
             
-            c.drawImage(str(img_path), x, y, draw_width, draw_height)
+            c.drawImage(image, x, y, draw_width, draw_height)
             content_added = True
     
     if not content_added:
@@ -508,24 +1131,21 @@ def create_pdf(output_path, text=None, images=None):
 
 def encrypt_pdf(path, password, output_path=None):
     """Add password protection to a PDF"""
-    from pypdf import PdfReader, PdfWriter
+    from pypdf import PdfWriter
     
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    reader = PdfReader(str(path))
-    writer = PdfWriter()
-    
-    for page in reader.pages:
-        writer.add_page(page)
+    reader = _read_pdf(path)
+    writer = PdfWriter(clone_from=reader)
     
     writer.encrypt(password)
     
     output = Path(output_path) if output_path else path
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output, "wb") as f:
+    with open(output, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         writer.write(f)
     
     return {
@@ -537,25 +1157,23 @@ def encrypt_pdf(path, password, output_path=None):
 
 def decrypt_pdf(path, password, output_path=None):
     """Remove password protection from a PDF"""
-    from pypdf import PdfReader, PdfWriter
+    from pypdf import PdfWriter
     
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
-    reader = PdfReader(str(path))
+    reader = _read_pdf(path)
     
     if reader.is_encrypted:
         reader.decrypt(password)
     
-    writer = PdfWriter()
-    for page in reader.pages:
-        writer.add_page(page)
+    writer = PdfWriter(clone_from=reader)
     
     output = Path(output_path) if output_path else path
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output, "wb") as f:
+    with open(output, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
         writer.write(f)
     
     return {
@@ -565,8 +1183,111 @@ def decrypt_pdf(path, password, output_path=None):
     }
 
 
-def pdf_to_images(path, output_dir, pages=None, format="png", dpi=150):
-    """Convert PDF pages to images using pdftoppm"""
+def _iter_render_pages(doc, output_dir, page_indices, format, dpi):
+    """Render pages of a PyMuPDF document to image files, yielding a record per file"""
+    pymupdf = _import_pymupdf()
+    matrix = pymupdf.Matrix(dpi / 72, dpi / 72)
+    
+    for idx in page_indices:
+        output_file = output_dir / f"page_{idx + 1}.{format}"
+        pixmap = doc[idx].get_pixmap(matrix=matrix, alpha=False)
+        pixmap.save(str(output_file))
+        yield {"page": idx + 1, "file": str(output_file)}
+
+
+def _render_pages_worker(path, page_indices, output_dir, format, dpi):
+    """Worker-process entry point for pdf_to_images with PyMuPDF"""
+    with _import_pymupdf().open(path) as doc:
+        return list(_iter_render_pages(doc, Path(output_dir), page_indices, format, dpi))
+
+
+def _iter_mupdf_to_images(path, output_dir, pages, format, dpi, num_workers):
+    """Render pages with PyMuPDF in-process (or one worker per chunk) from a single parse"""
+    if num_workers is None:
+        num_workers = _default_workers()
+    
+    with _import_pymupdf().open(str(path)) as doc:
+        page_indices = parse_page_range(pages, doc.page_count)
+        
+        if _use_workers(page_indices, num_workers):
+            chunks = _split_pages(page_indices, num_workers)
+            yield from _iter_page_chunks(_render_pages_worker, path, chunks,
+                                         [(str(output_dir), format, dpi)] * len(chunks))
+        else:
+            yield from _iter_render_pages(doc, output_dir, page_indices, format, dpi)
+
+
+def _iter_pdfium_render_pages(pdf, output_dir, page_indices, format, dpi):
+    """Render pages of a pypdfium2 document to image files, yielding a record per file"""
+    for idx in page_indices:
+        output_file = output_dir / f"page_{idx + 1}.{format}"
+        page = pdf[idx]
+        try:
+            page.render(scale=dpi / 72).to_pil().save(output_file)
+        finally:
+            page.close()
+        yield {"page": idx + 1, "file": str(output_file)}
+
+
+def _pdfium_render_pages_worker(path, page_indices, output_dir, format, dpi):
+    """Worker-process entry point for pdf_to_images with pypdfium2"""
+    pdf = _import_pypdfium2().PdfDocument(path)
+    try:
+        return list(_iter_pdfium_render_pages(pdf, Path(output_dir), page_indices, format, dpi))
+    finally:
+        pdf.close()
+
+
+def _iter_pdfium_to_images(path, output_dir, pages, format, dpi, num_workers):
+    """Render pages with PDFium through pypdfium2, in-process or one worker per chunk"""
+    if num_workers is None:
+        num_workers = _default_workers()
+    
+    pdf = _import_pypdfium2().PdfDocument(str(path))
+    try:
+        page_indices = parse_page_range(pages, len(pdf))
+        
+        if _use_workers(page_indices, num_workers):
+            chunks = _split_pages(page_indices, num_workers)
+            yield from _iter_page_chunks(_pdfium_render_pages_worker, path, chunks,
+                                         [(str(output_dir), format, dpi)] * len(chunks))
+        else:
+            yield from _iter_pdfium_render_pages(pdf, output_dir, page_indices, format, dpi)
+    finally:
+        pdf.close()
+
+
+def iter_pdf_to_images(path, output_dir, pages=None, format="png", dpi=150, num_workers=None):
+    """
+    Convert PDF pages to images, yielding a record per file as it is written
+    
+    PyMuPDF and pypdfium2 render page by page; the pdftoppm and pdf2image
+    fallbacks yield their files (or their error result) once they finish.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    if _import_pymupdf() is not None:
+        yield from _iter_mupdf_to_images(path, output_dir, pages, format, dpi, num_workers)
+        return
+    if _import_pypdfium2() is not None:
+        yield from _iter_pdfium_to_images(path, output_dir, pages, format, dpi, num_workers)
+        return
+    
+    result = pdf_to_images(path, output_dir, pages, format, dpi, num_workers)
+    if result["status"] != "success":
+        yield result
+        return
+    for output_file in result["created_files"]:
+        yield {"file": output_file}
+
+
+def pdf_to_images(path, output_dir, pages=None, format="png", dpi=150, num_workers=None):
+    """Convert PDF pages to images with PyMuPDF or pypdfium2, else pdftoppm or pdf2image"""
     import subprocess
     import shutil
     
@@ -577,14 +1298,35 @@ def pdf_to_images(path, output_dir, pages=None, format="png", dpi=150):
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    if _import_pymupdf() is not None:
+        created_files = [record["file"] for record in
+                         _iter_mupdf_to_images(path, output_dir, pages, format, dpi, num_workers)]
+        
+        return {
+            "status": "success",
+            "output_dir": str(output_dir),
+            "created_files": created_files,
+            "method": "pymupdf"
+        }
+    
+    if _import_pypdfium2() is not None:
+        created_files = [record["file"] for record in
+                         _iter_pdfium_to_images(path, output_dir, pages, format, dpi, num_workers)]
+        
+        return {
+            "status": "success",
+            "output_dir": str(output_dir),
+            "created_files": created_files,
+            "method": "pypdfium2"
+        }
+    
     # Check if pdftoppm is available
     if not shutil.which("pdftoppm"):
         # Fallback: use pdf2image if available
         try:
             from pdf2image import convert_from_path
             
-            from pypdf import PdfReader
-            reader = PdfReader(str(path))
+            reader = _cached_reader(path)
             page_indices = parse_page_range(pages, len(reader.pages))
             
             # pdf2image uses 1-based indexing
@@ -608,7 +1350,7 @@ def pdf_to_images(path, output_dir, pages=None, format="png", dpi=150):
         except ImportError:
             return {
                 "status": "error",
-                "message": "pdftoppm not found. Install poppler-utils or pip install pdf2image",
+                "message": "No renderer found. pip install pymupdf or pypdfium2, or install poppler-utils or pdf2image",
                 "type": "DependencyError"
             }
     
@@ -626,8 +1368,7 @@ def pdf_to_images(path, output_dir, pages=None, format="png", dpi=150):
     
     # Handle page range
     if pages:
-        from pypdf import PdfReader
-        reader = PdfReader(str(path))
+        reader = _cached_reader(path)
         page_indices = parse_page_range(pages, len(reader.pages))
         if page_indices:
             cmd.extend(["-f", str(min(page_indices) + 1)])
@@ -656,6 +1397,38 @@ def pdf_to_images(path, output_dir, pages=None, format="png", dpi=150):
     }
 
 
+def _dumps(obj, indent=True):
+    """
+    Serialize a result as a newline-terminated line of JSON bytes
+    
+    Uses orjson when it is installed; the stdlib fallback writes the same
+    bytes (raw UTF-8, and orjson's compact separators when not indenting).
+    Values of other types are written as their str().
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str)
+    return (text + '\n').encode('utf-8')
+
+
+def _emit(obj, indent=True):
+    """Write a result to stdout as JSON; indent=False writes a single NDJSON line"""
+    sys.stdout.buffer.write(_dumps(obj, indent))
+
+
+def _emit_stream(records):
+    """Write records as NDJSON, flushing each line so consumers see progress as it happens"""
+    for record in records:
+        _emit(record, indent=False)
+        sys.stdout.buffer.flush()
+
+
 def main():
     """CLI interface for pdf_engine"""
     parser = argparse.ArgumentParser(description='PDF file manipulation engine')
@@ -669,13 +1442,25 @@ def main():
     read_parser = subparsers.add_parser('read', help='Extract text from PDF')
     read_parser.add_argument('--path', required=True, help='Path to PDF file')
     read_parser.add_argument('--pages', default=None, help='Page range (e.g., "1-5", "1,3,5")')
-    read_parser.add_argument('--method', default='pypdf', choices=['pypdf', 'pdfplumber'], 
+    read_parser.add_argument('--method', default='pymupdf', choices=['pymupdf', 'pypdf', 'pdfplumber', 'pypdfium2'], 
                             help='Extraction method')
+    read_parser.add_argument('--workers', type=int, default=None, help='Worker processes for per-page work (default: min(CPUs, 4))')
+    read_parser.add_argument('--fields', default=','.join(_DEFAULT_TEXT_FIELDS),
+                            help=f"Comma-separated per-page fields from {', '.join(_TEXT_FIELDS)} (default: text,char_count)")
+    read_parser.add_argument('--force-refresh', action='store_true',
+                            help='Re-extract every page instead of using the page cache')
+    read_parser.add_argument('--stream', '--jsonl', action='store_true',
+                            help='Write one JSON line per page as soon as it is extracted instead of one document')
     
     # Extract tables command
     tables_parser = subparsers.add_parser('extract_tables', help='Extract tables from PDF')
     tables_parser.add_argument('--path', required=True, help='Path to PDF file')
     tables_parser.add_argument('--pages', default=None, help='Page range')
+    tables_parser.add_argument('--force-refresh', action='store_true',
+                              help='Re-extract every page instead of using the page cache')
+    tables_parser.add_argument('--workers', type=int, default=None, help='Worker processes for per-page work (default: min(CPUs, 4))')
+    tables_parser.add_argument('--stream', action='store_true',
+                              help='Write one JSON line per table as soon as it is extracted instead of one document')
     
     # Merge command
     merge_parser = subparsers.add_parser('merge', help='Merge PDFs')
@@ -687,6 +1472,8 @@ def main():
     split_parser.add_argument('--path', required=True, help='Path to PDF file')
     split_parser.add_argument('--output-dir', required=True, help='Output directory')
     split_parser.add_argument('--pages', default=None, help='Page range')
+    split_parser.add_argument('--stream', action='store_true',
+                             help='Write one JSON line per file as soon as it is written instead of one document')
     
     # Extract pages command
     extract_parser = subparsers.add_parser('extract_pages', help='Extract specific pages')
@@ -716,6 +1503,9 @@ def main():
     images_parser.add_argument('--path', required=True, help='Path to PDF file')
     images_parser.add_argument('--output-dir', required=True, help='Output directory')
     images_parser.add_argument('--pages', default=None, help='Page range')
+    images_parser.add_argument('--workers', type=int, default=None, help='Worker processes for per-page work (default: min(CPUs, 4))')
+    images_parser.add_argument('--stream', action='store_true',
+                              help='Write one JSON line per file as soon as it is written instead of one document')
     
     # Create command
     create_parser = subparsers.add_parser('create', help='Create new PDF')
@@ -742,19 +1532,34 @@ def main():
     to_images_parser.add_argument('--pages', default=None, help='Page range')
     to_images_parser.add_argument('--format', default='png', choices=['png', 'jpg'], help='Image format')
     to_images_parser.add_argument('--dpi', type=int, default=150, help='Resolution')
+    to_images_parser.add_argument('--workers', type=int, default=None, help='Worker processes for per-page work (default: min(CPUs, 4))')
+    to_images_parser.add_argument('--stream', action='store_true',
+                                 help='Write one JSON line per file as soon as it is written instead of one document')
     
     args = parser.parse_args()
+    stream = getattr(args, 'stream', False)
     
     try:
         if args.command == 'info':
             result = get_pdf_info(args.path)
         elif args.command == 'read':
-            result = read_pdf_text(args.path, args.pages, args.method)
+            fields = tuple(field for field in args.fields.replace(" ", "").split(",") if field)
+            if stream:
+                _emit_stream(iter_pdf_text(args.path, args.pages, args.method, args.workers, fields,
+                                           args.force_refresh))
+                return
+            result = read_pdf_text(args.path, args.pages, args.method, args.workers, fields, args.force_refresh)
         elif args.command == 'extract_tables':
-            result = extract_tables(args.path, args.pages)
+            if stream:
+                _emit_stream(iter_pdf_tables(args.path, args.pages, args.workers, args.force_refresh))
+                return
+            result = extract_tables(args.path, args.pages, args.workers, args.force_refresh)
         elif args.command == 'merge':
             result = merge_pdfs(args.output, args.inputs)
         elif args.command == 'split':
+            if stream:
+                _emit_stream(iter_split_pdf(args.path, args.output_dir, args.pages))
+                return
             result = split_pdf(args.path, args.output_dir, args.pages)
         elif args.command == 'extract_pages':
             result = extract_pages(args.path, args.output, args.pages)
@@ -763,7 +1568,10 @@ def main():
         elif args.command == 'add_watermark':
             result = add_watermark(args.path, args.text, args.output, args.opacity, args.position)
         elif args.command == 'extract_images':
-            result = extract_images(args.path, args.output_dir, args.pages)
+            if stream:
+                _emit_stream(iter_extract_images(args.path, args.output_dir, args.pages, args.workers))
+                return
+            result = extract_images(args.path, args.output_dir, args.pages, args.workers)
         elif args.command == 'create':
             result = create_pdf(args.output, args.text, args.images)
         elif args.command == 'encrypt':
@@ -771,12 +1579,16 @@ def main():
         elif args.command == 'decrypt':
             result = decrypt_pdf(args.path, args.password, args.output)
         elif args.command == 'to_images':
-            result = pdf_to_images(args.path, args.output_dir, args.pages, args.format, args.dpi)
+            if stream:
+                _emit_stream(iter_pdf_to_images(args.path, args.output_dir, args.pages, args.format, args.dpi,
+                                                args.workers))
+                return
+            result = pdf_to_images(args.path, args.output_dir, args.pages, args.format, args.dpi, args.workers)
         else:
             parser.print_help()
             sys.exit(1)
         
-        print(json.dumps(result, indent=2, default=str))
+        _emit(result)
         
     except Exception as e:
         error_result = {
@@ -784,7 +1596,7 @@ def main():
             "message": str(e),
             "type": type(e).__name__
         }
-        print(json.dumps(error_result, indent=2))
+        _emit(error_result, indent=not stream)
         sys.exit(1)
 
 
@@ -4,13 +4,365 @@ PPTX Engine - Core utilities for PowerPoint file manipulation
 Provides safe loading, saving, reading, editing, and slide management
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
+import contextlib
+import io
 import json
+import mmap
+import os
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+}
+_A_BR = "{%s}br" % _NS["a"]
+# Paragraphs of a p:sp text body, and the runs, line breaks and fields that
+# make up a paragraph's text, in document order (as python-pptx's _Paragraph.text)
+_SHAPE_PARAGRAPHS = "./p:txBody/a:p"
+_PARAGRAPH_CONTENT = "./a:r/a:t | ./a:br | ./a:fld/a:t"
+# Top-level picture shapes with an embedded image, as python-pptx yields them
+# from slide.shapes (movies have no image)
+_SLIDE_PICTURE_RIDS = (
+    "/p:sld/p:cSld/p:spTree/p:pic[not(p:nvPicPr/p:nvPr/a:videoFile)]"
+    "/p:blipFill/a:blip/@r:embed"
+)
+# p:ph of each top-level placeholder shape, in document order (python-pptx's
+# iter_ph_elms), and of just the p:sp ones, the placeholders with a text frame
+_PLACEHOLDERS = "./p:cSld/p:spTree/*/*[1]/p:nvPr/p:ph"
+_TEXT_PLACEHOLDERS = "./p:cSld/p:spTree/p:sp/p:nvSpPr/p:nvPr/p:ph"
+# Top-level title and center-title placeholder shapes
+_TITLE_PLACEHOLDER_SP = (
+    "./p:cSld/p:spTree/p:sp[p:nvSpPr/p:nvPr/p:ph[@type='title' or @type='ctrTitle']]"
+)
+_P_CNVPR = "{%s}cNvPr" % _NS["p"]
+_P_SP = "{%s}sp" % _NS["p"]
+# A shape's name, as shape.name reads it without a compiled XPath
+_SHAPE_NAME = "string(./*[1]/p:cNvPr/@name)"
+
+# python-pptx (and lxml under it) is imported on first use, so --help and
+# argument errors don't pay for it
+_Presentation = None
+
+
+@lru_cache(maxsize=None)
+def _xpath(expr):
+    """Compile an XPath over the a:/p:/r: namespaces once"""
+    from lxml import etree
+    return etree.XPath(expr, namespaces=_NS)
+
+
+def _configure_oxml_parser():
+    """
+    Swap python-pptx's module-level lxml parser for a leaner configuration
+    
+    The replacement keeps python-pptx's custom element class lookup, so every
+    part still parses into the same oxml element classes. It only skips xml:id
+    bookkeeping and lifts lxml's depth/size limits for very large decks.
+    """
+    from lxml import etree
+    import pptx.oxml as oxml
+    import pptx.oxml.xmlchemy as xmlchemy
+    
+    parser = etree.XMLParser(
+        remove_blank_text=True,
+        resolve_entities=False,
+        huge_tree=True,
+        collect_ids=False,
+    )
+    parser.set_element_class_lookup(oxml.element_class_lookup)
+    # parse_xml() reads the module global at call time, xmlchemy holds its own reference
+    oxml.oxml_parser = parser
+    xmlchemy.oxml_parser = parser
+
+
+def _get_pres():
+    """Return python-pptx's Presentation, importing and configuring it on first use"""
+    global _Presentation
+    if _Presentation is None:
+        _configure_oxml_parser()
+        from pptx import Presentation
+        _Presentation = Presentation
+    return _Presentation
+
+
+# Presentations held open by `serve`, keyed by resolved path:
+# [(mtime_ns, size), Presentation, dirty]. None outside serve mode.
+_PRS_CACHE = None
+
+
+class _MappedFile(mmap.mmap):
+    """
+    Read-only memory map of a file that ZipFile can read like a file
+    
+    Zip members are copied straight out of the page cache instead of going
+    through a read() call each, and the archive itself never lands on the
+    heap. zipfile needs seekable(), and an OSError rather than mmap's
+    ValueError from seeking before the start of a too-short file.
+    """
+    
+    def seekable(self):
+        return True
+    
+    def seek(self, pos, whence=0):
+        try:
+            return super().seek(pos, whence)
+        except ValueError as e:
+            raise OSError(str(e)) from e
+
+
+def _map_file(path):
+    """Memory-map a regular file read-only as a _MappedFile"""
+    from zipfile import BadZipFile
+    
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file; report it as the zip it isn't
+            raise BadZipFile("File is not a zip file")
+        return _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _open_presentation(path):
+    """
+    Parse a .pptx file into a Presentation, wrapping parse errors
+    
+    Opening the file is the existence check, so no separate stat is made.
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        Exception: If the file is not a valid PowerPoint file
+    """
+    try:
+        mapped = _map_file(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+    except IsADirectoryError:
+        mapped = None
+    except Exception as e:
+        raise Exception(f"Invalid PowerPoint file format: {path}. Error: {e}") from e
+    
+    try:
+        if mapped is None:
+            # A directory holding an unzipped package
+            return _get_pres()(path)
+        with mapped:
+            # python-pptx reads every part while loading, so the mapping
+            # can go as soon as the Presentation exists
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_WILLNEED)
+            return _get_pres()(mapped)
+    except Exception as e:
+        raise Exception(f"Invalid PowerPoint file format: {path}. Error: {e}") from e
+
+
+# Part extensions whose data is already compressed; deflating them again
+# costs most of a save's time on image-heavy decks and saves ~nothing
+_STORED_EXTS = frozenset(("png", "jpg", "jpeg", "gif", "mp3", "m4a", "mp4", "m4v", "mov"))
+# zlib level for the deflated members of saved files; None is zipfile's
+# default (6). Set to 1 by --fast-save.
+_SAVE_COMPRESSLEVEL = None
+
+
+def _save_package(prs, path):
+    """
+    Write a Presentation's package like prs.save, storing media uncompressed
+    
+    Mirrors python-pptx's PackageWriter: content types, package rels, then
+    each part followed by its rels. Parts in _STORED_EXTS are written with
+    ZIP_STORED and everything else is deflated at _SAVE_COMPRESSLEVEL.
+    
+    Args:
+        prs: Presentation to write
+        path: Destination .pptx path
+    """
+    from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+    from pptx.opc.serialized import _ContentTypesItem
+    
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    
+    with ZipFile(path, 'w', compression=ZIP_DEFLATED, compresslevel=_SAVE_COMPRESSLEVEL,
+                 strict_timestamps=False) as zf:
+        zf.writestr(CONTENT_TYPES_URI.membername,
+                    serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        zf.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            partname = part.partname
+            if partname.ext.lower() in _STORED_EXTS:
+                zf.writestr(partname.membername, part.blob, compress_type=ZIP_STORED)
+            else:
+                zf.writestr(partname.membername, part.blob)
+            if part._rels:
+                zf.writestr(partname.rels_uri.membername, part.rels.xml)
+
+
+def _write_presentation(prs, path):
+    """Write a Presentation to disk, creating the parent directory"""
+    try:
+        # Create parent directory if it doesn't exist
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        _save_package(prs, path)
+    except Exception as e:
+        raise Exception(f"Error saving presentation: {e}") from e
+
+
+def _member_data_offset(data, info):
+    """Return the offset of a zip member's data in the mapped zip `data`"""
+    # Local header: 30 fixed bytes, then the name and extra field
+    offset = info.header_offset
+    name_len = int.from_bytes(data[offset + 26:offset + 28], "little")
+    extra_len = int.from_bytes(data[offset + 28:offset + 30], "little")
+    return offset + 30 + name_len + extra_len
+
+
+def _copy_zip_replacing(source_path, path, blobs):
+    """
+    Write a copy of a zip with some members replaced, the rest copied raw
+    
+    Unchanged members are copied still compressed, header and data, so
+    nothing but the replaced members is serialized or deflated. zipfile has
+    no raw-copy API; the copy appends to the writer's file and member list
+    the way ZipFile.writestr does. The output is written next to `path` and
+    moved into place, so `path` may be `source_path`.
+    
+    Args:
+        source_path: Zip to copy
+        path: Destination path
+        blobs: {member name: bytes} of the members to replace
+    """
+    import copy
+    import shutil
+    import tempfile
+    from zipfile import ZipFile, ZIP_DEFLATED
+    
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=parent or ".", suffix=".tmp")
+    
+    try:
+        with _map_file(source_path) as src, ZipFile(src) as zin, \
+                os.fdopen(fd, "wb") as out, ZipFile(out, "w") as zout:
+            for info in zin.infolist():
+                blob = blobs.get(info.filename)
+                if blob is not None:
+                    zout.writestr(info.filename, blob, compress_type=ZIP_DEFLATED,
+                                  compresslevel=_SAVE_COMPRESSLEVEL)
+                    continue
+                
+                start = _member_data_offset(src, info)
+                member = copy.copy(info)
+                # Sizes go in the new local header, so no data descriptor follows
+                member.flag_bits &= ~0x08
+                member.header_offset = out.tell()
+                out.write(member.FileHeader())
+                out.write(src[start:start + info.compress_size])
+                zout.filelist.append(member)
+                zout.NameToInfo[member.filename] = member
+                zout.start_dir = out.tell()
+        # mkstemp creates the file 0600; give it the source's permissions
+        shutil.copymode(source_path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _save_changed_parts(prs, source_path, path, parts):
+    """
+    Save a Presentation loaded from source_path whose only changes are to
+    the XML of `parts`, rewriting just those members of the package
+    
+    A full save walks every part and relationship and re-serializes and
+    deflates all of them. Here the other members are copied as they are.
+    Slide parts are written under their names in source_path, which
+    python-pptx may have renumbered in memory when the deck was loaded.
+    
+    Args:
+        prs: Presentation loaded from source_path
+        source_path: Path the presentation was loaded from
+        path: Path to save the .pptx file
+        parts: Parts whose XML changed; no parts or relationships were added
+    """
+    try:
+        with _open_package_zip(source_path) as zf:
+            slide_partnames = _zip_presentation(zf, source_path)[1]
+        original_names = {
+            slide.part: partname for slide, partname in zip(prs.slides, slide_partnames)
+        }
+        blobs = {
+            original_names.get(part, part.partname).membername: part.blob
+            for part in parts
+        }
+        _copy_zip_replacing(source_path, path, blobs)
+    except Exception as e:
+        raise Exception(f"Error saving presentation: {e}") from e
+
+
+def _get_prs(path):
+    """
+    Return the served Presentation for a path, reparsing only when needed
+    
+    A presentation with uncommitted edits is always returned as is. Otherwise
+    the cached object is reused while the file's mtime and size are unchanged;
+    the size catches a rewrite within one tick of a coarse filesystem clock.
+    
+    Args:
+        path: Path to the .pptx file
+        
+    Returns:
+        Presentation object
+    """
+    key = os.path.realpath(path)
+    entry = _PRS_CACHE.get(key)
+    if entry is not None and entry[2]:
+        return entry[1]
+    
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+    stamp = (st.st_mtime_ns, st.st_size)
+    if entry is None or entry[0] != stamp:
+        entry = _PRS_CACHE[key] = [stamp, _open_presentation(path), False]
+    return entry[1]
+
+
+def _commit_presentations():
+    """
+    Write every served presentation that has uncommitted edits
+    
+    Returns:
+        dict: Status and the list of saved paths
+    """
+    saved = []
+    for key, entry in _PRS_CACHE.items():
+        if entry[2]:
+            _write_presentation(entry[1], key)
+            st = os.stat(key)
+            entry[0] = (st.st_mtime_ns, st.st_size)
+            entry[2] = False
+            saved.append(key)
+    
+    return {
+        "status": "success",
+        "saved": saved,
+        "count": len(saved)
+    }
+
 
 def load_presentation_safe(path):
     """
@@ -26,57 +378,496 @@ def load_presentation_safe(path):
         FileNotFoundError: If the file doesn't exist
         Exception: If the file is not a valid PowerPoint file
     """
-    path = Path(path)
+    path = os.fspath(path)
     
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    if _PRS_CACHE is not None:
+        return _get_prs(path)
     
-    try:
-        prs = Presentation(str(path))
-        return prs
-    except Exception as e:
-        raise Exception(f"Invalid PowerPoint file format: {path}. Error: {e}") from e
+    return _open_presentation(path)
 
 
-def save_presentation_safe(prs, path):
+def save_presentation_safe(prs, path, source_path=None):
     """
     Safely save a PowerPoint presentation with error handling
     
+    In serve mode the presentation is only marked dirty; it is written when
+    the client sends a commit.
+    
     Args:
-        prs: Presentation object
+        prs: Presentation object, or None to copy source_path unchanged
         path: Path to save the .pptx file
+        source_path: File to copy when prs is None. The copy is a plain file
+                     copy (os.sendfile on Linux) made immediately, with no
+                     re-serialization.
         
     Raises:
         Exception: If saving fails
     """
+    if prs is None:
+        import shutil
+        try:
+            if os.path.exists(path) and os.path.samefile(path, source_path):
+                return
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            shutil.copyfile(source_path, path)
+        except Exception as e:
+            raise Exception(f"Error saving presentation: {e}") from e
+        return
+    
+    if _PRS_CACHE is not None:
+        _PRS_CACHE[os.path.realpath(path)] = [None, prs, True]
+        return
+    
+    _write_presentation(prs, path)
+
+
+# EMUs per unit for read --units; EMU values are passed through as ints
+_EMU_PER_UNIT = {"emu": None, "in": 914400, "pt": 12700}
+
+
+def _convert_emu(value, units):
+    """Convert an EMU length to `units` ("emu", "in" or "pt"); None stays None"""
+    per_unit = _EMU_PER_UNIT[units]
+    if value is None or per_unit is None:
+        return value
+    return value / per_unit
+
+
+# The transform of a shape (a:xfrm in its spPr or grpSpPr) or graphic frame
+# (p:xfrm), and a shape's p:ph if it is a placeholder
+_SHAPE_XFRM = "./p:spPr/a:xfrm | ./p:grpSpPr/a:xfrm | ./p:xfrm"
+_SHAPE_PH = "./*[1]/p:nvPr/p:ph"
+# Placeholder shapes python-pptx gives layout-inherited positions and sizes
+_INHERITS_GEOMETRY = frozenset((_P_SP, "{%s}pic" % _NS["p"]))
+
+# Inherited [left, top, width, height] by layout part, then placeholder idx
+_LAYOUT_GEOMETRY_CACHE = None
+
+
+def _layout_placeholder_geometry(layout, idx):
+    """
+    Return [left, top, width, height] of a layout's placeholder with `idx`,
+    or None if it has none, resolving each placeholder once per layout
+    """
+    import weakref
+    
+    global _LAYOUT_GEOMETRY_CACHE
+    if _LAYOUT_GEOMETRY_CACHE is None:
+        _LAYOUT_GEOMETRY_CACHE = weakref.WeakKeyDictionary()
+    
+    by_idx = _LAYOUT_GEOMETRY_CACHE.get(layout.part)
+    if by_idx is None:
+        by_idx = _LAYOUT_GEOMETRY_CACHE[layout.part] = {}
+    if idx not in by_idx:
+        base = layout.placeholders.get(idx=idx)
+        by_idx[idx] = None if base is None else [base.left, base.top, base.width, base.height]
+    return by_idx[idx]
+
+
+def _shape_geometry(shape_elm, slide):
+    """
+    Return [left, top, width, height] in EMU, as python-pptx reports them
+    
+    shape.left/top/width/height each look up the a:xfrm again, and on a
+    placeholder each missing value walks the layout's placeholders to find
+    the one it inherits from. Here the xfrm is found with one compiled XPath
+    and inherited values come from _layout_placeholder_geometry.
+    
+    Args:
+        shape_elm: Shape element in the slide's shape tree
+        slide: Slide the shape is on
+    """
+    xfrms = _xpath(_SHAPE_XFRM)(shape_elm)
+    if xfrms:
+        xfrm = xfrms[0]
+        geometry = [xfrm.x, xfrm.y, xfrm.cx, xfrm.cy]
+    else:
+        geometry = [None, None, None, None]
+    
+    if None in geometry and shape_elm.tag in _INHERITS_GEOMETRY:
+        ph = _xpath(_SHAPE_PH)(shape_elm)
+        if ph:
+            inherited = _layout_placeholder_geometry(slide.slide_layout, int(ph[0].get("idx", 0)))
+            if inherited is not None:
+                geometry = [
+                    value if value is not None else base_value
+                    for value, base_value in zip(geometry, inherited)
+                ]
+    
+    return geometry
+
+
+@lru_cache(maxsize=None)
+def _shape_type_names():
+    """Return {MSO_SHAPE_TYPE member: name}, built on first use"""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+    return {member: member.name for member in MSO_SHAPE_TYPE}
+
+
+def _extract_slide(idx, slide, units="emu"):
+    """
+    Build the read_presentation record for one slide
+    
+    Args:
+        idx: 0-based slide index
+        slide: Slide object
+        units: Unit for position and size: "emu", "in" or "pt"
+        
+    Returns:
+        dict: Slide number, shapes and notes
+    """
+    slide_data = {
+        "slide_number": idx + 1,
+        "shapes": []
+    }
+    
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+    from pptx.shapes.shapetree import SlideShapeFactory
+    
+    shape_paragraphs = _xpath(_SHAPE_PARAGRAPHS)
+    paragraph_content = _xpath(_PARAGRAPH_CONTENT)
+    shape_name = _xpath(_SHAPE_NAME)
+    shape_ph = _xpath(_SHAPE_PH)
+    shape_type_names = _shape_type_names()
+    per_unit = _EMU_PER_UNIT[units]
+    shapes = slide.shapes
+    
+    # Extract shapes and text, from the same elements slide.shapes wraps
+    for shape_idx, shape_elm in enumerate(slide.element.cSld.spTree.iter_shape_elms()):
+        shape_type = None
+        if shape_elm.tag == _P_SP:
+            # Shape.shape_type, with its placeholder check as a compiled XPath
+            if shape_ph(shape_elm):
+                shape_type = MSO_SHAPE_TYPE.PLACEHOLDER
+            elif shape_elm.has_custom_geometry:
+                shape_type = MSO_SHAPE_TYPE.FREEFORM
+            elif shape_elm.is_autoshape:
+                shape_type = MSO_SHAPE_TYPE.AUTO_SHAPE
+            elif shape_elm.is_textbox:
+                shape_type = MSO_SHAPE_TYPE.TEXT_BOX
+        if shape_type is None:
+            # Other shapes need their proxy; None for e.g. SmartArt frames
+            shape_type = SlideShapeFactory(shape_elm, shapes).shape_type
+        shape_info = {
+            "shape_index": shape_idx,
+            "shape_type": shape_type_names.get(shape_type) or str(shape_type),
+            "name": shape_name(shape_elm)
+        }
+        
+        # Extract text if the shape has a text frame; only p:sp shapes do
+        if shape_elm.tag == _P_SP:
+            paragraphs = [
+                "".join(["\v" if node.tag == _A_BR else (node.text or "") for node in paragraph_content(p)])
+                for p in shape_paragraphs(shape_elm)
+            ]
+            text_content = [para_text for para_text in paragraphs if para_text]
+            
+            if text_content:
+                shape_info["text"] = "\n".join(text_content)
+            
+            # Same as shape.text: every paragraph, empty ones included
+            shape_info["full_text"] = "\n".join(paragraphs)
+        
+        # Add position and size, as _convert_emu would give them
+        left, top, width, height = _shape_geometry(shape_elm, slide)
+        if per_unit is not None:
+            left = left / per_unit if left is not None else None
+            top = top / per_unit if top is not None else None
+            width = width / per_unit if width is not None else None
+            height = height / per_unit if height is not None else None
+        shape_info["left"] = left
+        shape_info["top"] = top
+        shape_info["width"] = width
+        shape_info["height"] = height
+        
+        slide_data["shapes"].append(shape_info)
+    
+    # Extract notes
+    if slide.has_notes_slide:
+        notes_text_frame = slide.notes_slide.notes_text_frame
+        if notes_text_frame and notes_text_frame.text:
+            slide_data["notes"] = notes_text_frame.text
+    
+    return slide_data
+
+
+def _open_package_zip(path):
+    """Open a .pptx file as a ZipFile, with load_presentation_safe's errors"""
+    from zipfile import ZipFile, BadZipFile
+    
     try:
-        path = Path(path)
-        # Create parent directory if it doesn't exist
-        path.parent.mkdir(parents=True, exist_ok=True)
-        prs.save(str(path))
-    except Exception as e:
-        raise Exception(f"Error saving presentation: {e}") from e
+        return ZipFile(_map_file(path))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {path}") from None
+    except BadZipFile as e:
+        raise Exception(f"Invalid PowerPoint file format: {path}. Error: {e}") from e
 
 
-def read_presentation(path, slide_number=None):
+def _zip_rels(zf, partname):
     """
-    Extract content from presentation slides
+    Read the relationships of one package part straight from the zip
+    
+    Args:
+        zf: Open ZipFile of the package
+        partname: PackURI of the source part
+        
+    Returns:
+        tuple: (CT_Relationships element, {rId: (reltype, target PackURI)}),
+        the dict holding only internal targets present in the zip
+    """
+    from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+    from pptx.opc.oxml import CT_Relationships
+    from pptx.opc.packuri import PackURI
+    from pptx.oxml import parse_xml
+    
+    rels_member = partname.rels_uri.membername
+    if rels_member in zf.NameToInfo:
+        xml_rels = parse_xml(zf.read(rels_member))
+    else:
+        xml_rels = CT_Relationships.new()
+    
+    targets = {}
+    for rel in xml_rels.relationship_lst:
+        if rel.targetMode == RTM.EXTERNAL:
+            continue
+        target = PackURI.from_rel_ref(partname.baseURI, rel.target_ref)
+        if target.membername in zf.NameToInfo:
+            targets[rel.rId] = (rel.reltype, target)
+    return xml_rels, targets
+
+
+def _zip_rel_target(targets, reltype):
+    """Return the first target PackURI of `reltype` from a _zip_rels dict, or None"""
+    for target_reltype, target in targets.values():
+        if target_reltype == reltype:
+            return target
+    return None
+
+
+def _zip_presentation_partname(zf, path):
+    """Return the PackURI of presentation.xml from the package rels"""
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.opc.packuri import PACKAGE_URI
+    
+    pres_partname = _zip_rel_target(_zip_rels(zf, PACKAGE_URI)[1], RT.OFFICE_DOCUMENT)
+    if pres_partname is None:
+        raise Exception(f"Invalid PowerPoint file format: {path}. Error: no presentation part")
+    return pres_partname
+
+
+def _zip_slide_layouts(zf, path):
+    """
+    Parse the slide layouts without loading any other part
+    
+    Returns:
+        list: p:sldLayout elements of the first slide master, in the order
+        of prs.slide_layouts
+    """
+    from lxml import etree
+    
+    pres_partname = _zip_presentation_partname(zf, path)
+    presentation = etree.fromstring(zf.read(pres_partname.membername))
+    master_rIds = _xpath("./p:sldMasterIdLst/p:sldMasterId/@r:id")(presentation)
+    master_targets = _zip_rels(zf, pres_partname)[1]
+    if not master_rIds or master_rIds[0] not in master_targets:
+        raise Exception(f"Invalid PowerPoint file format: {path}. Error: no slide master")
+    
+    master_partname = master_targets[master_rIds[0]][1]
+    master = etree.fromstring(zf.read(master_partname.membername))
+    layout_targets = _zip_rels(zf, master_partname)[1]
+    return [
+        etree.fromstring(zf.read(layout_targets[rId][1].membername))
+        for rId in _xpath("./p:sldLayoutIdLst/p:sldLayoutId/@r:id")(master)
+        if rId in layout_targets
+    ]
+
+
+def _zip_presentation(zf, path):
+    """
+    Locate and parse presentation.xml without loading any other part
+    
+    Returns:
+        tuple: (CT_Presentation element, list of slide PackURIs in deck order)
+    """
+    from pptx.oxml import parse_xml
+    
+    pres_partname = _zip_presentation_partname(zf, path)
+    presentation = parse_xml(zf.read(pres_partname.membername))
+    pres_targets = _zip_rels(zf, pres_partname)[1]
+    
+    sldIdLst = presentation.sldIdLst
+    sldIds = sldIdLst.sldId_lst if sldIdLst is not None else []
+    slide_partnames = [
+        pres_targets[sldId.rId][1] if sldId.rId in pres_targets else None
+        for sldId in sldIds
+    ]
+    return presentation, slide_partnames
+
+
+def _read_slides_lazy(path, slide_numbers, units="emu"):
+    """
+    Read some slides without loading the rest of the deck
+    
+    Presentation() decompresses and parses every part in the package. Here
+    only presentation.xml, the requested slides and the parts they depend on
+    (layouts, masters, notes slides) are read from the zip. They are built
+    with python-pptx's own part classes, so the output matches
+    read_presentation.
     
     Args:
         path: Path to the .pptx file
-        slide_number: Optional specific slide number (1-based index)
+        slide_numbers: Slide numbers (1-based index); may be empty to read
+                       just the presentation info
+        units: Unit for slide and shape dimensions: "emu", "in" or "pt"
         
     Returns:
-        dict: Contains presentation info and slide contents
+        dict: Same schema as read_presentation, with the requested slides
     """
-    prs = load_presentation_safe(path)
+    _get_pres()
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.opc.package import PartFactory, _ContentTypeMap
+    from pptx.opc.packuri import CONTENT_TYPES_URI
     
-    result = {
-        "total_slides": len(prs.slides),
-        "slide_width": prs.slide_width,
-        "slide_height": prs.slide_height,
-        "slides": []
-    }
+    with _open_package_zip(path) as zf:
+        presentation, slide_partnames = _zip_presentation(zf, path)
+        total_slides = len(slide_partnames)
+        
+        sldSz = presentation.sldSz
+        result = {
+            "total_slides": total_slides,
+            "slide_width": _convert_emu(sldSz.cx if sldSz is not None else None, units),
+            "slide_height": _convert_emu(sldSz.cy if sldSz is not None else None, units),
+            "slides": []
+        }
+        
+        for slide_number in slide_numbers:
+            if slide_number < 1 or slide_number > total_slides:
+                raise ValueError(f"Slide number {slide_number} out of range. Presentation has {total_slides} slides.")
+            if slide_partnames[slide_number - 1] is None:
+                raise Exception(f"Invalid PowerPoint file format: {path}. Error: slide {slide_number} has no part")
+        
+        if not slide_numbers:
+            return result
+        
+        content_types = _ContentTypeMap.from_xml(zf.read(CONTENT_TYPES_URI.membername))
+        parts = {}
+        xml_rels = {}
+        part_targets = {}
+        
+        def load_part(partname):
+            if partname is None:
+                return {}
+            if partname not in parts:
+                parts[partname] = PartFactory(
+                    partname, content_types[partname], None, zf.read(partname.membername)
+                )
+                xml_rels[partname], part_targets[partname] = _zip_rels(zf, partname)
+            return part_targets[partname]
+        
+        # Load only the slides and the parts their placeholders and notes resolve
+        # through; slides sharing a layout share its (and its master's) parts
+        for slide_number in slide_numbers:
+            slide_targets = load_part(slide_partnames[slide_number - 1])
+            layout_targets = load_part(_zip_rel_target(slide_targets, RT.SLIDE_LAYOUT))
+            load_part(_zip_rel_target(layout_targets, RT.SLIDE_MASTER))
+            load_part(_zip_rel_target(slide_targets, RT.NOTES_SLIDE))
+        
+        # Relationships to parts that were not loaded are skipped by python-pptx
+        for partname, part in parts.items():
+            part.load_rels_from_xml(xml_rels[partname], parts)
+        
+        for slide_number in slide_numbers:
+            slide = parts[slide_partnames[slide_number - 1]].slide
+            result["slides"].append(_extract_slide(slide_number - 1, slide, units))
+    
+    return result
+
+
+# Decks smaller than this are read in-process; pool start-up would dominate
+_MIN_PARALLEL_SLIDES = 16
+
+
+def _default_workers():
+    """Default process count for full-deck reads"""
+    return min(os.cpu_count() or 1, 4)
+
+
+def _read_slides_worker(path, slide_numbers, units):
+    """Process-pool entry point: slide records for one chunk of slide numbers"""
+    return _read_slides_lazy(path, slide_numbers, units)["slides"]
+
+
+def _collect(items, key):
+    """
+    Build a result dict from an iter_* generator's items
+    
+    Args:
+        items: Iterator yielding ("header", dict) first, then (kind, item)
+        key: Name of the list the items are collected under
+        
+    Returns:
+        dict: The header fields followed by the list of items
+    """
+    _, result = next(items)
+    result[key] = [item for _, item in items]
+    return result
+
+
+def iter_read_presentation(path, slide_number=None, units="emu", num_workers=None):
+    """
+    Extract content from presentation slides one slide at a time
+    
+    Args:
+        path: Path to the .pptx file
+        slide_number: Optional specific slide number (1-based index)
+        units: Unit for slide and shape dimensions: "emu" (default), "in" or "pt"
+        num_workers: Processes for a full-deck read (default: min(CPUs, 4))
+        
+    Yields:
+        tuple: ("header", dict of presentation info) first, then
+               ("slide", dict of slide contents) for each slide in order
+    """
+    if units not in _EMU_PER_UNIT:
+        raise ValueError(f"Invalid units: {units}. Use one of: {', '.join(_EMU_PER_UNIT)}")
+    
+    # Outside serve mode, slides are read straight from the zip: a single slide
+    # only needs its own parts, and a large deck is split across processes that
+    # each load only their slides. In serve mode the cached Presentation may
+    # hold uncommitted edits, so it is used instead.
+    if _PRS_CACHE is None:
+        if slide_number is not None:
+            result = _read_slides_lazy(path, [slide_number], units)
+            slides = result.pop("slides")
+            yield "header", result
+            yield "slide", slides[0]
+            return
+        
+        num_workers = num_workers or _default_workers()
+        if num_workers > 1:
+            header = _read_slides_lazy(path, [], units)
+            del header["slides"]
+            total_slides = header["total_slides"]
+            if total_slides >= _MIN_PARALLEL_SLIDES:
+                from concurrent.futures import ProcessPoolExecutor
+                from itertools import repeat
+                
+                num_workers = min(num_workers, total_slides)
+                step = -(-total_slides // num_workers)
+                chunks = [
+                    list(range(start, min(start + step, total_slides + 1)))
+                    for start in range(1, total_slides + 1, step)
+                ]
+                with ProcessPoolExecutor(len(chunks)) as pool:
+                    records_by_chunk = pool.map(_read_slides_worker, repeat(str(path)), chunks, repeat(units))
+                    yield "header", header
+                    for records in records_by_chunk:
+                        for record in records:
+                            yield "slide", record
+                return
+    
+    prs = load_presentation_safe(path)
     
     # Determine which slides to process
     if slide_number is not None:
@@ -86,114 +877,107 @@ def read_presentation(path, slide_number=None):
     else:
         slides_to_process = enumerate(prs.slides)
     
-    # Process slides
+    yield "header", {
+        "total_slides": len(prs.slides),
+        "slide_width": _convert_emu(prs.slide_width, units),
+        "slide_height": _convert_emu(prs.slide_height, units),
+    }
+    
     for idx, slide in slides_to_process:
-        slide_data = {
-            "slide_number": idx + 1,
-            "shapes": []
-        }
-        
-        # Extract shapes and text
-        for shape_idx, shape in enumerate(slide.shapes):
-            shape_info = {
-                "shape_index": shape_idx,
-                "shape_type": shape.shape_type.name if hasattr(shape.shape_type, 'name') else str(shape.shape_type),
-                "name": shape.name
-            }
-            
-            # Extract text if the shape has a text frame
-            if hasattr(shape, "text_frame"):
-                text_content = []
-                for paragraph in shape.text_frame.paragraphs:
-                    para_text = paragraph.text
-                    if para_text:
-                        text_content.append(para_text)
-                
-                if text_content:
-                    shape_info["text"] = "\n".join(text_content)
-            
-            # Check if it's a title or has text
-            if hasattr(shape, "text"):
-                shape_info["full_text"] = shape.text
-            
-            # Add position and size
-            shape_info["left"] = shape.left
-            shape_info["top"] = shape.top
-            shape_info["width"] = shape.width
-            shape_info["height"] = shape.height
-            
-            slide_data["shapes"].append(shape_info)
-        
-        # Extract notes
-        if slide.has_notes_slide:
-            notes_text_frame = slide.notes_slide.notes_text_frame
-            if notes_text_frame and notes_text_frame.text:
-                slide_data["notes"] = notes_text_frame.text
-        
-        result["slides"].append(slide_data)
+        yield "slide", _extract_slide(idx, slide, units)
+
+
+def read_presentation(path, slide_number=None, units="emu", num_workers=None):
+    """
+    Extract content from presentation slides
     
-    return result
+    Args:
+        path: Path to the .pptx file
+        slide_number: Optional specific slide number (1-based index)
+        units: Unit for slide and shape dimensions: "emu" (default), "in" or "pt"
+        num_workers: Processes for a full-deck read (default: min(CPUs, 4))
+        
+    Returns:
+        dict: Contains presentation info and slide contents
+    """
+    return _collect(iter_read_presentation(path, slide_number, units, num_workers), "slides")
 
 
-def find_shape_by_name(slide, name_pattern):
+def find_shape_by_name(slide, name_pattern, names=None):
     """
     Find a shape by name pattern (case-insensitive substring match)
     
     Args:
         slide: Slide object
         name_pattern: Pattern to search for in shape name
+        names: Optional (lower-cased name, shape) list for the slide's shapes,
+               as built by edit_presentation, to search instead of the slide
         
     Returns:
         Shape object or None if not found
     """
     name_lower = name_pattern.lower()
+    if names is not None:
+        return next((shape for name, shape in names if name_lower in name), None)
     for shape in slide.shapes:
         if name_lower in shape.name.lower():
             return shape
     return None
 
 
-def find_shape_by_text(slide, text_pattern):
+def find_shape_by_text(slide, text_pattern, texts=None):
     """
     Find a shape containing specific text (case-insensitive substring match)
     
     Args:
         slide: Slide object
         text_pattern: Pattern to search for in shape text
+        texts: Optional [lower-cased text, shape] list for the slide's text
+               shapes, as built by edit_presentation, to search instead
         
     Returns:
         Shape object or None if not found
     """
     text_lower = text_pattern.lower()
+    if texts is not None:
+        return next((shape for text, shape in texts if text_lower in text), None)
     for shape in slide.shapes:
-        if hasattr(shape, "text") and text_lower in shape.text.lower():
+        if shape.has_text_frame and text_lower in shape.text.lower():
             return shape
     return None
 
 
-def find_title_shape(slide):
+def find_title_shape(slide, names=None):
     """
     Find the title shape on a slide using multiple heuristics
     
     Priority:
-    1. Shape with "title" in name
-    2. Shape at top of slide (highest y position, typically title)
-    3. First shape with text
+    1. Title or center-title placeholder
+    2. Shape with "title" in name
+    3. Other placeholder whose type mentions TITLE
+    4. Shape at top of slide (highest y position, typically title)
     
     Args:
         slide: Slide object
+        names: Optional name list for find_shape_by_name
         
     Returns:
         Shape object or None if not found
     """
-    # Method 1: Look for shape with "title" in name
-    title_shape = find_shape_by_name(slide, "title")
-    if title_shape and hasattr(title_shape, "text_frame"):
+    # Method 1: The title placeholder, found by one compiled XPath
+    title_sps = _xpath(_TITLE_PLACEHOLDER_SP)(slide.element)
+    if title_sps:
+        from pptx.shapes.shapetree import SlideShapeFactory
+        return SlideShapeFactory(title_sps[0], slide.shapes)
+    
+    # Method 2: Look for shape with "title" in name
+    title_shape = find_shape_by_name(slide, "title", names)
+    if title_shape and title_shape.has_text_frame:
         return title_shape
     
-    # Method 2: Look for placeholder type TITLE
+    # Method 3: Look for placeholder type TITLE
     for shape in slide.shapes:
-        if hasattr(shape, "placeholder_format") and shape.placeholder_format:
+        if shape.is_placeholder:
             try:
                 placeholder_type = str(shape.placeholder_format.type)
                 if "TITLE" in placeholder_type.upper():
@@ -201,11 +985,11 @@ def find_title_shape(slide):
             except:
                 pass
     
-    # Method 3: Find the shape with the smallest top value (highest on slide)
+    # Method 4: Find the shape with the smallest top value (highest on slide)
     # This is typically where titles are placed
     text_shapes = []
     for shape in slide.shapes:
-        if hasattr(shape, "text_frame"):
+        if shape.has_text_frame:
             text_shapes.append((shape, shape.top))
     
     if text_shapes:
@@ -216,7 +1000,15 @@ def find_title_shape(slide):
     return None
 
 
-def edit_presentation(path, updates):
+def _set_text(text_frame, text):
+    """Set a text frame's text unless it already reads the same; True if set"""
+    if text_frame.text == text:
+        return False
+    text_frame.text = text
+    return True
+
+
+def edit_presentation(path, updates, output_path=None):
     """
     Update text content in presentation slides
     
@@ -229,36 +1021,109 @@ def edit_presentation(path, updates):
                  - {"slide": 1, "shape_text": "Old text", "text": "New text"} (by shape content)
                  - {"slide": 1, "title": "New Title"} (updates title shape)
                  - {"slide": 2, "notes": "New notes"}
+        output_path: Optional path for the edited file (default: edit in place)
     
     Returns:
         dict: Status message with updated items
     """
+    if output_path is None:
+        output_path = path
+    elif _PRS_CACHE is not None and os.path.realpath(output_path) != os.path.realpath(path):
+        raise ValueError("output is not supported in serve mode; edit in place and commit")
+    
     prs = load_presentation_safe(path)
     updated_items = []
+    # Set once an update actually changes the deck; updates that match the
+    # existing text are still reported but touch nothing
+    changed = False
+    # Parts whose XML changed, and whether a notes slide was added; text-only
+    # changes outside serve mode are saved by rewriting just those parts
+    dirty_parts = set()
+    added_parts = False
+    total_slides = len(prs.slides)
+    
+    # Resolved once per slide and reused by every update that targets it
+    slides_by_num = {}
+    title_shape_by_slide = {}
+    # slide.shapes[i] and len(slide.shapes) each walk the whole shape tree;
+    # editing text never adds or removes shapes, so list them once
+    shapes_by_slide = {}
+    # Lower-cased names and texts for find_shape_by_name/_by_text, built the
+    # first time a slide is searched; text entries follow this call's edits
+    names_by_slide = {}
+    texts_by_slide = {}
+    shape_name = _xpath(_SHAPE_NAME)
+    
+    def slide_shapes(slide_num, slide):
+        shapes = shapes_by_slide.get(slide_num)
+        if shapes is None:
+            shapes = shapes_by_slide[slide_num] = list(slide.shapes)
+        return shapes
+    
+    def slide_names(slide_num, slide):
+        names = names_by_slide.get(slide_num)
+        if names is None:
+            names = names_by_slide[slide_num] = [
+                (shape_name(shape._element).lower(), shape) for shape in slide_shapes(slide_num, slide)
+            ]
+        return names
+    
+    def slide_texts(slide_num, slide):
+        texts = texts_by_slide.get(slide_num)
+        if texts is None:
+            texts = texts_by_slide[slide_num] = [
+                [shape.text.lower(), shape] for shape in slide_shapes(slide_num, slide)
+                if shape.has_text_frame
+            ]
+        return texts
+    
+    def set_shape_text(slide_num, shape, text):
+        """_set_text on a shape, keeping the slide's text list current"""
+        if not _set_text(shape.text_frame, text):
+            return False
+        dirty_parts.add(slides_by_num[slide_num].part)
+        for entry in texts_by_slide.get(slide_num, ()):
+            if entry[1] == shape:
+                entry[0] = shape.text.lower()
+        return True
     
     for update in updates:
         slide_num = update.get("slide")
         
-        if not slide_num or slide_num < 1 or slide_num > len(prs.slides):
-            raise ValueError(f"Invalid slide number: {slide_num}. Presentation has {len(prs.slides)} slides.")
+        if not slide_num or slide_num < 1 or slide_num > total_slides:
+            raise ValueError(f"Invalid slide number: {slide_num}. Presentation has {total_slides} slides.")
         
-        slide = prs.slides[slide_num - 1]
+        slide = slides_by_num.get(slide_num)
+        if slide is None:
+            slide = slides_by_num[slide_num] = prs.slides[slide_num - 1]
         
         # Handle notes update
         if "notes" in update:
-            if not slide.has_notes_slide:
-                slide.notes_slide
-            slide.notes_slide.notes_text_frame.text = update["notes"]
+            # Reading slide.notes_slide creates the notes part, so only do
+            # that when there is text to put in it
+            if slide.has_notes_slide:
+                notes_slide = slide.notes_slide
+                if _set_text(notes_slide.notes_text_frame, update["notes"]):
+                    dirty_parts.add(notes_slide.part)
+                    changed = True
+            elif update["notes"] != "":
+                slide.notes_slide.notes_text_frame.text = update["notes"]
+                changed = added_parts = True
             updated_items.append(f"Slide {slide_num} notes")
             continue
         
         # Handle title update (find title shape using robust method)
         if "title" in update:
-            title_shape = find_title_shape(slide)
+            if slide_num not in title_shape_by_slide:
+                title_shape = find_title_shape(slide, slide_names(slide_num, slide))
+                title_shape_by_slide[slide_num] = (
+                    title_shape, shape_name(title_shape._element) if title_shape else None
+                )
+            title_shape, title_name = title_shape_by_slide[slide_num]
             
-            if title_shape and hasattr(title_shape, "text_frame"):
-                title_shape.text_frame.text = update["title"]
-                updated_items.append(f"Slide {slide_num} title ({title_shape.name})")
+            if title_shape and title_shape.has_text_frame:
+                changed = set_shape_text(slide_num, title_shape, update["title"]) or changed
+                updated_items.append(f"Slide {slide_num} title ({title_name})")
             else:
                 raise ValueError(f"No title shape found on slide {slide_num}")
             
@@ -266,15 +1131,15 @@ def edit_presentation(path, updates):
         
         # Handle shape-specific update by name
         if "shape_name" in update:
-            shape = find_shape_by_name(slide, update["shape_name"])
+            shape = find_shape_by_name(slide, update["shape_name"], slide_names(slide_num, slide))
             
             if shape is None:
                 raise ValueError(f"No shape with name containing '{update['shape_name']}' found on slide {slide_num}")
             
             if "text" in update:
-                if hasattr(shape, "text_frame"):
-                    shape.text_frame.text = update["text"]
-                    updated_items.append(f"Slide {slide_num}, Shape '{shape.name}'")
+                if shape.has_text_frame:
+                    changed = set_shape_text(slide_num, shape, update["text"]) or changed
+                    updated_items.append(f"Slide {slide_num}, Shape '{shape_name(shape._element)}'")
                 else:
                     raise ValueError(f"Shape '{shape.name}' on slide {slide_num} does not support text")
             else:
@@ -284,15 +1149,15 @@ def edit_presentation(path, updates):
         
         # Handle shape-specific update by existing text
         if "shape_text" in update:
-            shape = find_shape_by_text(slide, update["shape_text"])
+            shape = find_shape_by_text(slide, update["shape_text"], slide_texts(slide_num, slide))
             
             if shape is None:
                 raise ValueError(f"No shape with text containing '{update['shape_text']}' found on slide {slide_num}")
             
             if "text" in update:
-                if hasattr(shape, "text_frame"):
-                    shape.text_frame.text = update["text"]
-                    updated_items.append(f"Slide {slide_num}, Shape '{shape.name}' (matched text)")
+                if shape.has_text_frame:
+                    changed = set_shape_text(slide_num, shape, update["text"]) or changed
+                    updated_items.append(f"Slide {slide_num}, Shape '{shape_name(shape._element)}' (matched text)")
                 else:
                     raise ValueError(f"Shape '{shape.name}' on slide {slide_num} does not support text")
             else:
@@ -303,23 +1168,31 @@ def edit_presentation(path, updates):
         # Handle shape-specific update by index (legacy - less reliable)
         if "shape" in update:
             shape_idx = update["shape"]
+            shapes = slide_shapes(slide_num, slide)
             
-            if shape_idx < 0 or shape_idx >= len(slide.shapes):
+            if shape_idx < 0 or shape_idx >= len(shapes):
                 raise ValueError(f"Shape index {shape_idx} out of range on slide {slide_num}")
             
-            shape = slide.shapes[shape_idx]
+            shape = shapes[shape_idx]
             
             if "text" in update:
-                if hasattr(shape, "text_frame"):
-                    shape.text_frame.text = update["text"]
+                if shape.has_text_frame:
+                    changed = set_shape_text(slide_num, shape, update["text"]) or changed
                     updated_items.append(f"Slide {slide_num}, Shape {shape_idx} (WARNING: index-based editing is fragile)")
                 else:
                     raise ValueError(f"Shape {shape_idx} on slide {slide_num} does not support text")
             else:
                 raise ValueError("Update must include 'text' when specifying a shape")
     
-    # Save the presentation
-    save_presentation_safe(prs, path)
+    # Save the presentation. With nothing changed, an in-place edit writes
+    # nothing and an edit to another file is a plain copy.
+    if changed:
+        if _PRS_CACHE is None and not added_parts:
+            _save_changed_parts(prs, path, output_path, dirty_parts)
+        else:
+            save_presentation_safe(prs, output_path)
+    else:
+        save_presentation_safe(None, output_path, source_path=path)
     
     return {
         "status": "success",
@@ -329,67 +1202,180 @@ def edit_presentation(path, updates):
     }
 
 
-def add_slide(path, layout_index=0, title=None, content=None):
+# Slide XML as python-pptx first builds it from a layout, keyed by the
+# layout's part; add_slide(fast=True) copies it for later slides
+_LAYOUT_TEMPLATE_CACHE = None
+
+
+def _add_slide(prs, slide_layout, fast=False, slide_id=None):
     """
-    Add a new slide to the presentation
+    Add a slide like prs.slides.add_slide, in constant time per slide
+    
+    PresentationPart.relate_to first looks for an existing relationship to
+    the new part, rebuilding a map of all the deck's relationships to do so,
+    which makes adding N slides O(N^2). A part created here has none yet,
+    so the relationship is added directly.
+    
+    With `fast`, the slide XML built the first time a layout is used is
+    cached; python-pptx builds each new slide's placeholders one by one from
+    the layout's, and copying the finished tree is about three times faster.
+    
+    Args:
+        prs: Presentation to add the slide to
+        slide_layout: SlideLayout the slide is based on
+        fast: Copy the cached slide XML for this layout, if there is one
+        slide_id: ID for the new p:sldId; None lets python-pptx pick the
+                  next one, which scans every slide ID in the deck
+        
+    Returns:
+        Slide: The new, still empty slide
+    """
+    import copy
+    import weakref
+    from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+    from pptx.parts.slide import SlidePart
+    
+    global _LAYOUT_TEMPLATE_CACHE
+    if _LAYOUT_TEMPLATE_CACHE is None:
+        # Weak keys: a template goes with its presentation, and a deck
+        # reloaded in serve mode gets new layout parts, not stale templates
+        _LAYOUT_TEMPLATE_CACHE = weakref.WeakKeyDictionary()
+    
+    # What PresentationPart.add_slide and Slides.add_slide do
+    prs_part = prs.part
+    layout_part = slide_layout.part
+    template = _LAYOUT_TEMPLATE_CACHE.get(layout_part) if fast else None
+    if template is None:
+        slide_part = SlidePart.new(prs_part._next_slide_partname, prs_part.package, layout_part)
+        slide_part.slide.shapes.clone_layout_placeholders(slide_layout)
+        if fast:
+            _LAYOUT_TEMPLATE_CACHE[layout_part] = copy.deepcopy(slide_part._element)
+    else:
+        slide_part = SlidePart(
+            prs_part._next_slide_partname, CT.PML_SLIDE, prs_part.package,
+            copy.deepcopy(template)
+        )
+        slide_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+    
+    rId = prs_part.rels._add_relationship(RT.SLIDE, slide_part)
+    sldIdLst = prs.slides._sldIdLst
+    if slide_id is None:
+        sldIdLst.add_sldId(rId)
+    else:
+        sldIdLst._add_sldId(id=slide_id, rId=rId)
+    return slide_part.slide
+
+
+def add_slides(path, specs, fast=False):
+    """
+    Add several slides to the presentation, loading and saving it once
     
     Args:
         path: Path to the .pptx file
-        layout_index: Index of the slide layout to use (0-based)
-        title: Optional title text
-        content: Optional content text
+        specs: List of dicts, one per slide, in order
+               Example: {"layout_index": 1, "title": "Title", "content": "Text"}
+               layout_index defaults to 0; title and content are optional
+        fast: Build each slide from a cached copy of the first slide made
+              from its layout in this process (see _add_slide)
         
     Returns:
-        dict: Status and new slide information
+        dict: Status and information on each new slide
     """
     prs = load_presentation_safe(path)
+    num_layouts = len(prs.slide_layouts)
+    
+    # Check every layout index before adding anything, so a bad spec
+    # doesn't leave a served presentation half-changed
+    for spec in specs:
+        layout_index = spec.get("layout_index", 0)
+        if layout_index < 0 or layout_index >= num_layouts:
+            raise ValueError(f"Layout index {layout_index} out of range. Available layouts: 0-{num_layouts-1}")
     
-    # Check layout index
-    if layout_index < 0 or layout_index >= len(prs.slide_layouts):
-        raise ValueError(f"Layout index {layout_index} out of range. Available layouts: 0-{len(prs.slide_layouts)-1}")
-    
-    # Add slide
-    slide_layout = prs.slide_layouts[layout_index]
-    slide = prs.slides.add_slide(slide_layout)
-    slide_number = len(prs.slides)
-    
-    # Set title if provided
-    if title and hasattr(slide.shapes, 'title') and slide.shapes.title:
-        slide.shapes.title.text = title
-    
-    # Set content if provided
-    if content:
-        # Try to find a content placeholder
-        content_set = False
-        for shape in slide.placeholders:
-            # Skip title placeholder (usually index 0)
-            if hasattr(shape, "text_frame") and shape.placeholder_format.idx != 0:
-                shape.text = content
-                content_set = True
-                break
-        
-        if not content_set and hasattr(slide.shapes, 'title') and slide.shapes.title:
-            # If no content placeholder, add a text box
-            left = Inches(1)
-            top = Inches(2)
-            width = Inches(8)
-            height = Inches(4)
-            textbox = slide.shapes.add_textbox(left, top, width, height)
-            textbox.text_frame.text = content
+    # python-pptx gives each new slide the highest ID in use plus one;
+    # count up from there instead of rescanning the IDs for every slide.
+    # Past the largest valid ID, let python-pptx look for a free one.
+    next_slide_id = prs.slides._sldIdLst._next_id
+    
+    slides = []
+    for spec in specs:
+        layout_index = spec.get("layout_index", 0)
+        title = spec.get("title")
+        content = spec.get("content")
+        
+        # Add slide
+        slide_layout = prs.slide_layouts[layout_index]
+        slide_id = next_slide_id if next_slide_id <= 2147483647 else None
+        slide = _add_slide(prs, slide_layout, fast, slide_id)
+        next_slide_id += 1
+        slide_number = len(prs.slides)
+        
+        # Set title if provided
+        title_shape = slide.shapes.title
+        if title and title_shape:
+            title_shape.text = title
+        
+        # Set content if provided
+        if content:
+            # Try to find a content placeholder: the first text placeholder by idx,
+            # as slide.placeholders orders them, skipping the title (usually idx 0)
+            content_phs = [
+                ph for ph in _xpath(_TEXT_PLACEHOLDERS)(slide.element)
+                if int(ph.get("idx", "0")) != 0
+            ]
+            
+            if content_phs:
+                from pptx.shapes.shapetree import SlideShapeFactory
+                ph = min(content_phs, key=lambda ph: int(ph.get("idx", "0")))
+                sp = ph.getparent().getparent().getparent()
+                SlideShapeFactory(sp, slide.shapes).text = content
+            elif title_shape:
+                from pptx.util import Inches
+                # If no content placeholder, add a text box
+                left = Inches(1)
+                top = Inches(2)
+                width = Inches(8)
+                height = Inches(4)
+                textbox = slide.shapes.add_textbox(left, top, width, height)
+                textbox.text_frame.text = content
+        
+        slides.append({
+            "slide_number": slide_number,
+            "layout_index": layout_index,
+            "layout_name": slide_layout.name,
+            "title": title,
+            "content": content if content else None
+        })
     
     # Save the presentation
     save_presentation_safe(prs, path)
     
     return {
         "status": "success",
-        "slide_number": slide_number,
-        "layout_index": layout_index,
-        "layout_name": slide_layout.name,
-        "title": title,
-        "content": content if content else None
+        "slides": slides,
+        "count": len(slides)
     }
 
 
+def add_slide(path, layout_index=0, title=None, content=None, fast=False):
+    """
+    Add a new slide to the presentation
+    
+    Args:
+        path: Path to the .pptx file
+        layout_index: Index of the slide layout to use (0-based)
+        title: Optional title text
+        content: Optional content text
+        fast: Build the slide from a cached copy of the first slide made
+              from this layout in this process (see _add_slide)
+        
+    Returns:
+        dict: Status and new slide information
+    """
+    spec = {"layout_index": layout_index, "title": title, "content": content}
+    result = add_slides(path, [spec], fast)
+    return {"status": result["status"], **result["slides"][0]}
+
+
 def create_presentation(path, width=None, height=None):
     """
     Create a new blank PowerPoint presentation
@@ -403,7 +1389,8 @@ def create_presentation(path, width=None, height=None):
         dict: Creation status
     """
     try:
-        prs = Presentation()
+        from pptx.util import Inches
+        prs = _get_pres()()
         
         # Set slide dimensions if provided
         if width is not None:
@@ -429,88 +1416,206 @@ def create_presentation(path, width=None, height=None):
         raise Exception(f"Error creating presentation: {e}") from e
 
 
-def get_layouts(path):
+def iter_get_layouts(path):
     """
-    Get all available slide layouts in the presentation
+    Get the available slide layouts in the presentation one at a time
+    
+    Only presentation.xml, the first slide master and its layouts are read
+    from the zip. In serve mode the served presentation is used instead, so
+    a created but uncommitted file can be listed too, and so is a package
+    unzipped to a directory.
     
     Args:
         path: Path to the .pptx file
         
-    Returns:
-        dict: List of available layouts
+    Yields:
+        tuple: ("header", dict with the layout count) first, then
+               ("layout", dict of layout info) for each layout in order
     """
-    prs = load_presentation_safe(path)
+    from pptx.enum.shapes import PP_PLACEHOLDER
+    
+    if _PRS_CACHE is not None or os.path.isdir(path):
+        layouts = [layout.element for layout in load_presentation_safe(path).slide_layouts]
+    else:
+        with _open_package_zip(path) as zf:
+            layouts = _zip_slide_layouts(zf, path)
+    layout_placeholders = _xpath(_PLACEHOLDERS)
+    layout_names = _xpath("string(./p:cSld/@name)")
     
-    layouts = []
-    for idx, layout in enumerate(prs.slide_layouts):
+    yield "header", {"total_layouts": len(layouts)}
+    
+    for idx, layout in enumerate(layouts):
         layout_info = {
             "index": idx,
-            "name": layout.name,
+            "name": layout_names(layout),
             "placeholders": []
         }
         
-        # Get placeholder information
-        for shape in layout.placeholders:
+        # Get placeholder information straight from each p:ph, with the
+        # defaults python-pptx's placeholder_format applies (idx 0, type obj)
+        for ph in layout_placeholders(layout):
             placeholder_info = {
-                "idx": shape.placeholder_format.idx,
-                "name": shape.name,
-                "type": shape.placeholder_format.type.name if hasattr(shape.placeholder_format.type, 'name') else str(shape.placeholder_format.type)
+                "idx": int(ph.get("idx", "0")),
+                "name": ph.getparent().getparent().find(_P_CNVPR).get("name"),
+                "type": PP_PLACEHOLDER.from_xml(ph.get("type", "obj")).name
             }
             layout_info["placeholders"].append(placeholder_info)
         
-        layouts.append(layout_info)
+        yield "layout", layout_info
+
+
+def get_layouts(path):
+    """
+    Get all available slide layouts in the presentation
     
-    return {
-        "total_layouts": len(layouts),
-        "layouts": layouts
-    }
+    Args:
+        path: Path to the .pptx file
+        
+    Returns:
+        dict: List of available layouts
+    """
+    return _collect(iter_get_layouts(path), "layouts")
+
 
+# Extension python-pptx's Image.ext reports for each image content type
+_IMAGE_EXTS = {
+    "image/bmp": "bmp",
+    "image/gif": "gif",
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/tiff": "tiff",
+    "image/x-wmf": "wmf",
+}
 
-def extract_images(path, output_dir):
+
+def extract_images(path, output_dir, flat=False):
     """
     Extract all images from the presentation
     
+    Images are streamed from the zip to disk without loading the deck. By
+    default each picture shape is attributed to its slide, which only needs
+    the slide XML and rels, not the rest of the package.
+    
+    Each image's bytes are written once. A picture that uses an image
+    already written, whether the same media part or another part with the
+    same content, gets that file's filename and path and a "duplicate_of"
+    entry naming it.
+    
     Args:
         path: Path to the .pptx file
         output_dir: Directory to save extracted images
+        flat: Copy every file under ppt/media once, without slide attribution
         
     Returns:
         dict: List of extracted image paths
     """
-    prs = load_presentation_safe(path)
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    import hashlib
+    import shutil
+    from zipfile import ZIP_STORED
+    from lxml import etree
+    _get_pres()
+    from pptx.opc.package import _ContentTypeMap
+    from pptx.opc.packuri import CONTENT_TYPES_URI, PackURI
     
-    extracted_images = []
-    image_count = 0
+    output_path = Path(output_dir)
     
-    for slide_idx, slide in enumerate(prs.slides):
-        for shape in slide.shapes:
-            if hasattr(shape, "image"):
-                # Extract image
-                image = shape.image
-                image_bytes = image.blob
-                
-                # Determine extension
-                ext = image.ext
-                if not ext.startswith('.'):
-                    ext = f'.{ext}'
-                
-                # Save image
-                image_filename = f"slide_{slide_idx + 1}_image_{image_count}{ext}"
-                image_path = output_path / image_filename
-                
-                with open(image_path, 'wb') as f:
-                    f.write(image_bytes)
-                
-                extracted_images.append({
-                    "slide": slide_idx + 1,
-                    "filename": image_filename,
-                    "path": str(image_path),
-                    "content_type": image.content_type
-                })
+    with _open_package_zip(path) as zf, open(path, 'rb') as source:
+        content_types = _ContentTypeMap.from_xml(zf.read(CONTENT_TYPES_URI.membername))
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        def copy_member(partname, image_filename):
+            image_path = output_path / image_filename
+            info = zf.getinfo(partname.membername)
+            with open(image_path, 'wb') as dst:
+                # Media saved by this engine is stored uncompressed, so its
+                # bytes can go from file to file in the kernel
+                if info.compress_type == ZIP_STORED and hasattr(os, 'sendfile'):
+                    offset = _member_data_offset(zf.fp, info)
+                    remaining = info.file_size
+                    try:
+                        while remaining:
+                            sent = os.sendfile(dst.fileno(), source.fileno(), offset, remaining)
+                            offset += sent
+                            remaining -= sent
+                        return image_path
+                    except OSError:
+                        dst.seek(0)
+                        dst.truncate()
+                with zf.open(info) as src:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+            return image_path
+        
+        # Written image per part name, and per (CRC-32, size) from the zip
+        # directory, so only parts whose CRC and size match another are hashed
+        written = {}
+        written_by_crc = {}
+        digests = {}
+        
+        def digest(partname):
+            if partname not in digests:
+                with zf.open(partname.membername) as src:
+                    digests[partname] = hashlib.file_digest(src, "sha256").digest()
+            return digests[partname]
+        
+        def extract_member(partname, image_filename):
+            """Return the filename and path of the image written for a part"""
+            if partname in written:
+                return written[partname]
+            info = zf.getinfo(partname.membername)
+            candidates = written_by_crc.setdefault((info.CRC, info.file_size), [])
+            for other in candidates:
+                if digest(other) == digest(partname):
+                    written[partname] = written[other]
+                    return written[partname]
+            candidates.append(partname)
+            written[partname] = (image_filename, copy_member(partname, image_filename))
+            return written[partname]
+        
+        def image_record(image_filename, written_image):
+            filename, image_path = written_image
+            record = {"filename": filename, "path": str(image_path)}
+            if filename != image_filename:
+                record["duplicate_of"] = filename
+            return record
+        
+        extracted_images = []
+        
+        if flat:
+            for name in zf.namelist():
+                if not name.startswith("ppt/media/") or name.endswith("/"):
+                    continue
+                partname = PackURI("/" + name)
+                record = image_record(partname.filename, extract_member(partname, partname.filename))
+                record["content_type"] = content_types[partname]
+                extracted_images.append(record)
+        else:
+            blip_rids = _xpath(_SLIDE_PICTURE_RIDS)
+            image_count = 0
+            
+            for slide_idx, slide_partname in enumerate(_zip_presentation(zf, path)[1]):
+                if slide_partname is None:
+                    continue
+                targets = _zip_rels(zf, slide_partname)[1]
+                sld = etree.fromstring(zf.read(slide_partname.membername))
                 
-                image_count += 1
+                for rId in blip_rids(sld):
+                    if rId not in targets:
+                        continue
+                    image_partname = targets[rId][1]
+                    content_type = content_types[image_partname]
+                    ext = _IMAGE_EXTS.get(content_type, image_partname.ext)
+                    
+                    # Save image
+                    image_filename = f"slide_{slide_idx + 1}_image_{image_count}.{ext}"
+                    written_image = extract_member(image_partname, image_filename)
+                    
+                    extracted_images.append({
+                        "slide": slide_idx + 1,
+                        **image_record(image_filename, written_image),
+                        "content_type": content_type
+                    })
+                    
+                    image_count += 1
     
     return {
         "status": "success",
@@ -520,26 +1625,324 @@ def extract_images(path, output_dir):
     }
 
 
+def _loads(text):
+    """Parse JSON text, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(obj, indent=True):
+    """
+    Serialize a result to JSON bytes ending in a newline
+    
+    Args:
+        obj: Result dict to serialize
+        indent: Indent by two spaces; False gives one compact line
+    
+    Returns:
+        UTF-8 bytes, identical whether orjson or the stdlib encodes them
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # Type orjson can't handle, use the stdlib encoder
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    return (text + '\n').encode('utf-8')
+
+
+def _emit(obj, indent=True):
+    """Write a result to stdout as JSON; indent=False writes a single line"""
+    sys.stdout.buffer.write(_dumps(obj, indent))
+
+
+def _emit_stream(items, key):
+    """
+    Write an iter_* generator's result to stdout as its items arrive
+    
+    The bytes match _emit() of the dict _collect() would build, but only
+    one item is held at a time and output starts with the first item.
+    
+    Args:
+        items: Iterator yielding ("header", dict) first, then (kind, item)
+        key: Name of the list the items form; written after the header fields
+    """
+    out = sys.stdout.buffer
+    _, header = next(items)
+    header[key] = []
+    # Indented header with an empty list; the items go between its brackets
+    head = _dumps(header)
+    
+    first = True
+    for _, item in items:
+        if first:
+            out.write(head[:head.rindex(b"[]") + 1])
+            first = False
+        else:
+            out.write(b",")
+        # Nest the item's own indented JSON two levels deep
+        out.write(b"\n    " + _dumps(item)[:-1].replace(b"\n", b"\n    "))
+    
+    out.write(head if first else b"\n  ]\n}\n")
+
+
+def _run_command(args):
+    """
+    Dispatch parsed CLI arguments to the matching engine function
+    
+    Args:
+        args: argparse Namespace with a `command` attribute
+        
+    Returns:
+        dict: Command result, or None for an unknown command
+    """
+    if args.command == 'create':
+        return create_presentation(args.path, args.width, args.height)
+        
+    elif args.command == 'read':
+        return read_presentation(args.path, args.slide, args.units, args.workers)
+        
+    elif args.command == 'edit':
+        updates = _loads(args.updates)
+        return edit_presentation(args.path, updates, args.output)
+        
+    elif args.command == 'add_slide':
+        return add_slide(args.path, args.layout, args.title, args.content,
+                         args.fast_add)
+        
+    elif args.command == 'add_slides':
+        specs = _loads(args.specs)
+        return add_slides(args.path, specs, args.fast_add)
+        
+    elif args.command == 'get_layouts':
+        return get_layouts(args.path)
+        
+    elif args.command == 'extract_images':
+        return extract_images(args.path, args.output, args.flat)
+    
+    return None
+
+
+def _request_argv(request):
+    """Turn a serve request like {"command": "read", "path": ...} into CLI arguments"""
+    argv = [request["command"]]
+    for key, value in request.items():
+        if key == "command" or value is None or value is False:
+            continue
+        if value is True:
+            argv.append(f"--{key}")
+            continue
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value)
+        # --key=value keeps values that start with '-' from reading as flags
+        argv.append(f"--{key}={value}")
+    return argv
+
+
+def _serve_request(parser, line):
+    """
+    Run one JSON request line for serve or daemon mode
+    
+    Args:
+        parser: The CLI ArgumentParser, used to validate requests
+        line: JSON request text
+        
+    Returns:
+        dict: Command result, or an error result
+    """
+    try:
+        request = _loads(line)
+        command = request.get("command")
+        if command == "commit":
+            return _commit_presentations()
+        if not command or command in ("serve", "daemon"):
+            raise ValueError(f"Invalid command: {command}")
+        # argparse reports a bad request on stderr; keep it in the result
+        usage = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(usage):
+                args = parser.parse_args(_request_argv(request))
+        except SystemExit:
+            reason = usage.getvalue().strip().splitlines()
+            detail = f" ({reason[-1]})" if reason else ""
+            raise ValueError(f"Invalid request: {line.strip()}{detail}")
+        return _run_command(args)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "type": type(e).__name__
+        }
+
+
+def serve(parser):
+    """
+    Answer one JSON command per stdin line, one JSON result per stdout line
+    
+    Requests use the CLI command and flag names, e.g.
+    {"command": "edit", "path": "deck.pptx", "updates": [...]}. Each
+    presentation is parsed once and reused until its file changes on disk.
+    Edits stay in memory until {"command": "commit"} writes them out.
+    
+    Args:
+        parser: The CLI ArgumentParser, used to validate requests
+    """
+    global _PRS_CACHE
+    _PRS_CACHE = {}
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        
+        _emit(_serve_request(parser, line), indent=False)
+        sys.stdout.buffer.flush()
+
+
+def daemon(parser, socket_path):
+    """
+    Answer serve-mode requests on a Unix socket, committing after each one
+    
+    Presentations stay parsed across connections, so CLI calls forwarded
+    here by _daemon_request skip loading the deck. Unlike serve, every
+    change is written out before its result is sent, as a one-shot CLI call
+    would, and a request's "fast-save" applies to that write. Requests are
+    handled one at a time.
+    
+    Args:
+        parser: The CLI ArgumentParser, used to validate requests
+        socket_path: Path of the Unix socket to listen on
+    """
+    import signal
+    import socket
+    
+    global _PRS_CACHE, _SAVE_COMPRESSLEVEL
+    _PRS_CACHE = {}
+    # The daemon's own --fast-save; a forwarded one applies to its command only
+    compresslevel = _SAVE_COMPRESSLEVEL
+    
+    # Replace a socket left behind by a daemon that died, not a live one
+    if os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        finally:
+            probe.close()
+    
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+    
+    # Stop on SIGTERM as on Ctrl-C, removing the socket on the way out
+    signal.signal(signal.SIGTERM, stop)
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen()
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile('rwb') as stream:
+                for line in stream:
+                    if not line.strip():
+                        continue
+                    line = line.decode('utf-8')
+                    result = _serve_request(parser, line)
+                    try:
+                        if _loads(line).get("fast-save"):
+                            _SAVE_COMPRESSLEVEL = 1
+                        _commit_presentations()
+                    except Exception as e:
+                        result = {
+                            "status": "error",
+                            "message": str(e),
+                            "type": type(e).__name__
+                        }
+                    finally:
+                        _SAVE_COMPRESSLEVEL = compresslevel
+                    if result.get("status") == "error":
+                        # A failed request may have changed a parsed deck
+                        # partway; everything else is committed, so reparse
+                        _PRS_CACHE.clear()
+                    stream.write(_dumps(result, indent=False))
+                    stream.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _daemon_request(socket_path, args):
+    """
+    Send a parsed CLI command to a running daemon
+    
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        args: argparse Namespace of the command
+        
+    Returns:
+        dict: The daemon's result, or None if no daemon is listening
+    """
+    import socket
+    
+    # The daemon has its own working directory
+    request = {key.replace('_', '-'): value for key, value in vars(args).items()}
+    for key in ('path', 'output'):
+        if request.get(key):
+            request[key] = os.path.abspath(request[key])
+    
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        with client.makefile('rwb') as stream:
+            stream.write(_dumps(request, indent=False))
+            stream.flush()
+            return _loads(stream.readline())
+    finally:
+        client.close()
+
+
 def main():
     """CLI interface for pptx_engine"""
+    global _SAVE_COMPRESSLEVEL
     parser = argparse.ArgumentParser(description='PowerPoint file manipulation engine')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
+    fast_save_help = 'Deflate with zlib level 1: faster to save, slightly larger file'
     
     # Create command
     create_parser = subparsers.add_parser('create', help='Create new presentation')
     create_parser.add_argument('--path', required=True, help='Path for new PowerPoint file')
     create_parser.add_argument('--width', type=float, default=None, help='Slide width in inches (default: 10)')
     create_parser.add_argument('--height', type=float, default=None, help='Slide height in inches (default: 7.5)')
+    create_parser.add_argument('--fast-save', action='store_true', help=fast_save_help)
     
     # Read command
     read_parser = subparsers.add_parser('read', help='Read presentation data')
     read_parser.add_argument('--path', required=True, help='Path to PowerPoint file')
     read_parser.add_argument('--slide', type=int, default=None, help='Specific slide number (1-based)')
+    read_parser.add_argument('--units', choices=['emu', 'in', 'pt'], default='emu', help='Unit for positions and sizes (default: emu)')
+    read_parser.add_argument('--workers', type=int, default=None, help='Processes for a full-deck read (default: min(CPUs, 4))')
     
     # Edit command
     edit_parser = subparsers.add_parser('edit', help='Edit presentation data')
     edit_parser.add_argument('--path', required=True, help='Path to PowerPoint file')
     edit_parser.add_argument('--updates', required=True, help='JSON string of updates')
+    edit_parser.add_argument('--output', default=None, help='Write the edited file here instead of in place')
+    edit_parser.add_argument('--fast-save', action='store_true', help=fast_save_help)
     
     # Add slide command
     add_parser = subparsers.add_parser('add_slide', help='Add a new slide')
@@ -547,6 +1950,18 @@ def main():
     add_parser.add_argument('--layout', type=int, default=0, help='Layout index (default: 0)')
     add_parser.add_argument('--title', default=None, help='Slide title')
     add_parser.add_argument('--content', default=None, help='Slide content')
+    add_parser.add_argument('--fast-add', action='store_true',
+                            help='Copy the slide built the first time this layout was used '
+                                 '(pays off for repeated adds in serve mode)')
+    add_parser.add_argument('--fast-save', action='store_true', help=fast_save_help)
+    
+    # Add slides command
+    add_many_parser = subparsers.add_parser('add_slides', help='Add several slides in one load and save')
+    add_many_parser.add_argument('--path', required=True, help='Path to PowerPoint file')
+    add_many_parser.add_argument('--specs', '--slides', dest='specs', required=True, help='JSON array of slide specs')
+    add_many_parser.add_argument('--fast-add', action='store_true',
+                                 help='Copy the slide built the first time each layout was used')
+    add_many_parser.add_argument('--fast-save', action='store_true', help=fast_save_help)
     
     # Get layouts command
     layouts_parser = subparsers.add_parser('get_layouts', help='Get available slide layouts')
@@ -556,38 +1971,54 @@ def main():
     images_parser = subparsers.add_parser('extract_images', help='Extract images from presentation')
     images_parser.add_argument('--path', required=True, help='Path to PowerPoint file')
     images_parser.add_argument('--output', required=True, help='Output directory for images')
+    images_parser.add_argument('--flat', action='store_true', help='Copy every file under ppt/media without per-slide attribution')
+    
+    # Serve command
+    serve_parser = subparsers.add_parser('serve', help='Serve JSON commands from stdin, keeping presentations parsed')
+    serve_parser.add_argument('--fast-save', action='store_true', help=fast_save_help + ' on commit')
+    
+    # Daemon command
+    daemon_parser = subparsers.add_parser('daemon', help='Serve commands on a Unix socket, keeping presentations parsed')
+    daemon_parser.add_argument('--socket', required=True, help='Path of the Unix socket to listen on')
+    daemon_parser.add_argument('--fast-save', action='store_true', help=fast_save_help)
     
     args = parser.parse_args()
     
+    if getattr(args, 'fast_save', False):
+        _SAVE_COMPRESSLEVEL = 1
+    
+    if args.command == 'serve':
+        serve(parser)
+        return
     try:
-        if args.command == 'create':
-            result = create_presentation(args.path, args.width, args.height)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'read':
-            result = read_presentation(args.path, args.slide)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'edit':
-            updates = json.loads(args.updates)
-            result = edit_presentation(args.path, updates)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'add_slide':
-            result = add_slide(args.path, args.layout, args.title, args.content)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'get_layouts':
-            result = get_layouts(args.path)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'extract_images':
-            result = extract_images(args.path, args.output)
-            print(json.dumps(result, indent=2))
-            
-        else:
+        if args.command == 'daemon':
+            daemon(parser, args.socket)
+            return
+        
+        # Forward to a daemon if one is set up; an edit to another file
+        # needs a fresh load, so it always runs here
+        socket_path = os.environ.get('PPTX_ENGINE_SOCKET')
+        if socket_path and args.command and not (args.command == 'edit' and args.output):
+            result = _daemon_request(socket_path, args)
+            if result is not None:
+                _emit(result)
+                if result.get("status") == "error":
+                    sys.exit(1)
+                return
+        
+        # Large results are written as they are produced, not built up first
+        if args.command == 'read':
+            _emit_stream(iter_read_presentation(args.path, args.slide, args.units, args.workers), "slides")
+            return
+        if args.command == 'get_layouts':
+            _emit_stream(iter_get_layouts(args.path), "layouts")
+            return
+        
+        result = _run_command(args)
+        if result is None:
             parser.print_help()
             sys.exit(1)
+        _emit(result)
             
     except Exception as e:
         error_result = {
@@ -595,7 +2026,7 @@ def main():
             "message": str(e),
             "type": type(e).__name__
         }
-        print(json.dumps(error_result, indent=2))
+        _emit(error_result)
         sys.exit(1)
 
 
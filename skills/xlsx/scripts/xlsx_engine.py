@@ -10,15 +10,47 @@ from openpyxl.utils.exceptions import InvalidFileException
 import json
 import sys
 import argparse
+import bisect
+import os
+import posixpath
+import re
 from pathlib import Path
+from openpyxl.utils import get_column_letter
+from openpyxl.compat import safe_string
+from openpyxl.xml.functions import whitespace
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_workbook_safe(path):
+
+# Fields of each row read_sheet returns, named once in its "schema"
+_READ_SCHEMA = ("cell", "value", "is_formula")
+
+# Column letters by 1-based index, grown on demand by _grow_column_letters
+_COLUMN_LETTERS = ['']
+
+# Fully loaded workbooks kept by daemon(), by real path; None outside it
+_WB_CACHE = None
+# Finished formulas.ExcelModel objects kept by daemon(), by real path
+_MODEL_CACHE = None
+# Entries the daemon keeps per cache; the least recently used is dropped first
+_WB_CACHE_SIZE = 8
+
+# Values check_errors reports
+_ERROR_CODES = frozenset(('#REF!', '#DIV/0!', '#NAME?', '#VALUE!', '#N/A', '#NULL!', '#NUM!'))
+
+
+def load_workbook_safe(path, read_only=False, data_only=False):
     """
     Safely load an Excel workbook with error handling
     
     Args:
         path: Path to the .xlsx file
+        read_only: Open lazily for reading; sheets are parsed on each
+                   iteration and the workbook must be closed after use
+        data_only: Return cached formula results instead of formulas
         
     Returns:
         openpyxl Workbook object
@@ -27,14 +59,67 @@ def load_workbook_safe(path):
         FileNotFoundError: If the file doesn't exist
         InvalidFileException: If the file is not a valid Excel file
     """
+    path = _check_workbook_path(path)
+    
+    # The daemon's fully loaded workbooks serve read-only callers too
+    if _WB_CACHE is not None and not data_only:
+        return _cached(_WB_CACHE, path, _open_workbook)
+    
+    return _open_workbook(path, read_only, data_only)
+
+
+def _check_workbook_path(path):
+    """
+    Reject a path openpyxl can't open before anything parses it
+    
+    The extension check is openpyxl's own, done here so that edit and
+    check_errors, which can read the package without openpyxl, refuse the
+    same files. A file that doesn't start like a zip is refused before
+    zipfile or openpyxl looks for its directory.
+    
+    Args:
+        path: Path to the .xlsx file
+        
+    Returns:
+        Path: The path
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        InvalidFileException: If the extension isn't a workbook's or the
+                              file isn't a zip archive
+    """
+    from openpyxl.reader.excel import SUPPORTED_FORMATS
+    
     path = Path(path)
     
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     
+    suffix = path.suffix.lower()
+    if suffix not in SUPPORTED_FORMATS:
+        if suffix == '.xls':
+            detail = "the old binary .xls format is not supported; save it as .xlsx first"
+        else:
+            detail = f"supported formats are {', '.join(SUPPORTED_FORMATS)}"
+        raise InvalidFileException(f"Invalid Excel file format: {path} ({detail})")
+    
+    if path.is_dir():
+        raise InvalidFileException(f"Invalid Excel file format: {path} (is a directory)")
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    # Local file header of the first member
+    if magic != b'PK\x03\x04':
+        raise InvalidFileException(f"Invalid Excel file format: {path} (not a zip archive)")
+    return path
+
+
+def _open_workbook(path, read_only=False, data_only=False):
+    """Load a workbook from disk, wrapping openpyxl's errors"""
     try:
         # data_only=False preserves formulas
-        wb = load_workbook(str(path), data_only=False)
+        # External links are only needed to write them back on save
+        wb = load_workbook(str(path), read_only=read_only, data_only=data_only,
+                           keep_links=not read_only)
         return wb
     except InvalidFileException as e:
         raise InvalidFileException(f"Invalid Excel file format: {path}") from e
@@ -42,6 +127,35 @@ def load_workbook_safe(path):
         raise Exception(f"Error loading workbook: {e}") from e
 
 
+def _cached(cache, path, load):
+    """
+    Return a daemon cache's object for a path, reloading only when needed
+    
+    The cached object is reused while the file's mtime and size are unchanged;
+    the size catches a rewrite within one tick of a coarse filesystem clock.
+    
+    Args:
+        cache: _WB_CACHE or _MODEL_CACHE
+        path: Path to the .xlsx file
+        load: Function building the object from the path
+        
+    Returns:
+        The cached or newly loaded object
+    """
+    key = os.path.realpath(path)
+    entry = cache.pop(key, None)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    if entry is None or entry[0] != stamp:
+        entry = [stamp, load(path)]
+    
+    # Re-inserting keeps the dict in least recently used order
+    cache[key] = entry
+    while len(cache) > _WB_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    return entry[1]
+
+
 def save_workbook_safe(wb, path):
     """
     Safely save an Excel workbook with error handling
@@ -60,9 +174,35 @@ def save_workbook_safe(wb, path):
         wb.save(str(path))
     except Exception as e:
         raise Exception(f"Error saving workbook: {e}") from e
+    
+    if _WB_CACHE is not None:
+        # A cached workbook that was just saved matches the file again
+        key = os.path.realpath(path)
+        entry = _WB_CACHE.get(key)
+        if entry is not None and entry[1] is wb:
+            st = os.stat(path)
+            entry[0] = (st.st_mtime_ns, st.st_size)
+        else:
+            _WB_CACHE.pop(key, None)
+
+
+def _collect(items, key):
+    """
+    Build a result dict from an iter_* generator's items
+    
+    Args:
+        items: Iterator yielding ("header", dict) first, then (kind, item)
+        key: Name of the list the items are collected under
+        
+    Returns:
+        dict: The header fields followed by the list of items
+    """
+    _, result = next(items)
+    result[key] = [item for _, item in items]
+    return result
 
 
-def read_sheet(path, sheet_name=None, range_str=None):
+def read_sheet(path, sheet_name=None, range_str=None, legacy_schema=False):
     """
     Extract values and formulas from a specific sheet
     
@@ -71,107 +211,189 @@ def read_sheet(path, sheet_name=None, range_str=None):
         sheet_name: Name of the sheet to read (None = active sheet)
         range_str: Optional range to read (e.g., "A1:B10", "A1", "C:C", "3:5")
                   If not specified, reads all cells with values
+        legacy_schema: Return a "cells" list of dicts instead of "schema"
+                       and "rows"
         
     Returns:
-        dict: Contains sheet info, cells with coordinates, values, and formulas
+        dict: Contains sheet info, the field names ("schema") and one row
+              per cell of coordinate, value and whether it is a formula
     """
-    wb = load_workbook_safe(path)
-    
-    # Get the sheet
-    if sheet_name is None:
-        sheet = wb.active
-        sheet_name = sheet.title
-    else:
-        if sheet_name not in wb.sheetnames:
-            raise ValueError(f"Sheet '{sheet_name}' not found. Available sheets: {wb.sheetnames}")
-        sheet = wb[sheet_name]
-    
-    result = {
-        "sheet_name": sheet_name,
-        "range": range_str,
-        "cells": []
-    }
+    return _collect(iter_read_sheet(path, sheet_name, range_str, legacy_schema),
+                    "cells" if legacy_schema else "rows")
+
+
+def iter_read_sheet(path, sheet_name=None, range_str=None, legacy_schema=False):
+    """
+    Extract values and formulas from a specific sheet one cell at a time
     
-    # If range is specified, use it
-    if range_str:
-        from openpyxl.utils import get_column_letter
+    Args:
+        path: Path to the .xlsx file
+        sheet_name: Name of the sheet to read (None = active sheet)
+        range_str: Optional range to read (e.g., "A1:B10", "A1", "C:C", "3:5")
+                  If not specified, reads all cells with values
+        legacy_schema: Yield a dict of coordinate, value and formula per
+                       cell instead of a row
         
-        range_str = range_str.strip()
+    Yields:
+        tuple: ("header", dict of sheet name, range and schema) first, once
+               the sheet and range are validated, then ("cell", tuple of
+               coordinate, value and is-formula flag) for each cell with a
+               value, row by row
+    """
+    # read_only parses the sheet XML as it is iterated instead of building
+    # every cell object up front
+    wb = load_workbook_safe(path, read_only=True)
+    try:
+        # Get the sheet
+        if sheet_name is None:
+            sheet = wb.active
+            sheet_name = sheet.title
+        else:
+            if sheet_name not in wb.sheetnames:
+                raise ValueError(f"Sheet '{sheet_name}' not found. Available sheets: {wb.sheetnames}")
+            sheet = wb[sheet_name]
         
-        # Handle different range formats
-        if ':' in range_str:
-            # Range like A1:B10 or C:C or 3:5
-            parts = range_str.split(':')
-            if len(parts) != 2:
-                raise ValueError(f"Invalid range format: {range_str}. Expected format like 'A1:B10' or 'A:A'")
-            
-            start_ref, end_ref = parts[0].strip(), parts[1].strip()
-            
-            # Parse start reference
-            if start_ref.isdigit():
-                # Row range like 3:5
-                min_row, max_row = int(start_ref), int(end_ref)
-                min_col, max_col = 1, sheet.max_column if sheet.max_column > 0 else 1
-            elif start_ref.isalpha():
-                # Column range like C:C
-                min_col = column_letter_to_index(start_ref)
-                max_col = column_letter_to_index(end_ref)
-                min_row, max_row = 1, sheet.max_row if sheet.max_row > 0 else 1
-            else:
-                # Cell range like A1:B10
-                start_match = parse_cell_ref(start_ref)
-                end_match = parse_cell_ref(end_ref)
-                min_row = min(start_match['row'], end_match['row'])
-                max_row = max(start_match['row'], end_match['row'])
-                min_col = min(start_match['col'], end_match['col'])
-                max_col = max(start_match['col'], end_match['col'])
+        header = {
+            "sheet_name": sheet_name,
+            "range": range_str
+        }
+        if not legacy_schema:
+            header["schema"] = list(_READ_SCHEMA)
+        
+        # Whole sheet unless a range narrows it; max_row/max_col=None read
+        # up to the last row, and each row up to its last cell
+        min_row, max_row, min_col, max_col = 1, None, 1, None
+        
+        # If range is specified, use it
+        if range_str:
+            range_str = range_str.strip()
             
-            # Iterate through the specified range
-            for row_idx in range(min_row, max_row + 1):
-                for col_idx in range(min_col, max_col + 1):
-                    cell = sheet.cell(row=row_idx, column=col_idx)
-                    if cell.value is not None:
-                        cell_data = {
-                            "cell": cell.coordinate,
-                            "value": cell.value
-                        }
-                        
-                        # Check if it's a formula
-                        if isinstance(cell.value, str) and cell.value.startswith('='):
-                            cell_data["formula"] = cell.value
-                        
-                        result["cells"].append(cell_data)
-        else:
-            # Single cell like A1
-            cell = sheet[range_str]
-            if cell.value is not None:
-                cell_data = {
-                    "cell": cell.coordinate,
-                    "value": cell.value
-                }
+            # Handle different range formats
+            if ':' in range_str:
+                # Range like A1:B10 or C:C or 3:5
+                parts = range_str.split(':')
+                if len(parts) != 2:
+                    raise ValueError(f"Invalid range format: {range_str}. Expected format like 'A1:B10' or 'A:A'")
                 
-                # Check if it's a formula
-                if isinstance(cell.value, str) and cell.value.startswith('='):
-                    cell_data["formula"] = cell.value
+                start_ref, end_ref = parts[0].strip(), parts[1].strip()
                 
-                result["cells"].append(cell_data)
-    else:
-        # Iterate through all cells (original behavior)
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value is not None:
-                    cell_data = {
-                        "cell": cell.coordinate,
-                        "value": cell.value
-                    }
-                    
-                    # Check if it's a formula
-                    if isinstance(cell.value, str) and cell.value.startswith('='):
-                        cell_data["formula"] = cell.value
-                    
-                    result["cells"].append(cell_data)
+                # Parse start reference
+                if start_ref.isdigit():
+                    # Row range like 3:5
+                    min_row, max_row = int(start_ref), int(end_ref)
+                elif start_ref.isalpha():
+                    # Column range like C:C
+                    min_col = column_letter_to_index(start_ref)
+                    max_col = column_letter_to_index(end_ref)
+                else:
+                    # Cell range like A1:B10
+                    start_match = parse_cell_ref(start_ref)
+                    end_match = parse_cell_ref(end_ref)
+                    min_row = min(start_match['row'], end_match['row'])
+                    max_row = max(start_match['row'], end_match['row'])
+                    min_col = min(start_match['col'], end_match['col'])
+                    max_col = max(start_match['col'], end_match['col'])
+                
+                if min_row < 1 or min_col < 1:
+                    raise ValueError("Row or column values must be at least 1")
+                if (max_row is not None and max_row < min_row) or (max_col is not None and max_col < min_col):
+                    yield "header", header
+                    return
+            else:
+                # Single cell like A1
+                from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+                
+                column, min_row = coordinate_from_string(range_str)
+                min_col = column_index_from_string(column)
+                max_row, max_col = min_row, min_col
+        
+        yield "header", header
+        
+        # Scan plain values in a single pass (sheet.cell() would re-parse
+        # the sheet for every cell); coordinates are built only for cells
+        # that hold a value
+        letters = _COLUMN_LETTERS
+        for row_idx, row in _iter_value_rows(sheet, min_row, max_row, min_col, max_col):
+            if len(letters) < min_col + len(row):
+                _grow_column_letters(min_col + len(row))
+            row_str = str(row_idx)
+            for col_idx, value in enumerate(row, min_col):
+                if value is None:
+                    continue
+                # A slice compare skips startswith's method call; ""[:1] is ""
+                is_formula = value.__class__ is str and value[:1] == '='
+                if not legacy_schema:
+                    # A tuple per cell; the field names are in the header
+                    yield "cell", (letters[col_idx] + row_str, value, is_formula)
+                elif is_formula:
+                    yield "cell", {"cell": letters[col_idx] + row_str, "value": value, "formula": value}
+                else:
+                    yield "cell", {"cell": letters[col_idx] + row_str, "value": value}
+    finally:
+        wb.close()
+
+
+def _iter_value_rows(sheet, min_row=1, max_row=None, min_col=1, max_col=None):
+    """
+    Iterate a sheet's values row by row without creating cells
     
-    return result
+    Args:
+        sheet: Read-only or fully loaded worksheet
+        min_row, max_row: Rows to read (1-based); max_row=None reads to the end
+        min_col, max_col: Columns to read (1-based); max_col=None reads each
+                          row up to its last cell
+        
+    Returns:
+        Iterator of (row number, tuple of values from min_col) pairs; rows
+        may be skipped or come without trailing empty values
+    """
+    if sheet.parent.read_only:
+        # The stored dimensions may be missing or stale; let iteration find
+        # the real extent of the data as the fully loaded sheet would
+        sheet.reset_dimensions()
+        return enumerate(sheet.iter_rows(min_row=min_row, max_row=max_row,
+                                         min_col=min_col, max_col=max_col,
+                                         values_only=True), min_row)
+    
+    # A loaded sheet's iter_rows() would create every cell it visits, which
+    # a later save would write out
+    return _stored_value_rows(sheet, min_row, max_row, min_col, max_col)
+
+
+def _stored_value_rows(sheet, min_row, max_row, min_col, max_col):
+    """Generator behind _iter_value_rows() for a fully loaded worksheet"""
+    cells = sheet._cells
+    if max_row and max_col and (max_row - min_row + 1) * (max_col - min_col + 1) < len(cells):
+        # Small range: look its cells up instead of sorting the whole sheet
+        for row_idx in range(min_row, max_row + 1):
+            row = [cells.get((row_idx, col_idx)) for col_idx in range(min_col, max_col + 1)]
+            yield row_idx, tuple(None if cell is None else cell.value for cell in row)
+        return
+    
+    max_row = max_row or sheet.max_row
+    max_col = max_col or sheet.max_column
+    row_idx = None
+    values = []
+    for (cell_row, cell_col), cell in sorted(cells.items()):
+        if not (min_row <= cell_row <= max_row and min_col <= cell_col <= max_col):
+            continue
+        if cell_row != row_idx:
+            if values:
+                yield row_idx, tuple(values)
+            row_idx = cell_row
+            values = []
+        # Pad columns that have no cell
+        values.extend([None] * (cell_col - min_col - len(values)))
+        values.append(cell.value)
+    if values:
+        yield row_idx, tuple(values)
+
+
+def _grow_column_letters(count):
+    """Extend _COLUMN_LETTERS so that it covers indices below count"""
+    letters = _COLUMN_LETTERS
+    for col_idx in range(len(letters), count):
+        letters.append(get_column_letter(col_idx))
 
 
 def parse_cell_ref(ref):
@@ -217,6 +439,13 @@ def edit_sheet(path, sheet_name, updates):
     Returns:
         dict: Status message with updated cells
     """
+    if _WB_CACHE is None:
+        # The daemon already holds the parsed workbook, so it edits that
+        _check_workbook_path(path)
+        result = _patch_sheet(path, sheet_name, updates)
+        if result is not None:
+            return result
+    
     wb = load_workbook_safe(path)
     
     if sheet_name not in wb.sheetnames:
@@ -246,57 +475,582 @@ def edit_sheet(path, sheet_name, updates):
     }
 
 
-def recalculate_workbook(path):
+# Package namespaces read and rewritten by _patch_sheet
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_DOC_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CT_NS = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+# Workbook elements that precede calcPr in the schema
+_BEFORE_CALC_PR = frozenset(("fileVersion", "fileSharing", "workbookPr", "workbookProtection",
+                             "bookViews", "sheets", "functionGroups", "externalReferences",
+                             "definedNames"))
+# Cell references _patch_sheet handles itself; others are left to openpyxl
+_CELL_REF_RE = re.compile(r"\$?([A-Za-z]{1,3})\$?([1-9][0-9]*)")
+# Cell values _scan_errors_xml decodes in case they are a date openpyxl
+# can't represent: 7+ digits, 6+ below zero, or anything but digits and '.'
+_DATE_OVERFLOW_RE = re.compile(rb"<v>(?:-[0-9]{6}|[0-9]{7}|[^<]*[^0-9.<-])")
+# Integer cell values, which may index an error code in the shared strings
+_CELL_VALUE_INT_RE = re.compile(rb"<v>([0-9]+)</v>")
+
+
+def _patch_sheet(path, sheet_name, updates):
+    """
+    Apply edit_sheet's updates by rewriting only the sheet's XML part
+    
+    A full load and save costs seconds on a large workbook even for one
+    cell. Here the sheet part is parsed with lxml, the updated <c> elements
+    are written the way openpyxl writes them, and every other zip member is
+    copied still compressed. Like an openpyxl save, the calculation chain is
+    dropped and the workbook is marked for a full recalculation when opened.
+    
+    Args:
+        path: Path to the .xlsx file
+        sheet_name: Name of the sheet to edit
+        updates: List of dicts with 'cell' and 'value' keys
+        
+    Returns:
+        dict: edit_sheet's result, or None if the edit needs openpyxl: lxml
+        is missing, the package or sheet can't be found, or an update
+        targets a range, a merged cell or an array or shared formula's
+        anchor, or has a value other than a string, number or bool
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        return None
+    from zipfile import ZipFile, BadZipFile
+    from openpyxl.cell.cell import Cell
+    from openpyxl.utils import column_index_from_string, range_boundaries
+    
+    parser = etree.XMLParser(resolve_entities=False)
+    try:
+        with ZipFile(path) as zf:
+            package_rels = _read_rels(zf, "", etree, parser)
+            wb_part = next(target for rel_type, target, _ in package_rels.values()
+                           if rel_type.endswith("/officeDocument"))
+            wb_root = etree.fromstring(zf.read(wb_part), parser)
+            wb_rels_part = _rels_part(wb_part)
+            wb_rels = _read_rels(zf, wb_part, etree, parser)
+            
+            sheet_part = None
+            for sheet in wb_root.iterfind(f"{_MAIN_NS}sheets/{_MAIN_NS}sheet"):
+                if sheet.get("name") == sheet_name:
+                    sheet_part = wb_rels[sheet.get(f"{_DOC_REL_NS}id")][1]
+                    break
+            if sheet_part is None:
+                return None
+            root = etree.fromstring(zf.read(sheet_part), parser)
+            
+            calc_chain = next((rel for rel in wb_rels.values()
+                               if rel[0].endswith("/calcChain")), None)
+            content_types = None
+            if calc_chain is not None:
+                content_types = etree.fromstring(zf.read("[Content_Types].xml"), parser)
+    except (OSError, BadZipFile, KeyError, StopIteration, etree.XMLSyntaxError):
+        return None
+    
+    sheet_data = root.find(f"{_MAIN_NS}sheetData")
+    if root.tag != f"{_MAIN_NS}worksheet" or sheet_data is None:
+        return None
+    
+    # Validate every update before changing anything, as openpyxl would
+    values = {}
+    updated_cells = []
+    for update in updates:
+        cell_ref = update.get("cell")
+        value = update.get("value")
+        
+        if not cell_ref:
+            raise ValueError("Each update must have a 'cell' key")
+        
+        match = _CELL_REF_RE.fullmatch(cell_ref) if isinstance(cell_ref, str) else None
+        if match is None or type(value) not in (str, int, float, bool, type(None)):
+            return None
+        col_idx = column_index_from_string(match[1].upper())
+        row_idx = int(match[2])
+        if col_idx > 16384 or row_idx > 1048576:
+            return None
+        
+        # Raises for illegal characters and infers the type as sheet[ref] = value does
+        cell = Cell(None, value=value)
+        values[(row_idx, col_idx)] = (cell.data_type, cell._value)
+        updated_cells.append(cell_ref)
+    
+    # The updates' bounding box; regions clear of it are skipped without
+    # testing each update against them
+    first_row = last_row = first_col = last_col = 0
+    if values:
+        update_rows = [row_idx for row_idx, _ in values]
+        update_cols = [col_idx for _, col_idx in values]
+        first_row, last_row = min(update_rows), max(update_rows)
+        first_col, last_col = min(update_cols), max(update_cols)
+    for merged in root.iterfind(f"{_MAIN_NS}mergeCells/{_MAIN_NS}mergeCell"):
+        min_col, min_row, max_col, max_row = range_boundaries(merged.get("ref"))
+        if max_row < first_row or min_row > last_row or max_col < first_col or min_col > last_col:
+            continue
+        for row_idx, col_idx in values:
+            if (min_row <= row_idx <= max_row and min_col <= col_idx <= max_col
+                    and (row_idx, col_idx) != (min_row, min_col)):
+                return None
+    for formula in root.iter(f"{_MAIN_NS}f"):
+        if formula.get("t") in ("array", "dataTable") and formula.get("ref"):
+            min_col, min_row, max_col, max_row = range_boundaries(formula.get("ref"))
+            if (max_row < first_row or min_row > last_row
+                    or max_col < first_col or min_col > last_col):
+                continue
+            for row_idx, col_idx in values:
+                if min_row <= row_idx <= max_row and min_col <= col_idx <= max_col:
+                    return None
+    
+    rows = {}
+    for row in sheet_data.iterchildren(f"{_MAIN_NS}row"):
+        r = row.get("r")
+        if r is None:
+            return None
+        rows[int(r)] = row
+    row_numbers = sorted(rows)
+    
+    # Updates grouped by row, so each row's cells are indexed only once
+    # however many of them change
+    row_updates = {}
+    for (row_idx, col_idx), update in sorted(values.items()):
+        row_updates.setdefault(row_idx, []).append((col_idx, update))
+    
+    for row_idx, updates_in_row in row_updates.items():
+        row = rows.get(row_idx)
+        if row is None:
+            row = rows[row_idx] = etree.Element(f"{_MAIN_NS}row", r=str(row_idx))
+            pos = bisect.bisect(row_numbers, row_idx)
+            if pos < len(row_numbers):
+                rows[row_numbers[pos]].addprevious(row)
+            else:
+                sheet_data.append(row)
+            row_numbers.insert(pos, row_idx)
+        
+        cells = {}
+        for c in row.iterchildren(f"{_MAIN_NS}c"):
+            match = _CELL_REF_RE.fullmatch(c.get("r", ""))
+            if match is None:
+                return None
+            cells.setdefault(column_index_from_string(match[1].upper()), c)
+        columns = sorted(cells)
+        
+        for col_idx, (data_type, value) in updates_in_row:
+            target = cells.get(col_idx)
+            if target is None:
+                _grow_column_letters(col_idx + 1)
+                target = etree.Element(f"{_MAIN_NS}c", r=f"{_COLUMN_LETTERS[col_idx]}{row_idx}")
+                pos = bisect.bisect(columns, col_idx)
+                if pos < len(columns):
+                    cells[columns[pos]].addprevious(target)
+                else:
+                    following = row.find(f"{_MAIN_NS}extLst")
+                    if following is not None:
+                        following.addprevious(target)
+                    else:
+                        row.append(target)
+                cells[col_idx] = target
+                columns.insert(pos, col_idx)
+                # spans is only a hint and may no longer cover the row
+                row.attrib.pop("spans", None)
+            else:
+                formula = target.find(f"{_MAIN_NS}f")
+                if formula is not None and formula.get("t") == "shared" and formula.get("ref"):
+                    # Other cells' formulas are defined by this one
+                    return None
+            
+            _write_cell(etree, target, data_type, value)
+    
+    dimension = root.find(f"{_MAIN_NS}dimension")
+    try:
+        min_col, min_row, max_col, max_row = range_boundaries(dimension.get("ref"))
+    except (AttributeError, TypeError, ValueError):
+        # No usable dimension to widen; readers don't rely on it
+        dimension = None
+    if dimension is not None and values:
+        min_row, max_row = min(min_row, first_row), max(max_row, last_row)
+        min_col, max_col = min(min_col, first_col), max(max_col, last_col)
+        _grow_column_letters(max_col + 1)
+        dimension.set("ref", f"{_COLUMN_LETTERS[min_col]}{min_row}:"
+                             f"{_COLUMN_LETTERS[max_col]}{max_row}")
+    
+    blobs = {sheet_part: etree.tostring(root, xml_declaration=True, encoding="UTF-8",
+                                        standalone=True)}
+    
+    # Cached results of other formulas may now be stale
+    calc_pr = wb_root.find(f"{_MAIN_NS}calcPr")
+    if calc_pr is None:
+        calc_pr = etree.Element(f"{_MAIN_NS}calcPr")
+        preceding = [el for el in wb_root if isinstance(el.tag, str)
+                     and etree.QName(el).localname in _BEFORE_CALC_PR]
+        if preceding:
+            preceding[-1].addnext(calc_pr)
+        else:
+            wb_root.insert(0, calc_pr)
+    if calc_pr.get("fullCalcOnLoad") not in ("1", "true"):
+        calc_pr.set("fullCalcOnLoad", "1")
+        blobs[wb_part] = etree.tostring(wb_root, xml_declaration=True, encoding="UTF-8",
+                                        standalone=True)
+    
+    dropped = ()
+    if calc_chain is not None:
+        # Excel rebuilds a missing chain but may refuse a stale one
+        rels_root = calc_chain[2].getparent()
+        rels_root.remove(calc_chain[2])
+        blobs[wb_rels_part] = etree.tostring(rels_root, xml_declaration=True,
+                                             encoding="UTF-8", standalone=True)
+        for override in content_types.iterfind(f"{_CT_NS}Override"):
+            if override.get("PartName") == "/" + calc_chain[1]:
+                content_types.remove(override)
+        blobs["[Content_Types].xml"] = etree.tostring(content_types, xml_declaration=True,
+                                                      encoding="UTF-8", standalone=True)
+        dropped = (calc_chain[1],)
+    
+    try:
+        _copy_zip_replacing(path, blobs, dropped)
+    except Exception as e:
+        raise Exception(f"Error saving workbook: {e}") from e
+    
+    return {
+        "status": "success",
+        "updated_cells": updated_cells,
+        "count": len(updated_cells)
+    }
+
+
+def _rels_part(part):
+    """Return the name of the relationships part for a package part"""
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", name + ".rels")
+
+
+def _read_rels(zf, part, etree, parser):
+    """
+    Read a part's internal relationships
+    
+    Args:
+        zf: Open ZipFile of the package
+        part: Member name of the part, or "" for the package itself
+        etree: lxml.etree
+        parser: Parser for the relationships XML
+        
+    Returns:
+        dict: {Id: (Type, target member name, Relationship element)}
+    """
+    rels = {}
+    root = etree.fromstring(zf.read(_rels_part(part)), parser)
+    for rel in root.iterfind(f"{_PKG_REL_NS}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(part), target))
+        rels[rel.get("Id")] = (rel.get("Type", ""), target, rel)
+    return rels
+
+
+def _write_cell(etree, c, data_type, value):
+    """
+    Replace a <c> element's content the way openpyxl's cell writer does
+    
+    Args:
+        etree: lxml.etree
+        c: The cell element; its r and s attributes are kept
+        data_type: openpyxl data type, one of n, s, f, b, e
+        value: The cell's value as openpyxl stores it
+    """
+    ref, style_id = c.get("r"), c.get("s")
+    c.clear(keep_tail=True)
+    c.set("r", ref)
+    if style_id is not None:
+        c.set("s", style_id)
+    
+    if data_type == "s":
+        c.set("t", "inlineStr")
+    elif data_type != "f":
+        c.set("t", data_type)
+    if value is None or value == "":
+        return
+    
+    if data_type == "f":
+        etree.SubElement(c, f"{_MAIN_NS}f").text = value[1:]
+        etree.SubElement(c, f"{_MAIN_NS}v")
+    elif data_type == "s":
+        text = etree.SubElement(etree.SubElement(c, f"{_MAIN_NS}is"), f"{_MAIN_NS}t")
+        text.text = value
+        whitespace(text)
+    else:
+        etree.SubElement(c, f"{_MAIN_NS}v").text = safe_string(value)
+
+
+def _copy_zip_replacing(path, blobs, dropped=()):
+    """
+    Rewrite a zip in place with some members replaced or dropped
+    
+    Unchanged members are copied still compressed, header and data, so
+    nothing but the replaced members is serialized or deflated. zipfile has
+    no raw-copy API; the copy appends to the writer's file and member list
+    the way ZipFile.writestr does. The output is written next to `path` and
+    moved into place.
+    
+    Args:
+        path: Zip to rewrite
+        blobs: {member name: bytes} of the members to replace
+        dropped: Names of members to leave out
+    """
+    import copy
+    import shutil
+    import tempfile
+    from zipfile import ZipFile, ZIP_DEFLATED
+    
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with open(path, "rb") as src, ZipFile(src) as zin, \
+                os.fdopen(fd, "wb") as out, ZipFile(out, "w") as zout:
+            for info in zin.infolist():
+                if info.filename in dropped:
+                    continue
+                blob = blobs.get(info.filename)
+                if blob is not None:
+                    zout.writestr(info.filename, blob, compress_type=ZIP_DEFLATED)
+                    continue
+                
+                # Local header: 30 fixed bytes, then the name and extra field
+                src.seek(info.header_offset)
+                header = src.read(30)
+                src.seek(info.header_offset + 30 + int.from_bytes(header[26:28], "little")
+                         + int.from_bytes(header[28:30], "little"))
+                member = copy.copy(info)
+                # Sizes go in the new local header, so no data descriptor follows
+                member.flag_bits &= ~0x08
+                member.header_offset = out.tell()
+                out.write(member.FileHeader())
+                remaining = info.compress_size
+                while remaining:
+                    chunk = src.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        raise EOFError(f"Truncated zip member: {info.filename}")
+                    out.write(chunk)
+                    remaining -= len(chunk)
+                zout.filelist.append(member)
+                zout.NameToInfo[member.filename] = member
+                zout.start_dir = out.tell()
+        # mkstemp creates the file 0600; give it the original's permissions
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _load_excel_model(path):
+    """
+    Build the finished formulas.ExcelModel for a workbook
+    
+    The daemon keeps models in memory between calls. They can't be cached on
+    disk: pickling fails on the dispatcher's functions, and rebuilding one
+    with ExcelModel.from_dict() costs as much as loading the file.
+    
+    Args:
+        path: Path to the .xlsx file
+        
+    Returns:
+        formulas.ExcelModel, ready to calculate
+    """
+    import formulas
+    
+    def load(path):
+        return formulas.ExcelModel().loads(str(path)).finish()
+    
+    if _MODEL_CACHE is None:
+        return load(path)
+    return _cached(_MODEL_CACHE, path, load)
+
+
+def _calculated_value(ranges):
+    """
+    Convert a formulas result to plain Python values
+    
+    Args:
+        ranges: formulas Ranges holding a cell's result
+        
+    Returns:
+        The value, or a list of rows of values for an array result; error
+        results become their code (e.g. "#DIV/0!") and empty cells None
+    """
+    import schedula as sh
+    from formulas.tokens.operand import XlError
+    
+    rows = []
+    for row in ranges.value.tolist():
+        values = []
+        for value in row:
+            if value is sh.EMPTY:
+                value = None
+            elif isinstance(value, XlError):
+                value = str(value)
+            elif hasattr(value, "item"):
+                # numpy scalar
+                value = value.item()
+            values.append(value)
+        rows.append(values)
+    
+    if len(rows) == 1 and len(rows[0]) == 1:
+        return rows[0][0]
+    return rows
+
+
+def _cached_results(path):
+    """
+    Return recalculate's records from the results cached in the file
+    
+    Excel saves each formula's last result in the sheet XML. They are only
+    used when every formula cell has one and the workbook isn't marked to
+    be recalculated: edit sets fullCalcOnLoad, as openpyxl's save does
+    after dropping the cached results, and a workbook saved in manual
+    calculation mode with calcOnSave off may hold stale ones.
+    
+    Args:
+        path: Path to the .xlsx file
+        
+    Returns:
+        dict: recalculate's per-sheet records, or None if the formulas need
+        calculating
+    """
+    from zipfile import ZipFile, BadZipFile
+    from openpyxl.xml.functions import fromstring
+    
+    try:
+        with ZipFile(path) as zf:
+            wb_part = next(rel.get("Target") for rel in fromstring(zf.read("_rels/.rels"))
+                           if rel.get("Type", "").endswith("/officeDocument"))
+            calc_pr = fromstring(zf.read(wb_part.lstrip("/"))).find(f"{_MAIN_NS}calcPr")
+    except (OSError, BadZipFile, KeyError, StopIteration, SyntaxError):
+        return None
+    # openpyxl reads a missing fullCalcOnLoad as true, so check the XML
+    if (calc_pr is None or calc_pr.get("fullCalcOnLoad") in ("1", "true")
+            or (calc_pr.get("calcMode") == "manual" and calc_pr.get("calcOnSave") in ("0", "false"))):
+        return None
+    
+    # Formulas and cached results come from two read-only loads of the same
+    # sheet XML, so their rows line up; dates stay serial numbers, as the
+    # formulas library returns them
+    values_wb = load_workbook_safe(path, read_only=True, data_only=True)
+    values_wb._date_formats = values_wb._timedelta_formats = set()
+    formulas_wb = _open_workbook(path, read_only=True)
+    
+    recalculated = {}
+    
+    try:
+        letters = _COLUMN_LETTERS
+        for sheet_name in formulas_wb.sheetnames:
+            sheet_data = []
+            for (row_idx, row), (_, cached_row) in zip(_iter_value_rows(formulas_wb[sheet_name]),
+                                                       _iter_value_rows(values_wb[sheet_name])):
+                if len(letters) <= len(row):
+                    _grow_column_letters(len(row) + 1)
+                row_str = str(row_idx)
+                for col_idx, value in enumerate(row, 1):
+                    if value.__class__ is str and value[:1] == '=':
+                        cached = cached_row[col_idx - 1]
+                        if cached is None:
+                            return None
+                        sheet_data.append({
+                            "cell": letters[col_idx] + row_str,
+                            "formula": value,
+                            "calculated_value": cached
+                        })
+            if sheet_data:
+                recalculated[sheet_name] = sheet_data
+    finally:
+        values_wb.close()
+        formulas_wb.close()
+    
+    return recalculated
+
+
+def recalculate_workbook(path, force=False):
     """
     Recalculate all formulas in a workbook using the formulas library
     
     Args:
         path: Path to the .xlsx file
+        force: Calculate even if the results cached in the file are current
         
     Returns:
         dict: Status and recalculated values
     """
     try:
-        import formulas
+        # The formulas library also converts .ods files
+        if Path(path).suffix.lower() != '.ods':
+            _check_workbook_path(path)
+        
+        if not force:
+            recalculated = _cached_results(path)
+            if recalculated is not None:
+                return {
+                    "status": "success",
+                    "recalculated": recalculated,
+                    "note": "Cached results in the file are current. Values shown are those results; use force to recalculate."
+                }
+        
+        from formulas.excel import BOOK
         
         # Load the workbook model and calculate
-        xl_model = formulas.ExcelModel().loads(str(path)).finish()
+        xl_model = _load_excel_model(path)
         results = xl_model.calculate()
         
-        # Get the workbook to update cells
-        wb = load_workbook_safe(path)
+        # The model holds the openpyxl workbook it was built from; the
+        # first book is the file itself, any others are linked workbooks
+        book_name, book = next(iter(xl_model.books.items()))
+        wb = book[BOOK]
+        
+        # Results are keyed like "'[book.xlsx]SHEET'!A1", with the sheet
+        # name upper-cased; ranges and other books' cells are not needed
+        calculated = {}
+        for ref, value in results.items():
+            sheet_ref, _, coordinate = ref.rpartition("!")
+            ref_book, _, ref_sheet = sheet_ref.strip("'").replace("''", "'").partition("]")
+            if ref_book[1:].upper() == book_name and ':' not in coordinate:
+                calculated[ref_sheet, coordinate] = value
         
         recalculated = {}
+        letters = _COLUMN_LETTERS
         for sheet_name in wb.sheetnames:
             sheet = wb[sheet_name]
+            sheet_key = sheet_name.upper()
             sheet_data = []
             
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
-                        # Build the reference key
-                        cell_ref = f"{sheet_name}!{cell.coordinate}"
+            # Plain values; a loaded sheet's iter_rows() would create cells
+            for row_idx, row in _iter_value_rows(sheet):
+                if len(letters) <= len(row):
+                    _grow_column_letters(len(row) + 1)
+                row_str = str(row_idx)
+                for col_idx, value in enumerate(row, 1):
+                    if value.__class__ is str and value[:1] == '=':
+                        coordinate = letters[col_idx] + row_str
                         
                         # Get calculated value from results
                         try:
-                            if cell_ref in results:
-                                calc_value = results[cell_ref]
-                                
+                            calc_value = calculated.get((sheet_key, coordinate))
+                            if calc_value is not None:
                                 sheet_data.append({
-                                    "cell": cell.coordinate,
-                                    "formula": cell.value,
-                                    "calculated_value": calc_value
+                                    "cell": coordinate,
+                                    "formula": value,
+                                    "calculated_value": _calculated_value(calc_value)
                                 })
                             else:
                                 sheet_data.append({
-                                    "cell": cell.coordinate,
-                                    "formula": cell.value,
+                                    "cell": coordinate,
+                                    "formula": value,
                                     "note": "Formula not calculated"
                                 })
                         except Exception as e:
                             sheet_data.append({
-                                "cell": cell.coordinate,
-                                "formula": cell.value,
+                                "cell": coordinate,
+                                "formula": value,
                                 "error": f"Calculation error: {str(e)}"
                             })
             
@@ -321,6 +1075,12 @@ def recalculate_workbook(path):
             "message": str(e),
             "type": "FileNotFoundError"
         }
+    except InvalidFileException as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "type": "InvalidFileException"
+        }
     except Exception as e:
         return {
             "status": "error",
@@ -330,35 +1090,277 @@ def recalculate_workbook(path):
         }
 
 
-def check_errors(path):
+# Workbooks with less sheet XML than this are scanned in one process; sheets
+# parse at about 6 MB/s, so below it pool start-up would eat the gain
+_MIN_PARALLEL_SHEET_BYTES = 1 << 20
+
+
+def _default_workers():
+    """Default process count for scanning sheets in parallel"""
+    return min(os.cpu_count() or 1, 4)
+
+
+def _sheet_xml_size(path):
+    """Return the uncompressed size of a workbook's worksheet parts"""
+    from zipfile import ZipFile
+    
+    with ZipFile(path) as zf:
+        return sum(info.file_size for info in zf.infolist()
+                   if info.filename.startswith("xl/worksheets/"))
+
+
+def _scan_sheet_errors(sheet, sheet_name):
+    """Return check_errors' error records for one sheet"""
+    errors = []
+    isdisjoint = _ERROR_CODES.isdisjoint
+    
+    # Plain values skip building a cell object per cell; the
+    # coordinate is only needed for the few cells that match.
+    # isdisjoint tests a whole row in C, so the Python loop only
+    # runs for rows holding an error.
+    for row_idx, row in _iter_value_rows(sheet):
+        if isdisjoint(row):
+            continue
+        for col_idx, value in enumerate(row, 1):
+            if value.__class__ is str and value in _ERROR_CODES:
+                errors.append({
+                    "sheet": sheet_name,
+                    "cell": f"{get_column_letter(col_idx)}{row_idx}",
+                    "error": value
+                })
+    return errors
+
+
+def _scan_sheet_errors_worker(path, sheet_name):
+    """Process-pool entry point: open the workbook and scan one sheet"""
+    wb = load_workbook_safe(path, read_only=True)
+    try:
+        return _scan_sheet_errors(wb[sheet_name], sheet_name)
+    finally:
+        wb.close()
+
+
+def _scan_errors_xml(path):
+    """
+    Find check_errors' error values by searching the package XML directly
+    
+    openpyxl builds a value for every cell, which is most of a scan's time,
+    yet only a few cells can read as an error code: error cells (t="e"),
+    strings equal to a code (shared, inline or t="str"), and date-formatted
+    numbers outside the calendar, which openpyxl reads as "#VALUE!". Each
+    worksheet's <sheetData> is searched as bytes for the codes, for
+    numbers that could overflow a date and for shared-string indices whose
+    text is a code. Only the <c> elements holding a match are parsed, with
+    lxml, and decoded the way openpyxl's reader would; as there, a cell
+    with a formula reads as the formula.
+    
+    Args:
+        path: Path to the .xlsx file
+        
+    Returns:
+        list: check_errors' error records in sheet and cell order, or None
+        if the scan needs openpyxl: lxml is missing, the package can't be
+        read, a sheet isn't a worksheet, or its XML uses character
+        references, inline rich text or prefixed tags, which a byte
+        search could miss
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        return None
+    from zipfile import ZipFile, BadZipFile
+    from openpyxl.styles.stylesheet import Stylesheet
+    from openpyxl.utils.cell import coordinate_to_tuple
+    from openpyxl.utils.datetime import from_excel, WINDOWS_EPOCH, CALENDAR_MAC_1904
+    from openpyxl.worksheet._reader import _cast_number
+    from openpyxl.xml.constants import ARC_STYLE
+    from openpyxl.xml.functions import fromstring
+    
+    parser = etree.XMLParser(resolve_entities=False)
+    f_tag, v_tag, t_tag = f"{_MAIN_NS}f", f"{_MAIN_NS}v", f"{_MAIN_NS}t"
+    r_t_path = f"{_MAIN_NS}r/{_MAIN_NS}t"
+    codes = [code.encode() for code in _ERROR_CODES]
+    
+    def text_content(node):
+        # openpyxl's Text.content: the plain text, then each run's text
+        return "".join([t.text or "" for t in node.iterfind(t_tag)]
+                       + [t.text or "" for t in node.iterfind(r_t_path)])
+    
+    def needs_parse(data, start=0, end=None):
+        # Text a byte search for the codes could miss
+        return (any(code in data for code in codes) or data.find(b"&#", start, end) >= 0
+                or data.find(b"<r>", start, end) >= 0 or data.find(b"<r ", start, end) >= 0
+                or data.find(b"x005F_", start, end) >= 0)
+    
+    errors = []
+    try:
+        with ZipFile(path) as zf:
+            wb_part = next(target for rel_type, target, _ in
+                           _read_rels(zf, "", etree, parser).values()
+                           if rel_type.endswith("/officeDocument"))
+            wb_root = etree.fromstring(zf.read(wb_part), parser)
+            wb_rels = _read_rels(zf, wb_part, etree, parser)
+            
+            # Styles as openpyxl applies them, for the date-formatted cells
+            date_styles = timedelta_styles = frozenset()
+            if ARC_STYLE in zf.NameToInfo:
+                stylesheet = Stylesheet.from_tree(fromstring(zf.read(ARC_STYLE)))
+                if stylesheet.cell_styles:
+                    date_styles = stylesheet.date_formats
+                    timedelta_styles = stylesheet.timedelta_formats
+            epoch = WINDOWS_EPOCH
+            wb_pr = wb_root.find(f"{_MAIN_NS}workbookPr")
+            if wb_pr is not None and wb_pr.get("date1904", "0").lower() not in ("0", "false", "f"):
+                epoch = CALENDAR_MAC_1904
+            
+            # Shared strings that read as an error code, by index; the
+            # table is only parsed if one of them might
+            error_strings = {}
+            for rel_type, target, _ in wb_rels.values():
+                if rel_type.endswith("/sharedStrings"):
+                    data = zf.read(target)
+                    if needs_parse(data):
+                        for idx, si in enumerate(etree.fromstring(data, parser)):
+                            text = text_content(si).replace('x005F_', '')
+                            if text in _ERROR_CODES:
+                                error_strings[idx] = text
+            
+            for sheet in wb_root.iterfind(f"{_MAIN_NS}sheets/{_MAIN_NS}sheet"):
+                sheet_name = sheet.get("name")
+                rel_type, part, _ = wb_rels[sheet.get(f"{_DOC_REL_NS}id")]
+                if not rel_type.endswith("/worksheet"):
+                    return None
+                
+                data = zf.read(part)
+                start = data.find(b"<sheetData")
+                if start < 0:
+                    return None
+                end = data.find(b"</sheetData>", start)
+                if end < 0:
+                    # <sheetData/>: no cells
+                    continue
+                if (data.find(b"&#", start, end) >= 0 or data.find(b"<r>", start, end) >= 0
+                        or data.find(b"<r ", start, end) >= 0):
+                    return None
+                
+                # Offsets of matches; each lies inside the <c> holding it
+                found = []
+                for code in codes:
+                    pos = data.find(code, start, end)
+                    while pos >= 0:
+                        found.append(pos)
+                        pos = data.find(code, pos + 1, end)
+                if date_styles:
+                    found.extend(match.start() for match in
+                                 _DATE_OVERFLOW_RE.finditer(data, start, end))
+                if error_strings:
+                    found.extend(match.start() for match in
+                                 _CELL_VALUE_INT_RE.finditer(data, start, end)
+                                 if int(match[1]) in error_strings)
+                
+                cells = {}
+                for pos in found:
+                    cell_start = data.rfind(b"<c ", start, pos)
+                    if cell_start < 0 or cell_start in cells:
+                        continue
+                    cell_end = data.find(b"</c>", pos, end)
+                    if cell_end < 0:
+                        return None
+                    cells[cell_start] = data[cell_start:cell_end + 4]
+                
+                for cell_start in sorted(cells):
+                    fragment = etree.fromstring(b'<sheetData xmlns="' + _MAIN_NS[1:-1].encode()
+                                                + b'">' + cells[cell_start] + b'</sheetData>',
+                                                parser)
+                    if len(fragment) != 1:
+                        # A <c> with no attributes: the search took in its neighbour
+                        return None
+                    c = fragment[0]
+                    data_type = c.get("t", "n")
+                    value = None
+                    if c.find(f_tag) is not None:
+                        pass
+                    elif data_type == "n":
+                        style_id = c.get("s")
+                        number = c.findtext(v_tag)
+                        if style_id and int(style_id) in date_styles and number:
+                            number = _cast_number(number)
+                            try:
+                                from_excel(number, epoch,
+                                           timedelta=int(style_id) in timedelta_styles)
+                            except (OverflowError, ValueError):
+                                value = "#VALUE!"
+                    elif data_type == "e" or data_type == "str":
+                        value = c.findtext(v_tag)
+                    elif data_type == "s":
+                        idx = c.findtext(v_tag)
+                        if idx:
+                            value = error_strings.get(int(idx))
+                    elif data_type == "inlineStr":
+                        inline = c.find(f"{_MAIN_NS}is")
+                        if inline is not None:
+                            value = text_content(inline)
+                    
+                    if value is not None and value in _ERROR_CODES:
+                        row_idx, col_idx = coordinate_to_tuple(c.get("r"))
+                        errors.append({
+                            "sheet": sheet_name,
+                            "cell": f"{get_column_letter(col_idx)}{row_idx}",
+                            "error": value
+                        })
+    except (OSError, BadZipFile, KeyError, StopIteration, TypeError,
+            etree.XMLSyntaxError):
+        return None
+    
+    return errors
+
+
+def check_errors(path, num_workers=None):
     """
     Scan for Excel error codes and report them
     
     Args:
         path: Path to the .xlsx file
+        num_workers: Processes for scanning a workbook with several large
+                     sheets (default: min(CPUs, 4))
         
     Returns:
         dict: List of errors found with cell coordinates and error types
     """
-    wb = load_workbook_safe(path)
+    # Saved edits are always on disk, so the daemon can search the file too
+    _check_workbook_path(path)
+    errors = _scan_errors_xml(path)
+    if errors is not None:
+        return {
+            "errors_found": len(errors),
+            "errors": errors
+        }
     
-    # Common Excel error codes
-    error_codes = ['#REF!', '#DIV/0!', '#NAME?', '#VALUE!', '#N/A', '#NULL!', '#NUM!']
+    wb = load_workbook_safe(path, read_only=True)
     
     errors = []
     
-    for sheet_name in wb.sheetnames:
-        sheet = wb[sheet_name]
+    try:
+        sheetnames = wb.sheetnames
         
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value in error_codes:
-                    errors.append({
-                        "sheet": sheet_name,
-                        "cell": cell.coordinate,
-                        "error": cell.value,
-                        "formula": cell.value if isinstance(cell.value, str) and cell.value.startswith('=') else None
-                    })
+        # Read-only sheets are parsed lazily, so each worker opens the file
+        # and parses only its own sheet. The daemon's workbook is already
+        # loaded and is scanned in place.
+        num_workers = min(num_workers or _default_workers(), len(sheetnames))
+        if (_WB_CACHE is None and num_workers > 1
+                and _sheet_xml_size(path) >= _MIN_PARALLEL_SHEET_BYTES):
+            from concurrent.futures import ProcessPoolExecutor
+            from itertools import repeat
+            
+            with ProcessPoolExecutor(num_workers) as pool:
+                for sheet_errors in pool.map(_scan_sheet_errors_worker,
+                                             repeat(str(path)), sheetnames):
+                    errors.extend(sheet_errors)
+        else:
+            for sheet_name in sheetnames:
+                errors.extend(_scan_sheet_errors(wb[sheet_name], sheet_name))
+    finally:
+        wb.close()
     
     return {
         "errors_found": len(errors),
@@ -366,6 +1368,163 @@ def check_errors(path):
     }
 
 
+def scan_workbook(path):
+    """
+    Read values, formulas and error codes from every sheet in one pass
+    
+    Gives what read (over each whole sheet) and check_errors would, from a
+    single load and a single walk of each sheet's cells.
+    
+    Args:
+        path: Path to the .xlsx file
+        
+    Returns:
+        dict: Per sheet name, its "values" (cell and value, formulas as
+              their text as read gives them), "formulas" (cell and formula)
+              and "errors" (cell and error code)
+    """
+    wb = load_workbook_safe(path, read_only=True)
+    
+    sheets = {}
+    
+    try:
+        letters = _COLUMN_LETTERS
+        for sheet_name in wb.sheetnames:
+            values, formulas, errors = [], [], []
+            for row_idx, row in _iter_value_rows(wb[sheet_name]):
+                if len(letters) <= len(row):
+                    _grow_column_letters(len(row) + 1)
+                row_str = str(row_idx)
+                for col_idx, value in enumerate(row, 1):
+                    if value is None:
+                        continue
+                    cell = letters[col_idx] + row_str
+                    values.append({"cell": cell, "value": value})
+                    if value.__class__ is str:
+                        if value[:1] == '=':
+                            formulas.append({"cell": cell, "formula": value})
+                        elif value in _ERROR_CODES:
+                            errors.append({"cell": cell, "error": value})
+            sheets[sheet_name] = {
+                "values": values,
+                "formulas": formulas,
+                "errors": errors
+            }
+    finally:
+        wb.close()
+    
+    return {"sheets": sheets}
+
+
+def _json_default(obj):
+    """
+    Encode cell values the json module can't: dates and times as ISO 8601,
+    anything else (e.g. durations) as its str()
+    """
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _loads(text):
+    """Parse JSON text, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(obj, indent=True):
+    """
+    Serialize a result to JSON bytes ending in a newline
+    
+    orjson and the stdlib give the same values; orjson spells some floats
+    differently (1e20 for 1e+20) and writes NaN as null.
+    
+    Args:
+        obj: Result dict to serialize
+        indent: Indent by two spaces; False gives one compact line
+    
+    Returns:
+        UTF-8 bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option)
+        except TypeError:
+            pass  # e.g. an integer beyond 64 bits; use the stdlib encoder
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False,
+                          default=_json_default)
+    return (text + '\n').encode('utf-8')
+
+
+def _emit(obj):
+    """Write a result to stdout as indented JSON"""
+    sys.stdout.buffer.write(_dumps(obj))
+
+
+def _emit_stream(items, key):
+    """
+    Write an iter_* generator's result to stdout as its items arrive
+    
+    The bytes match _emit() of the dict _collect() would build, but only
+    one item is held at a time and output starts with the first item.
+    Because output can't be taken back once written, values json can't
+    encode are written via _json_default.
+    
+    Args:
+        items: Iterator yielding ("header", dict) first, then (kind, item);
+               items are flat dicts or tuples of JSON scalars (e.g. cell
+               records or rows)
+        key: Name of the list the items form; written after the header fields
+    """
+    out = sys.stdout.buffer
+    _, header = next(items)
+    header[key] = []
+    # Indented header with an empty list; the items go between its brackets
+    head = _dumps(header)
+    # Without orjson, single values go through the C encoders; indent=2
+    # would switch json to its pure-Python encoder for every item
+    from json.encoder import encode_basestring as encode_str
+    encode = json.JSONEncoder(ensure_ascii=False, default=_json_default).encode
+    # Indented '"name": ' prefixes, nested two levels deep, by field name
+    prefixes = {}
+    
+    sep = head[:head.rindex(b"[]") + 1]
+    for _, item in items:
+        if orjson is not None:
+            try:
+                # Nest the item's own indented JSON two levels deep
+                text = orjson.dumps(item, default=_json_default, option=orjson.OPT_INDENT_2)
+                out.write(sep + b"\n    " + text.replace(b"\n", b"\n    "))
+                sep = b","
+                continue
+            except TypeError:
+                pass
+        if item.__class__ is tuple:
+            fields = ["\n      " + (encode_str(value) if value.__class__ is str else encode(value))
+                      for value in item]
+            out.write(sep + ("\n    [" + ",".join(fields) + "\n    ]").encode('utf-8'))
+            sep = b","
+            continue
+        fields = []
+        for name, value in item.items():
+            prefix = prefixes.get(name)
+            if prefix is None:
+                prefix = prefixes[name] = "\n      " + encode(name) + ": "
+            fields.append(prefix + (encode_str(value) if value.__class__ is str else encode(value)))
+        out.write(sep + ("\n    {" + ",".join(fields) + "\n    }").encode('utf-8'))
+        sep = b","
+    
+    out.write(head if sep != b"," else b"\n  ]\n}\n")
+    out.flush()
+
+
 def create_workbook(path, sheet_name="Sheet1"):
     """
     Create a new Excel workbook with an optional sheet name
@@ -394,6 +1553,190 @@ def create_workbook(path, sheet_name="Sheet1"):
         raise Exception(f"Error creating workbook: {e}") from e
 
 
+def _run_command(args):
+    """
+    Dispatch parsed CLI arguments to the matching engine function
+    
+    Args:
+        args: argparse Namespace with a `command` attribute
+        
+    Returns:
+        dict: Command result, or None for an unknown command
+    """
+    if args.command == 'read':
+        return read_sheet(args.path, args.sheet, args.range, args.legacy_schema)
+        
+    elif args.command == 'create':
+        return create_workbook(args.path, args.sheet)
+        
+    elif args.command == 'edit':
+        updates = _loads(args.updates)
+        return edit_sheet(args.path, args.sheet, updates)
+        
+    elif args.command == 'check_errors':
+        return check_errors(args.path, args.workers)
+        
+    elif args.command == 'recalculate':
+        return recalculate_workbook(args.path, args.force)
+        
+    elif args.command == 'scan':
+        return scan_workbook(args.path)
+    
+    return None
+
+
+def _default_socket_path():
+    """The daemon's socket under $XDG_RUNTIME_DIR, or None if that isn't set"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime_dir:
+        return None
+    return os.path.join(runtime_dir, 'xlsx_engine.sock')
+
+
+def _request_argv(request):
+    """Turn a daemon request like {"command": "read", "path": ...} into CLI arguments"""
+    argv = [request["command"]]
+    for key, value in request.items():
+        if key == "command" or value is None or value is False:
+            continue
+        # Namespace fields use '_' where their flags have '-'
+        flag = "--" + key.replace("_", "-")
+        if value is True:
+            argv.append(flag)
+            continue
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value)
+        # --key=value keeps values that start with '-' from reading as flags
+        argv.append(f"{flag}={value}")
+    return argv
+
+
+def _serve_request(parser, line):
+    """
+    Run one JSON request line for daemon mode
+    
+    Args:
+        parser: The CLI ArgumentParser, used to validate requests
+        line: JSON request text
+        
+    Returns:
+        dict: Command result, or an error result
+    """
+    try:
+        request = _loads(line)
+        command = request.get("command")
+        if not command or command == "daemon":
+            raise ValueError(f"Invalid command: {command}")
+        try:
+            args = parser.parse_args(_request_argv(request))
+        except SystemExit:
+            raise ValueError(f"Invalid request: {line.strip()}")
+        return _run_command(args)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "type": type(e).__name__
+        }
+
+
+def daemon(parser, socket_path):
+    """
+    Answer JSON commands on a Unix socket, keeping workbooks loaded
+    
+    Requests use the CLI command and flag names, e.g.
+    {"command": "read", "path": "book.xlsx", "sheet": "Data"}, one per line,
+    and get one JSON result line back. Each workbook is loaded once and
+    reused until its file changes on disk; edits are saved before their
+    result is sent, as a one-shot CLI call would. Requests are handled one
+    at a time.
+    
+    Args:
+        parser: The CLI ArgumentParser, used to validate requests
+        socket_path: Path of the Unix socket to listen on
+    """
+    import signal
+    import socket
+    
+    global _WB_CACHE, _MODEL_CACHE
+    _WB_CACHE = {}
+    _MODEL_CACHE = {}
+    
+    # Replace a socket left behind by a daemon that died, not a live one
+    if os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        finally:
+            probe.close()
+    
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+    
+    # Stop on SIGTERM as on Ctrl-C, removing the socket on the way out
+    signal.signal(signal.SIGTERM, stop)
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen()
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile('rwb') as stream:
+                for line in stream:
+                    if not line.strip():
+                        continue
+                    result = _serve_request(parser, line.decode('utf-8'))
+                    if result.get("status") == "error":
+                        # A failed edit may have changed a loaded workbook
+                        # partway without saving it; reload on next use
+                        _WB_CACHE.clear()
+                        _MODEL_CACHE.clear()
+                    stream.write(_dumps(result, indent=False))
+                    stream.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _daemon_request(socket_path, args):
+    """
+    Send a parsed CLI command to a running daemon
+    
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        args: argparse Namespace of the command
+        
+    Returns:
+        dict: The daemon's result, or None if no daemon is listening
+    """
+    import socket
+    
+    # The daemon has its own working directory
+    request = dict(vars(args))
+    request['path'] = os.path.abspath(request['path'])
+    
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        with client.makefile('rwb') as stream:
+            stream.write(json.dumps(request).encode('utf-8') + b"\n")
+            stream.flush()
+            return _loads(stream.readline())
+    finally:
+        client.close()
+
+
 def main():
     """CLI interface for xlsx_engine"""
     parser = argparse.ArgumentParser(description='Excel file manipulation engine')
@@ -404,6 +1747,8 @@ def main():
     read_parser.add_argument('--path', required=True, help='Path to Excel file')
     read_parser.add_argument('--sheet', default=None, help='Sheet name (default: active sheet)')
     read_parser.add_argument('--range', default=None, help='Cell range to read (e.g., "A1:B10", "A1", "C:C", "3:5")')
+    read_parser.add_argument('--legacy-schema', action='store_true',
+                             help='Return a "cells" list of objects instead of "schema" and "rows"')
     
     # Create command
     create_parser = subparsers.add_parser('create', help='Create new workbook')
@@ -419,38 +1764,54 @@ def main():
     # Check errors command
     errors_parser = subparsers.add_parser('check_errors', help='Check for errors')
     errors_parser.add_argument('--path', required=True, help='Path to Excel file')
+    errors_parser.add_argument('--workers', type=int, default=None, help='Processes for scanning large multi-sheet workbooks (default: min(CPUs, 4))')
     
     # Recalculate command
     recalc_parser = subparsers.add_parser('recalculate', help='Recalculate formulas')
     recalc_parser.add_argument('--path', required=True, help='Path to Excel file')
+    recalc_parser.add_argument('--force', action='store_true',
+                               help='Recalculate even if the results cached in the file are current')
+    
+    # Scan command
+    scan_parser = subparsers.add_parser('scan', help='Read values, formulas and errors of every sheet in one pass')
+    scan_parser.add_argument('--path', required=True, help='Path to Excel file')
+    
+    # Daemon command
+    daemon_parser = subparsers.add_parser('daemon', help='Serve commands on a Unix socket, keeping workbooks loaded')
+    daemon_parser.add_argument('--socket', default=None,
+                               help='Path of the Unix socket to listen on (default: $XDG_RUNTIME_DIR/xlsx_engine.sock)')
     
     args = parser.parse_args()
     
     try:
+        if args.command == 'daemon':
+            socket_path = args.socket or _default_socket_path()
+            if not socket_path:
+                raise ValueError("No socket path: pass --socket or set XDG_RUNTIME_DIR")
+            daemon(parser, socket_path)
+            return
+        
+        # Forward to a daemon if one is listening
+        socket_path = os.environ.get('XLSX_ENGINE_SOCKET') or _default_socket_path()
+        if socket_path and args.command:
+            result = _daemon_request(socket_path, args)
+            if result is not None:
+                _emit(result)
+                if result.get("status") == "error":
+                    sys.exit(1)
+                return
+        
+        # Large results are written as they are produced, not built up first
         if args.command == 'read':
-            result = read_sheet(args.path, args.sheet, args.range)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'create':
-            result = create_workbook(args.path, args.sheet)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'edit':
-            updates = json.loads(args.updates)
-            result = edit_sheet(args.path, args.sheet, updates)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'check_errors':
-            result = check_errors(args.path)
-            print(json.dumps(result, indent=2))
-            
-        elif args.command == 'recalculate':
-            result = recalculate_workbook(args.path)
-            print(json.dumps(result, indent=2))
-            
-        else:
+            _emit_stream(iter_read_sheet(args.path, args.sheet, args.range, args.legacy_schema),
+                         "cells" if args.legacy_schema else "rows")
+            return
+        
+        result = _run_command(args)
+        if result is None:
             parser.print_help()
             sys.exit(1)
+        _emit(result)
             
     except Exception as e:
         error_result = {
@@ -458,7 +1819,7 @@ def main():
             "message": str(e),
             "type": type(e).__name__
         }
-        print(json.dumps(error_result, indent=2))
+        _emit(error_result)
         sys.exit(1)
 
 